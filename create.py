@@ -40,6 +40,10 @@ HOST = os.environ.get('EXAMPLE_HOST', None)
 PORT = os.environ.get('EXAMPLE_PORT', None)
 USER = os.environ.get('EXAMPLE_USER', None)
 PASSWORD = os.environ.get('EXAMPLE_PASSWORD', None)
+TEST_NAME = os.environ.get(
+    'EXAMPLE_TEST_NAME',
+    os.path.join(BASE_DIR, 'test_db.sqlite3') if ENGINE == 'sqlite3' else None,
+)
 
 
 def get_database_conf():
@@ -56,6 +60,10 @@ def get_database_conf():
         conf['USER'] = USER
     if PASSWORD:
         conf['PASSWORD'] = PASSWORD
+    if TEST_NAME:
+        # a file rather than the memory for SQLite, so the concurrent tests
+        # run on a real journal
+        conf['TEST'] = {'NAME': TEST_NAME}
 
     return conf
 
@@ -64,6 +72,14 @@ DATABASES = {
     'default': get_database_conf()
 }
 
+# The tests app has no migrations and refers to the sample app, so in the tests
+# the tables of both get created together, as the databases checking the
+# foreign keys right away need
+if 'test' in sys.argv:
+    MIGRATION_MODULES = {
+        'sample': None,
+    }
+
 
 # Read logging configuration from environment variables
 LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
@@ -0,0 +1,221 @@
+"""
+Django settings for project project.
+
+Generated by 'django-admin startproject' using Django 3.1.14.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/3.1/topics/settings/
+
+For the full list of settings and their values, see
+https://docs.djangoproject.com/en/3.1/ref/settings/
+"""
+
+from pathlib import Path
+
+# Build paths inside the project like this: BASE_DIR / 'subdir'.
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+# Quick-start development settings - unsuitable for production
+# See https://docs.djangoproject.com/en/3.1/howto/deployment/checklist/
+
+# SECURITY WARNING: keep the secret key used in production secret!
+SECRET_KEY = 'g=hw!%#2u%=@r680_a^5cs!2vlnv4s%zj&p6z3t0n9v)s7#j^_'
+
+# SECURITY WARNING: don't run with debug turned on in production!
+DEBUG = True
+
+ALLOWED_HOSTS = []
+
+
+# Application definition
+
+INSTALLED_APPS = [
+    'django.contrib.admin',
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'django.contrib.sessions',
+    'django.contrib.messages',
+    'django.contrib.staticfiles',
+]
+
+MIDDLEWARE = [
+    'django.middleware.security.SecurityMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+
+ROOT_URLCONF = 'project.urls'
+
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'DIRS': [],
+        'APP_DIRS': True,
+        'OPTIONS': {
+            'context_processors': [
+                'django.template.context_processors.debug',
+                'django.template.context_processors.request',
+                'django.contrib.auth.context_processors.auth',
+                'django.contrib.messages.context_processors.messages',
+            ],
+        },
+    },
+]
+
+WSGI_APPLICATION = 'project.wsgi.application'
+
+
+# Database
+# https://docs.djangoproject.com/en/3.1/ref/settings/#databases
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'db.sqlite3',
+    }
+}
+
+
+# Password validation
+# https://docs.djangoproject.com/en/3.1/ref/settings/#auth-password-validators
+
+AUTH_PASSWORD_VALIDATORS = [
+    {
+        'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator',
+    },
+]
+
+
+# Internationalization
+# https://docs.djangoproject.com/en/3.1/topics/i18n/
+
+LANGUAGE_CODE = 'en-us'
+
+TIME_ZONE = 'UTC'
+
+USE_I18N = True
+
+USE_L10N = True
+
+USE_TZ = True
+
+
+# Static files (CSS, JavaScript, Images)
+# https://docs.djangoproject.com/en/3.1/howto/static-files/
+
+STATIC_URL = '/static/'
+
+
+# Set the root directory of the repo as the search path
+import os
+import sys
+sys.path.insert(0, os.path.dirname(BASE_DIR))
+
+
+# Install translations app, and sample app to test it
+INSTALLED_APPS += [
+    'translations.apps.TranslationsConfig',
+    'sample.apps.SampleConfig',
+    'tests.apps.TestsConfig',
+    'rest_framework',
+]
+
+MIDDLEWARE += [
+    'django.middleware.locale.LocaleMiddleware',
+]
+
+LANGUAGES = (
+    ('en', 'English'),
+    ('en-gb', 'English (Great Britain)'),
+    ('de', 'German'),
+    ('tr', 'Turkish'),
+)
+
+
+# Read DB configuration from environment variables
+DEFAULT_ENGINE = 'sqlite3'
+DEFAULT_NAME = os.path.join(BASE_DIR, 'db.sqlite3')
+
+ENGINE = os.environ.get('EXAMPLE_ENGINE', DEFAULT_ENGINE)
+NAME = os.environ.get('EXAMPLE_NAME', DEFAULT_NAME)
+HOST = os.environ.get('EXAMPLE_HOST', None)
+PORT = os.environ.get('EXAMPLE_PORT', None)
+USER = os.environ.get('EXAMPLE_USER', None)
+PASSWORD = os.environ.get('EXAMPLE_PASSWORD', None)
+TEST_NAME = os.environ.get(
+    'EXAMPLE_TEST_NAME',
+    os.path.join(BASE_DIR, 'test_db.sqlite3') if ENGINE == 'sqlite3' else None,
+)
+
+
+def get_database_conf():
+    conf = {}
+
+    conf['ENGINE'] = 'django.db.backends.{}'.format(ENGINE)
+    conf['NAME'] = NAME
+
+    if HOST:
+        conf['HOST'] = HOST
+    if PORT:
+        conf['PORT'] = PORT
+    if USER:
+        conf['USER'] = USER
+    if PASSWORD:
+        conf['PASSWORD'] = PASSWORD
+    if TEST_NAME:
+        # a file rather than the memory for SQLite, so the concurrent tests
+        # run on a real journal
+        conf['TEST'] = {'NAME': TEST_NAME}
+
+    return conf
+
+
+DATABASES = {
+    'default': get_database_conf()
+}
+
+# The tests app has no migrations and refers to the sample app, so in the tests
+# the tables of both get created together, as the databases checking the
+# foreign keys right away need
+if 'test' in sys.argv:
+    MIGRATION_MODULES = {
+        'sample': None,
+    }
+
+
+# Read logging configuration from environment variables
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'django': {
+            'handlers': ['console'],
+            'level': LOG_LEVEL,
+        },
+        'django.db': {
+            'handlers': ['console'],
+            'level': LOG_LEVEL,
+        },
+    },
+}
+
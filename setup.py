@@ -21,8 +21,6 @@ setuptools.setup(
     classifiers=[
         'Development Status :: ' + info['release']['classifier'],
         'Framework :: Django',
-        'Framework :: Django :: 2.0',
-        'Framework :: Django :: 2.1',
         'Framework :: Django :: 2.2',
         'Framework :: Django :: 3.0',
         'Framework :: Django :: 3.1',
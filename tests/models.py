@@ -0,0 +1,93 @@
+from django.db import models
+
+from translations.models import Translatable
+from translations.storages import JSONStorage, ModelTableStorage, \
+    InternedTableStorage, CompressedTableStorage
+
+from sample.models import City
+
+
+if hasattr(models, 'JSONField'):
+    class Landmark(Translatable):
+        name = models.CharField(max_length=64)
+        description = models.TextField(blank=True)
+        city = models.ForeignKey(
+            to=City,
+            on_delete=models.CASCADE,
+            related_name='landmarks',
+        )
+        i18n = models.JSONField(default=dict, blank=True)
+
+        def __str__(self):
+            return self.name
+
+        class TranslatableMeta:
+            fields = ['name', 'description']
+            storage = JSONStorage('i18n')
+
+
+class Street(Translatable):
+    name = models.CharField(max_length=64)
+    city = models.ForeignKey(
+        to=City,
+        on_delete=models.CASCADE,
+        related_name='streets',
+    )
+
+    def __str__(self):
+        return self.name
+
+    class TranslatableMeta:
+        fields = ['name']
+        storage = ModelTableStorage()
+
+
+class District(Translatable):
+    name = models.CharField(max_length=64)
+    description = models.TextField(blank=True)
+    city = models.ForeignKey(
+        to=City,
+        on_delete=models.CASCADE,
+        related_name='districts',
+    )
+
+    def __str__(self):
+        return self.name
+
+    class TranslatableMeta:
+        fields = ['name', 'description']
+        materialized_languages = ['de']
+
+
+class Park(Translatable):
+    name = models.CharField(max_length=64)
+    description = models.TextField(blank=True)
+    city = models.ForeignKey(
+        to=City,
+        on_delete=models.CASCADE,
+        related_name='parks',
+    )
+
+    def __str__(self):
+        return self.name
+
+    class TranslatableMeta:
+        fields = ['name', 'description']
+        storage = InternedTableStorage()
+
+
+class Monument(Translatable):
+    name = models.CharField(max_length=64)
+    description = models.TextField(blank=True)
+    city = models.ForeignKey(
+        to=City,
+        on_delete=models.CASCADE,
+        related_name='monuments',
+    )
+
+    def __str__(self):
+        return self.name
+
+    class TranslatableMeta:
+        fields = ['name', 'description']
+        storage = CompressedTableStorage(threshold=64)
@@ -0,0 +1,94 @@
+from unittest import mock
+
+from django.test import TransactionTestCase, override_settings
+from django.apps import apps
+from django.core.cache import caches
+
+from translations.context import Context
+from translations import cache as translations_cache
+
+from sample.models import Continent
+from sample.utils import create_samples
+
+
+@override_settings(
+    CACHES={
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        },
+    },
+    TRANSLATIONS_CACHE=True,
+    TRANSLATIONS_VERSION_CHECK_INTERVAL=None,
+    TRANSLATIONS_WARMUP={'sample.Continent': ['de']},
+)
+class TranslationsConfigTest(TransactionTestCase):
+    """Tests for `TranslationsConfig`."""
+
+    def setUp(self):
+        caches['default'].clear()
+        # the versions get checked by the first read of each test only
+        translations_cache._translation_versions_checked = None
+        self.config = apps.get_app_config('translations')
+
+    def test_warm_up(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de'],
+        )
+
+        self.assertEqual(self.config.warm_up(), 4)
+
+        continents = list(Continent.objects.order_by('code'))
+        with self.assertNumQueries(0):
+            with Context(continents) as context:
+                context.read('de')
+
+        self.assertEqual(continents[0].name, 'Asien')
+        self.assertEqual(continents[1].name, 'Europa')
+
+    @override_settings(TRANSLATIONS_WARMUP={'sample.Unknown': None})
+    def test_warm_up_error(self):
+        with self.assertLogs('translations.apps', 'ERROR') as logs:
+            self.assertEqual(self.config.warm_up(), 0)
+
+        self.assertIn(
+            'Failed to warm up the translations caches.',
+            logs.output[0]
+        )
+
+    @override_settings(TRANSLATIONS_WARMUP_ON_STARTUP=True)
+    def test_ready_on_startup(self):
+        with mock.patch('sys.argv', ['gunicorn', 'project.wsgi']):
+            with mock.patch('threading.Thread') as thread:
+                self.config.ready()
+
+        thread.assert_called_once_with(
+            target=self.config.warm_up,
+            name='translations-warmup',
+            daemon=True,
+        )
+        thread.return_value.start.assert_called_once_with()
+
+    @override_settings(TRANSLATIONS_WARMUP_ON_STARTUP=True)
+    def test_ready_runserver(self):
+        with mock.patch('sys.argv', ['manage.py', 'runserver']):
+            with mock.patch('threading.Thread') as thread:
+                self.config.ready()
+
+        thread.return_value.start.assert_called_once_with()
+
+    @override_settings(TRANSLATIONS_WARMUP_ON_STARTUP=True)
+    def test_ready_management_command(self):
+        with mock.patch('sys.argv', ['manage.py', 'migrate']):
+            with mock.patch('threading.Thread') as thread:
+                self.config.ready()
+
+        thread.assert_not_called()
+
+    def test_ready_disabled(self):
+        with mock.patch('sys.argv', ['gunicorn', 'project.wsgi']):
+            with mock.patch('threading.Thread') as thread:
+                self.config.ready()
+
+        thread.assert_not_called()
@@ -0,0 +1,338 @@
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.db import transaction
+
+from translations.buffers import TranslationBuffer
+from translations.context import Context
+from translations.models import Translation
+
+from sample.models import Continent, City
+from sample.utils import create_samples
+
+from tests.models import District
+
+
+def _get_texts(objs, lang):
+    texts = []
+    for obj in objs:
+        with Context(obj) as context:
+            context.read(lang)
+        texts.append((obj.name, obj.denonym))
+    return texts
+
+
+class TranslationBufferTest(TestCase):
+    """Tests for `TranslationBuffer`."""
+
+    def create_continents(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name'],
+            langs=['de'],
+        )
+        return list(Continent.objects.order_by('code'))
+
+    def test_write(self):
+        asia, europe = self.create_continents()
+        buffer = TranslationBuffer()
+
+        with self.assertNumQueries(0):
+            buffer.write(europe, 'name', 'Europa (neu)', 'de')
+            buffer.write(europe, 'denonym', 'Europäisch', 'de')
+            buffer.write(asia, 'denonym', 'Asiatisch', 'de')
+
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(Translation.objects.count(), 2)
+
+        buffer.flush()
+
+        self.assertEqual(len(buffer), 0)
+        self.assertListEqual(
+            _get_texts(Continent.objects.order_by('code'), 'de'),
+            [('Asien', 'Asiatisch'), ('Europa (neu)', 'Europäisch')]
+        )
+        self.assertQuerysetEqual(Translation.objects.stale(), [])
+
+    def test_write_queries(self):
+        asia, europe = self.create_continents()
+        buffer = TranslationBuffer()
+        for i in range(10):
+            buffer.write(europe, 'name', 'Europa {}'.format(i), 'de')
+            buffer.write(asia, 'name', 'Asien {}'.format(i), 'de')
+
+        # savepoint, delete the old rows, create the new ones, bump
+        # the versions, release
+        with self.assertNumQueries(5):
+            buffer.flush()
+
+        self.assertListEqual(
+            _get_texts(Continent.objects.order_by('code'), 'de'),
+            [('Asien 9', 'Asian'), ('Europa 9', 'European')]
+        )
+
+    @override_settings(TRANSLATIONS_BATCH_SIZE=1)
+    def test_write_batch_size(self):
+        asia, europe = self.create_continents()
+        buffer = TranslationBuffer()
+        buffer.write(europe, 'name', 'Europa (neu)', 'de')
+        buffer.write(asia, 'name', 'Asien (neu)', 'de')
+
+        # savepoint, delete, create and bump the versions for each of
+        # the writes, release
+        with self.assertNumQueries(8):
+            buffer.flush()
+
+        self.assertListEqual(
+            _get_texts(Continent.objects.order_by('code'), 'de'),
+            [('Asien (neu)', 'Asian'), ('Europa (neu)', 'European')]
+        )
+
+    @override_settings(TRANSLATIONS_BATCH_SIZE=1)
+    def test_delete_batch_size(self):
+        asia, europe = self.create_continents()
+        buffer = TranslationBuffer()
+        buffer.delete(europe, 'de')
+        buffer.delete(asia, 'de')
+
+        # savepoint, delete and bump the versions for each of the objects,
+        # release
+        with self.assertNumQueries(6):
+            buffer.flush()
+
+        self.assertEqual(Translation.objects.count(), 0)
+
+    def test_write_same_as_source(self):
+        asia, europe = self.create_continents()
+        buffer = TranslationBuffer()
+
+        buffer.write(europe, 'name', 'Europa (neu)', 'de')
+        buffer.write(europe, 'name', 'Europe', 'de')
+        buffer.write(asia, 'name', '', 'de')
+        buffer.flush()
+
+        self.assertListEqual(
+            _get_texts(Continent.objects.order_by('code'), 'de'),
+            [('Asien', 'Asian'), ('Europa', 'European')]
+        )
+
+    def test_write_default_language(self):
+        asia, europe = self.create_continents()
+        buffer = TranslationBuffer()
+
+        buffer.write(europe, 'name', 'Old World', 'en')
+
+        self.assertEqual(len(buffer), 0)
+
+    def test_write_invalid_field(self):
+        asia, europe = self.create_continents()
+        buffer = TranslationBuffer()
+
+        with self.assertRaises(ValueError) as error:
+            buffer.write(europe, 'code', 'EU', 'de')
+
+        self.assertEqual(
+            error.exception.args[0],
+            '`code` is not a translatable field of `Continent`.'
+        )
+
+    def test_write_invalid_language(self):
+        asia, europe = self.create_continents()
+        buffer = TranslationBuffer()
+
+        with self.assertRaises(ValueError) as error:
+            buffer.write(europe, 'name', 'Europa', 'xx')
+
+        self.assertEqual(
+            error.exception.args[0],
+            '`xx` is not a supported language.'
+        )
+
+    def test_delete(self):
+        asia, europe = self.create_continents()
+        buffer = TranslationBuffer()
+
+        buffer.write(europe, 'name', 'Europa (neu)', 'de')
+        buffer.delete(europe, 'de')
+        buffer.flush()
+
+        self.assertListEqual(
+            _get_texts(Continent.objects.order_by('code'), 'de'),
+            [('Asien', 'Asian'), ('Europe', 'European')]
+        )
+
+    def test_delete_then_write(self):
+        asia, europe = self.create_continents()
+        buffer = TranslationBuffer()
+        buffer.write(europe, 'denonym', 'Europäisch', 'de')
+        buffer.flush()
+
+        buffer.delete(europe, 'de')
+        buffer.write(europe, 'denonym', 'Europäer', 'de')
+        buffer.flush()
+
+        self.assertListEqual(
+            _get_texts(Continent.objects.order_by('code'), 'de'),
+            [('Asien', 'Asian'), ('Europe', 'Europäer')]
+        )
+
+    def test_languages(self):
+        asia, europe = self.create_continents()
+        buffer = TranslationBuffer()
+
+        buffer.write(europe, 'name', 'Avrupa', 'tr')
+        buffer.delete(asia, 'de')
+        buffer.flush()
+
+        self.assertListEqual(
+            _get_texts(Continent.objects.order_by('code'), 'de'),
+            [('Asia', 'Asian'), ('Europa', 'European')]
+        )
+        self.assertListEqual(
+            _get_texts(Continent.objects.order_by('code'), 'tr'),
+            [('Asia', 'Asian'), ('Avrupa', 'European')]
+        )
+
+    def test_max_size(self):
+        asia, europe = self.create_continents()
+        buffer = TranslationBuffer(max_size=2)
+
+        buffer.write(europe, 'denonym', 'Europäisch', 'de')
+        self.assertEqual(len(buffer), 1)
+        buffer.write(asia, 'denonym', 'Asiatisch', 'de')
+
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(Translation.objects.count(), 4)
+
+    @override_settings(TRANSLATIONS_BUFFER_SIZE=1)
+    def test_max_size_setting(self):
+        asia, europe = self.create_continents()
+        buffer = TranslationBuffer()
+
+        buffer.write(europe, 'denonym', 'Europäisch', 'de')
+
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(Translation.objects.count(), 3)
+
+    def test_context_manager(self):
+        asia, europe = self.create_continents()
+
+        with TranslationBuffer() as buffer:
+            buffer.write(europe, 'denonym', 'Europäisch', 'de')
+
+        self.assertEqual(Translation.objects.count(), 3)
+
+    def test_context_manager_error(self):
+        asia, europe = self.create_continents()
+
+        with self.assertRaises(RuntimeError):
+            with TranslationBuffer() as buffer:
+                buffer.write(europe, 'denonym', 'Europäisch', 'de')
+                raise RuntimeError
+
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(Translation.objects.count(), 2)
+
+    def test_materialized(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+        )
+        district = District.objects.create(
+            name='Old Town', city=City.objects.get(),
+        )
+
+        with TranslationBuffer() as buffer:
+            buffer.write(district, 'name', 'Altstadt', 'de')
+
+        self.assertEqual(District.objects.get().name_de, 'Altstadt')
+
+    def test_not_translatable(self):
+        buffer = TranslationBuffer()
+
+        with self.assertRaises(TypeError):
+            buffer.delete(Translation(), 'de')
+
+
+class TranslationBufferCommitTest(TransactionTestCase):
+    """Tests for flushing `TranslationBuffer` on the commits."""
+
+    def test_commit(self):
+        create_samples(continent_names=['europe'])
+        europe = Continent.objects.get()
+        buffer = TranslationBuffer()
+
+        with transaction.atomic():
+            buffer.write(europe, 'name', 'Europa', 'de')
+            buffer.write(europe, 'denonym', 'Europäisch', 'de')
+            self.assertEqual(Translation.objects.count(), 0)
+
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(Translation.objects.count(), 2)
+
+    def test_rollback(self):
+        create_samples(continent_names=['europe'])
+        europe = Continent.objects.get()
+        buffer = TranslationBuffer()
+
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                buffer.write(europe, 'name', 'Europa', 'de')
+                raise RuntimeError
+
+        self.assertEqual(Translation.objects.count(), 0)
+        self.assertEqual(len(buffer), 0)
+
+        with transaction.atomic():
+            buffer.write(europe, 'denonym', 'Europäisch', 'de')
+
+        self.assertEqual(len(buffer), 0)
+        self.assertQuerysetEqual(
+            Translation.objects.values_list('field', 'text'),
+            ["('denonym', 'Europäisch')"]
+        )
+
+    def test_rollback_savepoint(self):
+        create_samples(continent_names=['europe'])
+        europe = Continent.objects.get()
+        buffer = TranslationBuffer()
+
+        with transaction.atomic():
+            buffer.write(europe, 'name', 'Europa', 'de')
+            with self.assertRaises(RuntimeError):
+                with transaction.atomic():
+                    buffer.write(europe, 'name', 'Kontinent', 'de')
+                    buffer.write(europe, 'denonym', 'Europäisch', 'de')
+                    raise RuntimeError
+            self.assertEqual(len(buffer), 1)
+            buffer.write(europe, 'name', 'Europa', 'tr')
+
+        self.assertQuerysetEqual(
+            Translation.objects.order_by('language').values_list(
+                'field', 'language', 'text',
+            ),
+            ["('name', 'de', 'Europa')", "('name', 'tr', 'Europa')"]
+        )
+
+    def test_rollback_flushed(self):
+        create_samples(continent_names=['europe'])
+        europe = Continent.objects.get()
+        buffer = TranslationBuffer(max_size=1)
+
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                buffer.write(europe, 'name', 'Europa', 'de')
+                self.assertEqual(Translation.objects.count(), 1)
+                raise RuntimeError
+
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(Translation.objects.count(), 0)
+
+    def test_autocommit(self):
+        create_samples(continent_names=['europe'])
+        europe = Continent.objects.get()
+        buffer = TranslationBuffer()
+
+        buffer.write(europe, 'name', 'Europa', 'de')
+
+        self.assertEqual(len(buffer), 1)
+        self.assertEqual(Translation.objects.count(), 0)
@@ -0,0 +1,828 @@
+import io
+import shutil
+import tempfile
+
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.core.cache import caches
+from django.db import connection, transaction, close_old_connections
+from django.core.management import call_command
+from django.core.signals import request_started
+from django.contrib.contenttypes.models import ContentType
+
+from translations.context import Context
+from translations import cache as translations_cache
+from translations.cache import _absentees, _Absentees, \
+    _get_warmup_config, _warm_translations
+from translations.models import Translation, TranslationVersion
+
+from sample.models import Continent, Country
+from sample.utils import create_samples
+
+
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'translations': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'translations',
+    },
+}
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHES,
+    TRANSLATIONS_CACHE='translations',
+    TRANSLATIONS_VERSION_CHECK_INTERVAL=None,
+)
+class CacheTest(TransactionTestCase):
+    """Tests for the translations cache."""
+
+    def setUp(self):
+        caches['translations'].clear()
+        # the versions get checked by the first read of each test only
+        translations_cache._translation_versions_checked = None
+
+    def test_read_cold(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = list(Continent.objects.order_by('code'))
+
+        # check the versions, read the texts
+        with self.assertNumQueries(2):
+            with Context(continents) as context:
+                context.read('de')
+
+        self.assertEqual(continents[0].name, 'Asien')
+        self.assertEqual(continents[0].denonym, 'Asiatisch')
+        self.assertEqual(continents[1].name, 'Europa')
+        self.assertEqual(continents[1].denonym, 'Europäisch')
+
+    def test_read_warm(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        with Context(list(Continent.objects.order_by('code'))) as context:
+            context.read('de')
+
+        continents = list(Continent.objects.order_by('code'))
+
+        with self.assertNumQueries(0):
+            with Context(continents) as context:
+                context.read('de')
+
+        self.assertEqual(continents[0].name, 'Asien')
+        self.assertEqual(continents[0].denonym, 'Asiatisch')
+        self.assertEqual(continents[1].name, 'Europa')
+        self.assertEqual(continents[1].denonym, 'Europäisch')
+
+    def test_read_warm_untranslated(self):
+        create_samples(
+            continent_names=['europe'],
+        )
+
+        with Context(list(Continent.objects.order_by('code'))) as context:
+            context.read('de')
+
+        continents = list(Continent.objects.order_by('code'))
+
+        with self.assertNumQueries(0):
+            with Context(continents) as context:
+                context.read('de')
+
+        self.assertEqual(continents[0].name, 'Europe')
+        self.assertEqual(continents[0].denonym, 'European')
+
+    def test_read_partially_warm(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        with Context(Continent.objects.get(code='EU')) as context:
+            context.read('de')
+
+        continents = list(Continent.objects.order_by('code'))
+
+        with self.assertNumQueries(1):
+            with Context(continents) as context:
+                context.read('de')
+
+        self.assertEqual(continents[0].name, 'Asien')
+        self.assertEqual(continents[1].name, 'Europa')
+
+    def test_read_languages_apart(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+            context.read('tr')
+
+        self.assertEqual(europe.name, 'Avrupa')
+        self.assertEqual(europe.denonym, 'Avrupalı')
+
+    def test_context_update_invalidates(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+            europe.name = 'Europa Neu'
+            context.update('de')
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        self.assertEqual(europe.name, 'Europa Neu')
+
+    def test_context_update_invalidates_in_transaction(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        with transaction.atomic():
+            europe = Continent.objects.get(code='EU')
+            with Context(europe) as context:
+                europe.name = 'Europa1'
+                context.update('de')
+                context.read('de')
+            self.assertEqual(europe.name, 'Europa1')
+
+            with Context(europe) as context:
+                europe.name = 'Europa2'
+                context.update('de')
+
+            europe = Continent.objects.get(code='EU')
+            with Context(europe) as context:
+                context.read('de')
+            self.assertEqual(europe.name, 'Europa2')
+
+    def test_context_update_rolled_back(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                europe = Continent.objects.get(code='EU')
+                with Context(europe) as context:
+                    europe.name = 'Europa Neu'
+                    context.update('de')
+                    context.read('de')
+                raise RuntimeError
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        self.assertEqual(europe.name, 'Europa')
+
+    def test_context_update_committed(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        with transaction.atomic():
+            europe = Continent.objects.get(code='EU')
+            with Context(europe) as context:
+                europe.name = 'Europa Neu'
+                context.update('de')
+            # another process caches the committed text meanwhile
+            ct_id = ContentType.objects.get_for_model(Continent).id
+            cache = caches['translations']
+            version = cache.get('translations:version:{}'.format(ct_id))
+            cache.set(
+                'translations:texts:{}:{}:de:EU'.format(ct_id, version),
+                {'name': 'Europa', 'denonym': 'Europäisch'},
+            )
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        self.assertEqual(europe.name, 'Europa Neu')
+
+    def test_context_create_invalidates(self):
+        create_samples(
+            continent_names=['europe'],
+        )
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+            europe.name = 'Europa'
+            context.create('de')
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        self.assertEqual(europe.name, 'Europa')
+
+    def test_context_delete_invalidates(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+            context.delete('de')
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        self.assertEqual(europe.name, 'Europe')
+
+    def test_translation_save_invalidates(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        translation = europe.translations.get(field='name', language='de')
+        translation.text = 'Europa Neu'
+        translation.save()
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        self.assertEqual(europe.name, 'Europa Neu')
+
+    def test_translation_delete_invalidates(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        europe.translations.get(field='name', language='de').delete()
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        self.assertEqual(europe.name, 'Europe')
+        self.assertEqual(europe.denonym, 'Europäisch')
+
+    def test_evicted_version_invalidates(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        continent_ct = ContentType.objects.get_for_model(Continent)
+        caches['translations'].delete(
+            'translations:version:{}'.format(continent_ct.id)
+        )
+        Translation.objects.filter(
+            field='name', language='de'
+        ).update(text='Europa Neu')
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        self.assertEqual(europe.name, 'Europa Neu')
+
+
+class CacheBackendsTest(TransactionTestCase):
+    """Tests for the translations cache on different cache backends."""
+
+    def assertReadCached(self, queries):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        with Context(Continent.objects.get(code='EU')) as context:
+            context.read('de')
+
+        europe = Continent.objects.get(code='EU')
+        with self.assertNumQueries(queries):
+            with Context(europe) as context:
+                context.read('de')
+
+        self.assertEqual(europe.name, 'Europa')
+
+        with Context(europe) as context:
+            europe.name = 'Europa Neu'
+            context.update('de')
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        self.assertEqual(europe.name, 'Europa Neu')
+
+    def test_file_based_cache(self):
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location)
+        file_caches = {
+            'default': {
+                'BACKEND':
+                    'django.core.cache.backends.filebased.FileBasedCache',
+                'LOCATION': location,
+            },
+        }
+
+        with self.settings(CACHES=file_caches, TRANSLATIONS_CACHE=True):
+            self.assertReadCached(queries=0)
+
+    def test_database_cache(self):
+        database_caches = {
+            'default': {
+                'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+                'LOCATION': 'translations_cache',
+            },
+        }
+
+        with self.settings(CACHES=database_caches, TRANSLATIONS_CACHE=True):
+            call_command('createcachetable', verbosity=0)
+            self.addCleanup(
+                connection.cursor().execute,
+                'DROP TABLE translations_cache',
+            )
+            # one query for the versions and one for the texts
+            self.assertReadCached(queries=2)
+
+
+@override_settings(TRANSLATIONS_NEGATIVE_CACHE=True)
+class NegativeCacheTest(TestCase):
+    """Tests for the negative translations cache."""
+
+    def setUp(self):
+        _absentees.clear()
+
+    def test_read_untranslated_once(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['tr']
+        )
+
+        continents = list(Continent.objects.order_by('code'))
+        with Context(continents) as context:
+            context.read('de')
+
+        continents = list(Continent.objects.order_by('code'))
+        with self.assertNumQueries(0):
+            with Context(continents) as context:
+                context.read('de')
+
+        self.assertEqual(continents[0].name, 'Asia')
+        self.assertEqual(continents[1].name, 'Europe')
+
+    def test_read_translated_again(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        with Context(list(Continent.objects.all())) as context:
+            context.read('de')
+
+        continents = list(Continent.objects.order_by('code'))
+        with self.assertNumQueries(1):
+            with Context(continents) as context:
+                context.read('de')
+
+        self.assertEqual(continents[0].name, 'Asien')
+        self.assertEqual(continents[1].name, 'Europa')
+
+    def test_read_partially_translated(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+        Translation.objects.filter(object_id='AS').delete()
+
+        with Context(list(Continent.objects.all())) as context:
+            context.read('de')
+
+        continents = list(Continent.objects.order_by('code'))
+        with self.assertNumQueries(1):
+            with Context(continents) as context:
+                context.read('de')
+
+        self.assertEqual(continents[0].name, 'Asia')
+        self.assertEqual(continents[1].name, 'Europa')
+        self.assertNotIn('EU', _absentees[(
+            ContentType.objects.get_for_model(Continent).id, 'de'
+        )])
+
+    def test_context_create_forgets(self):
+        create_samples(
+            continent_names=['europe'],
+        )
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+            europe.name = 'Europa'
+            context.create('de')
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        self.assertEqual(europe.name, 'Europa')
+
+    def test_context_update_forgets(self):
+        create_samples(
+            continent_names=['europe'],
+        )
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+            europe.name = 'Europa'
+            context.update('de')
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        self.assertEqual(europe.name, 'Europa')
+
+    def test_translation_save_forgets(self):
+        create_samples(
+            continent_names=['europe'],
+        )
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        europe.translations.create(field='name', language='de', text='Europa')
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        self.assertEqual(europe.name, 'Europa')
+
+    def test_other_language_apart(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['tr']
+        )
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+            context.read('tr')
+
+        self.assertEqual(europe.name, 'Avrupa')
+
+
+@override_settings(
+    TRANSLATIONS_NEGATIVE_CACHE=True,
+    TRANSLATIONS_VERSION_CHECK_INTERVAL=0,
+)
+class TranslationVersionTest(TestCase):
+    """Tests for the cross-process invalidation of the translations."""
+
+    def setUp(self):
+        _absentees.clear()
+        translations_cache._translation_versions = {}
+        translations_cache._translation_versions_checked = None
+
+    def _create_translation_elsewhere(self, obj, field, lang, text):
+        """Create a translation the way another process would see it."""
+        content_type = ContentType.objects.get_for_model(type(obj))
+        Translation.objects.bulk_create([
+            Translation(
+                content_type=content_type,
+                object_id=obj.pk,
+                field=field,
+                language=lang,
+                text=text,
+            )
+        ])
+        translations_cache._bump_translation_versions(
+            [content_type.id], [lang],
+        )
+
+    def test_context_write_bumps(self):
+        create_samples(
+            continent_names=['europe'],
+        )
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            europe.name = 'Europa'
+            context.create('de')
+            europe.name = 'Europa Neu'
+            context.update('de')
+
+        version = TranslationVersion.objects.get()
+        self.assertEqual(
+            version.content_type,
+            ContentType.objects.get_for_model(Continent)
+        )
+        self.assertEqual(version.language, 'de')
+        self.assertEqual(version.version, 2)
+
+    @override_settings(TRANSLATIONS_NEGATIVE_CACHE=False)
+    def test_context_write_bumps_without_negative_cache(self):
+        create_samples(
+            continent_names=['europe'],
+        )
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            europe.name = 'Europa'
+            context.create('de')
+            europe.name = 'Europa Neu'
+            context.update('de')
+
+        version = TranslationVersion.objects.get()
+        self.assertEqual(version.language, 'de')
+        self.assertEqual(version.version, 2)
+
+    def test_translation_save_bumps(self):
+        create_samples(
+            continent_names=['europe'],
+        )
+
+        europe = Continent.objects.get(code='EU')
+        europe.translations.create(field='name', language='tr', text='Avrupa')
+
+        version = TranslationVersion.objects.get()
+        self.assertEqual(version.language, 'tr')
+        self.assertEqual(version.version, 1)
+
+    def test_synctranslations_bumps(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name'],
+            langs=['de', 'tr']
+        )
+        continent_versions = TranslationVersion.objects.filter(
+            content_type=ContentType.objects.get_for_model(Continent),
+        )
+        versions = dict(continent_versions.values_list('language', 'version'))
+        Translation.objects.update(field='obsolete')
+
+        call_command('synctranslations', 'sample', interactive=False,
+                     stdout=io.StringIO())
+
+        bumped = dict(continent_versions.values_list('language', 'version'))
+        self.assertListEqual(sorted(bumped), ['de', 'en-gb', 'tr'])
+        for (lang, version) in versions.items():
+            self.assertGreater(bumped[lang], version)
+
+    def test_read_forgets_changed_elsewhere(self):
+        create_samples(
+            continent_names=['europe'],
+        )
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        self._create_translation_elsewhere(europe, 'name', 'de', 'Europa')
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        self.assertEqual(europe.name, 'Europa')
+
+    @override_settings(
+        CACHES=LOCMEM_CACHES,
+        TRANSLATIONS_CACHE='translations',
+        TRANSLATIONS_NEGATIVE_CACHE=False,
+    )
+    def test_cached_read_forgets_changed_elsewhere(self):
+        caches['translations'].clear()
+        create_samples(
+            continent_names=['europe'],
+        )
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        self._create_translation_elsewhere(europe, 'name', 'de', 'Europa')
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        self.assertEqual(europe.name, 'Europa')
+
+    @override_settings(TRANSLATIONS_VERSION_CHECK_INTERVAL=60)
+    def test_read_throttles_checks(self):
+        create_samples(
+            continent_names=['europe'],
+        )
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        self._create_translation_elsewhere(europe, 'name', 'de', 'Europa')
+
+        europe = Continent.objects.get(code='EU')
+        with self.assertNumQueries(0):
+            with Context(europe) as context:
+                context.read('de')
+
+        self.assertEqual(europe.name, 'Europe')
+
+    @override_settings(TRANSLATIONS_VERSION_CHECK_INTERVAL=None)
+    def test_read_checks_once_per_request(self):
+        create_samples(
+            continent_names=['europe'],
+        )
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        self._create_translation_elsewhere(europe, 'name', 'de', 'Europa')
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        self.assertEqual(europe.name, 'Europe')
+
+        # like the test client, keep the connection of the test transaction
+        request_started.disconnect(close_old_connections)
+        try:
+            request_started.send(sender=self.__class__)
+        finally:
+            request_started.connect(close_old_connections)
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        self.assertEqual(europe.name, 'Europa')
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHES,
+    TRANSLATIONS_CACHE='translations',
+    TRANSLATIONS_VERSION_CHECK_INTERVAL=None,
+)
+class WarmupTest(TransactionTestCase):
+    """Tests for warming up the translations caches."""
+
+    def setUp(self):
+        caches['translations'].clear()
+        _absentees.clear()
+        # the versions get checked by the first read of each test only
+        translations_cache._translation_versions_checked = None
+
+    def test_warm_translations(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        count = _warm_translations(Continent, ['de', 'tr'], chunk_size=1)
+
+        self.assertEqual(count, 8)
+
+        continents = list(Continent.objects.order_by('code'))
+        with self.assertNumQueries(0):
+            with Context(continents) as context:
+                context.read('de')
+
+        self.assertEqual(continents[0].name, 'Asien')
+        self.assertEqual(continents[1].name, 'Europa')
+
+        with self.assertNumQueries(0):
+            with Context(continents) as context:
+                context.read('tr')
+
+        self.assertEqual(continents[0].name, 'Asya')
+        self.assertEqual(continents[1].name, 'Avrupa')
+
+    def test_warm_translations_untranslated(self):
+        create_samples(
+            continent_names=['europe'],
+        )
+
+        count = _warm_translations(Continent, ['de'])
+
+        self.assertEqual(count, 0)
+
+        europe = Continent.objects.get()
+        with self.assertNumQueries(0):
+            with Context(europe) as context:
+                context.read('de')
+
+        self.assertEqual(europe.name, 'Europe')
+
+    @override_settings(
+        TRANSLATIONS_CACHE=None,
+        TRANSLATIONS_NEGATIVE_CACHE=True,
+        TRANSLATIONS_VERSION_CHECK_INTERVAL=60,
+    )
+    def test_warm_translations_negative(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+        Translation.objects.filter(object_id='AS').delete()
+        translations_cache._translation_versions_checked = None
+
+        _warm_translations(Continent, ['de'])
+
+        continent_ct = ContentType.objects.get_for_model(Continent)
+        self.assertIn('AS', _absentees[(continent_ct.id, 'de')])
+        self.assertNotIn('EU', _absentees[(continent_ct.id, 'de')])
+
+    @override_settings(TRANSLATIONS_WARMUP={
+        'sample.Continent': ['de', 'en-gb'],
+        'sample.Country': None,
+    })
+    def test_get_warmup_config(self):
+        self.assertListEqual(
+            _get_warmup_config(),
+            [
+                (Continent, ['de', 'en-gb']),
+                (Country, ['en-gb', 'de', 'tr']),
+            ]
+        )
+
+
+class AbsenteesTest(TestCase):
+    """Tests for `_Absentees`."""
+
+    def test_integer_ids(self):
+        absentees = _Absentees()
+        absentees.add('0')
+        absentees.add('17')
+
+        self.assertIn('0', absentees)
+        self.assertIn('17', absentees)
+        self.assertNotIn('16', absentees)
+        self.assertNotIn('1000', absentees)
+        self.assertEqual(len(absentees.bits), 3)
+        self.assertSetEqual(absentees.ids, set())
+
+    def test_other_ids(self):
+        absentees = _Absentees()
+        absentees.add('EU')
+        absentees.add('017')
+        absentees.add(str(_Absentees.MAX_INDEX))
+
+        self.assertIn('EU', absentees)
+        self.assertIn('017', absentees)
+        self.assertNotIn('17', absentees)
+        self.assertIn(str(_Absentees.MAX_INDEX), absentees)
+        self.assertEqual(len(absentees.bits), 0)
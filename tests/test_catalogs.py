@@ -0,0 +1,238 @@
+import os
+import shutil
+import tempfile
+
+from django.test import TestCase, override_settings
+from django.contrib.contenttypes.models import ContentType
+
+from translations.context import Context
+from translations.catalogs import _Catalog, _catalogs, _get_catalog, \
+    _get_catalog_path, _write_catalog
+
+from sample.models import Continent, Country
+from sample.utils import create_samples
+
+
+class CatalogTestMixin:
+    """A mixin which provides a temporary catalogs directory."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.addCleanup(_catalogs.clear)
+
+
+class CatalogTest(CatalogTestMixin, TestCase):
+    """Tests for `_Catalog`."""
+
+    def test_get_texts(self):
+        path = _get_catalog_path(self.directory, 'de')
+        _write_catalog(path, [1, 2], [
+            (1, 'EU', 'name', 'Europa'),
+            (1, 'EU', 'denonym', 'Europäisch'),
+            (1, 'EUR', 'name', 'Eurasien'),
+            (2, 'EU', 'name', 'Anderes'),
+        ])
+
+        catalog = _Catalog(path)
+
+        self.assertSetEqual(catalog.ct_ids, {1, 2})
+        self.assertDictEqual(
+            catalog.get_texts(1, 'EU'),
+            {'name': 'Europa', 'denonym': 'Europäisch'}
+        )
+        self.assertDictEqual(
+            catalog.get_texts(1, 'EUR'),
+            {'name': 'Eurasien'}
+        )
+        self.assertDictEqual(
+            catalog.get_texts(2, 'EU'),
+            {'name': 'Anderes'}
+        )
+        self.assertDictEqual(catalog.get_texts(1, 'AS'), {})
+        self.assertDictEqual(catalog.get_texts(3, 'EU'), {})
+
+    def test_get_texts_empty(self):
+        path = _get_catalog_path(self.directory, 'de')
+        _write_catalog(path, [], [])
+
+        catalog = _Catalog(path)
+
+        self.assertSetEqual(catalog.ct_ids, set())
+        self.assertDictEqual(catalog.get_texts(1, 'EU'), {})
+
+    def test_get_entries(self):
+        path = _get_catalog_path(self.directory, 'de')
+        _write_catalog(path, [1, 2], [
+            (2, 'EU', 'name', 'Anderes'),
+            (1, 'EU', 'name', 'Europa'),
+        ])
+
+        catalog = _Catalog(path)
+
+        self.assertListEqual(
+            list(catalog.get_entries()),
+            [
+                (1, 'EU', 'name', 'Europa'),
+                (2, 'EU', 'name', 'Anderes'),
+            ]
+        )
+
+    def test_write_merge(self):
+        path = _get_catalog_path(self.directory, 'de')
+        _write_catalog(path, [1, 2], [
+            (1, 'EU', 'name', 'Europa'),
+            (2, 'EU', 'name', 'Anderes'),
+        ])
+        _write_catalog(path, [2, 3], [
+            (3, 'EU', 'name', 'Drittes'),
+        ], merge=True)
+
+        catalog = _Catalog(path)
+
+        self.assertSetEqual(catalog.ct_ids, {1, 2, 3})
+        self.assertDictEqual(catalog.get_texts(1, 'EU'), {'name': 'Europa'})
+        self.assertDictEqual(catalog.get_texts(2, 'EU'), {})
+        self.assertDictEqual(catalog.get_texts(3, 'EU'), {'name': 'Drittes'})
+
+    def test_write_merge_missing(self):
+        path = _get_catalog_path(self.directory, 'de')
+        _write_catalog(path, [1], [(1, 'EU', 'name', 'Europa')], merge=True)
+
+        catalog = _Catalog(path)
+
+        self.assertSetEqual(catalog.ct_ids, {1})
+        self.assertDictEqual(catalog.get_texts(1, 'EU'), {'name': 'Europa'})
+
+    def test_write_replace(self):
+        path = _get_catalog_path(self.directory, 'de')
+        _write_catalog(path, [1], [(1, 'EU', 'name', 'Europa')])
+        _write_catalog(path, [2], [(2, 'EU', 'name', 'Anderes')])
+
+        catalog = _Catalog(path)
+
+        self.assertSetEqual(catalog.ct_ids, {2})
+        self.assertDictEqual(catalog.get_texts(1, 'EU'), {})
+
+    def test_invalid(self):
+        path = os.path.join(self.directory, 'de.catalog')
+        with open(path, 'wb') as fh:
+            fh.write(b'\0' * 64)
+
+        with self.assertRaises(ValueError) as error:
+            _Catalog(path)
+
+        self.assertEqual(
+            error.exception.args[0],
+            '`{}` is not a translations catalog.'.format(path)
+        )
+
+    def test_get_catalog_reloads(self):
+        path = _get_catalog_path(self.directory, 'de')
+
+        with self.settings(TRANSLATIONS_CATALOGS=self.directory):
+            self.assertIsNone(_get_catalog('de'))
+
+            _write_catalog(path, [1], [(1, 'EU', 'name', 'Europa')])
+            os.utime(path, ns=(1, 1))
+            catalog = _get_catalog('de')
+            self.assertIs(_get_catalog('de'), catalog)
+
+            _write_catalog(path, [1], [(1, 'EU', 'name', 'Europa Neu')])
+            os.utime(path, ns=(2, 2))
+            self.assertDictEqual(
+                _get_catalog('de').get_texts(1, 'EU'),
+                {'name': 'Europa Neu'}
+            )
+
+
+class CatalogReadTest(CatalogTestMixin, TestCase):
+    """Tests for reading the translations from the catalogs."""
+
+    def test_read_catalogued(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+        continent_ct = ContentType.objects.get_for_model(Continent)
+        _write_catalog(
+            _get_catalog_path(self.directory, 'de'),
+            [continent_ct.id],
+            [(continent_ct.id, 'EU', 'name', 'Europa (Katalog)')],
+        )
+
+        continents = list(Continent.objects.order_by('code'))
+
+        with override_settings(TRANSLATIONS_CATALOGS=self.directory):
+            with self.assertNumQueries(0):
+                with Context(continents) as context:
+                    context.read('de')
+
+        self.assertEqual(continents[0].name, 'Asia')
+        self.assertEqual(continents[1].name, 'Europa (Katalog)')
+        self.assertEqual(continents[1].denonym, 'European')
+
+    def test_read_partially_catalogued(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            langs=['de']
+        )
+        continent_ct = ContentType.objects.get_for_model(Continent)
+        _write_catalog(
+            _get_catalog_path(self.directory, 'de'),
+            [continent_ct.id],
+            [(continent_ct.id, 'EU', 'name', 'Europa (Katalog)')],
+        )
+
+        europe = Continent.objects.prefetch_related('countries').get()
+
+        with override_settings(TRANSLATIONS_CATALOGS=self.directory):
+            with self.assertNumQueries(1):
+                with Context(europe, 'countries') as context:
+                    context.read('de')
+
+        self.assertEqual(europe.name, 'Europa (Katalog)')
+        self.assertEqual(europe.countries.all()[0].name, 'Deutschland')
+
+    def test_read_other_language(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['tr']
+        )
+        continent_ct = ContentType.objects.get_for_model(Continent)
+        _write_catalog(
+            _get_catalog_path(self.directory, 'de'),
+            [continent_ct.id],
+            [],
+        )
+
+        europe = Continent.objects.get()
+
+        with override_settings(TRANSLATIONS_CATALOGS=self.directory):
+            with self.assertNumQueries(1):
+                with Context(europe) as context:
+                    context.read('tr')
+
+        self.assertEqual(europe.name, 'Avrupa')
+
+    def test_read_uncatalogued_model(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            country_fields=['name', 'denonym'],
+            langs=['de']
+        )
+        _write_catalog(_get_catalog_path(self.directory, 'de'), [], [])
+
+        germany = Country.objects.get()
+
+        with override_settings(TRANSLATIONS_CATALOGS=self.directory):
+            with Context(germany) as context:
+                context.read('de')
+
+        self.assertEqual(germany.name, 'Deutschland')
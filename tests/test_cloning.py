@@ -0,0 +1,363 @@
+from unittest import skipUnless
+
+from django.test import TestCase, override_settings
+from django.db import models
+
+from translations.models import Translation, TranslationRevision
+from translations.context import Context
+from translations.cloning import clone_translations
+
+from sample.models import Continent, Country, City
+from sample.utils import create_samples
+
+from tests.models import Street, StreetTranslation, Park, Monument
+
+if hasattr(models, 'JSONField'):
+    from tests.models import Landmark
+
+
+def _clone(obj, **fields):
+    pk = obj.pk
+    obj.pk = None
+    for (name, value) in fields.items():
+        setattr(obj, name, value)
+    obj.save()
+    clone = type(obj).objects.get(pk=obj.pk)
+    obj.pk = pk
+    return clone
+
+
+def _get_texts(obj, lang, *fields):
+    obj = type(obj).objects.get(pk=obj.pk)
+    with Context(obj) as context:
+        context.read(lang)
+    return [getattr(obj, field) for field in fields]
+
+
+class CloneTranslationsTest(TestCase):
+    """Tests for `clone_translations`."""
+
+    def create_cities(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne', 'munich'],
+            city_fields=['name', 'denonym'],
+            langs=['de', 'tr'],
+        )
+        return list(City.objects.order_by('name'))
+
+    def test_int_pks(self):
+        cologne, munich = self.create_cities()
+        new_cologne = _clone(cologne)
+        new_munich = _clone(munich)
+
+        count = clone_translations({
+            City: {cologne.pk: new_cologne.pk, munich.pk: new_munich.pk},
+        })
+
+        self.assertEqual(count, 2)
+        self.assertListEqual(
+            _get_texts(new_cologne, 'de', 'name', 'denonym'),
+            ['Köln', 'Kölner']
+        )
+        self.assertListEqual(
+            _get_texts(new_munich, 'tr', 'name', 'denonym'),
+            ['Münih', 'Münihlı']
+        )
+        self.assertListEqual(
+            _get_texts(cologne, 'de', 'name', 'denonym'),
+            ['Köln', 'Kölner']
+        )
+        self.assertEqual(
+            Translation.objects.filter(
+                object_int_id=new_cologne.pk,
+            ).exclude(object_id=str(new_cologne.pk)).count(),
+            0
+        )
+
+    def test_char_pks(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de'],
+        )
+        europe = Continent.objects.get()
+        new_europe = _clone(europe, code='EX')
+
+        clone_translations({Continent: {'EU': 'EX'}})
+
+        self.assertListEqual(
+            _get_texts(new_europe, 'de', 'name', 'denonym'),
+            ['Europa', 'Europäisch']
+        )
+
+    def test_many_models(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+            country_fields=['name', 'denonym'],
+            city_fields=['name', 'denonym'],
+            langs=['de'],
+        )
+        germany = Country.objects.get()
+        cologne = City.objects.get()
+        new_germany = _clone(germany)
+        new_cologne = _clone(cologne, country=new_germany)
+
+        # an insert per model, each with the versions bumped, created for
+        # the other languages and bumped again
+        with self.assertNumQueries(10):
+            clone_translations({
+                Country: {germany.pk: new_germany.pk},
+                City: {cologne.pk: new_cologne.pk},
+            })
+
+        self.assertListEqual(
+            _get_texts(new_germany, 'de', 'name'),
+            ['Deutschland']
+        )
+        self.assertListEqual(
+            _get_texts(new_cologne, 'de', 'name'),
+            ['Köln']
+        )
+
+    def test_queries(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne', 'munich'],
+            city_fields=['name', 'denonym'],
+            langs=['de', 'tr'],
+        )
+        cities = list(City.objects.all())
+        new_cities = [_clone(city) for city in cities]
+        pks = {
+            city.pk: new_city.pk
+            for (city, new_city) in zip(cities, new_cities)
+        }
+
+        # savepoint, insert, bump, create and bump the versions, release
+        with self.assertNumQueries(6):
+            clone_translations({City: pks})
+
+        self.assertEqual(Translation.objects.count(), 16)
+
+    def test_chunk_size(self):
+        cities = self.create_cities()
+        new_cities = [_clone(city) for city in cities]
+
+        # savepoint, an insert per city, each with the versions bumped (and
+        # created and bumped again the first time), release
+        with self.assertNumQueries(8):
+            clone_translations(
+                {
+                    City: {
+                        city.pk: new_city.pk
+                        for (city, new_city) in zip(cities, new_cities)
+                    },
+                },
+                chunk_size=1,
+            )
+
+        self.assertListEqual(
+            [_get_texts(city, 'de', 'name')[0] for city in new_cities],
+            ['Köln', 'München']
+        )
+
+    def test_no_translations(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+        )
+        cologne = City.objects.get()
+        new_cologne = _clone(cologne)
+
+        count = clone_translations({City: {cologne.pk: new_cologne.pk}})
+
+        self.assertEqual(count, 1)
+        self.assertEqual(Translation.objects.count(), 0)
+
+    def test_cache(self):
+        cologne, munich = self.create_cities()
+        new_cologne = _clone(cologne)
+        self.assertListEqual(
+            _get_texts(new_cologne, 'de', 'name'),
+            ['Cologne']
+        )
+
+        clone_translations({City: {cologne.pk: new_cologne.pk}})
+
+        self.assertListEqual(
+            _get_texts(new_cologne, 'de', 'name'),
+            ['Köln']
+        )
+
+    def test_interned(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+        )
+        park = Park.objects.create(
+            name='Rhine Park',
+            description='Small',
+            city=City.objects.get(),
+        )
+        with Context(park) as context:
+            park.name = 'Rheinpark'
+            park.description = 'Klein'
+            context.create('de')
+        new_park = _clone(park)
+
+        clone_translations({Park: {park.pk: new_park.pk}})
+
+        self.assertListEqual(
+            _get_texts(new_park, 'de', 'name', 'description'),
+            ['Rheinpark', 'Klein']
+        )
+        self.assertEqual(
+            Translation.objects.filter(shared_text__isnull=False).count(),
+            4
+        )
+
+    def test_compressed(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+        )
+        monument = Monument.objects.create(
+            name='Cathedral',
+            description='A gothic cathedral. ' * 10,
+            city=City.objects.get(),
+        )
+        with Context(monument) as context:
+            monument.description = 'Ein gotischer Dom. ' * 10
+            context.create('de')
+        new_monument = _clone(monument)
+
+        clone_translations({Monument: {monument.pk: new_monument.pk}})
+
+        self.assertListEqual(
+            _get_texts(new_monument, 'de', 'description'),
+            ['Ein gotischer Dom. ' * 10]
+        )
+
+    def test_model_table(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+        )
+        street = Street.objects.create(
+            name='Cathedral Square',
+            city=City.objects.get(),
+        )
+        StreetTranslation.objects.create(
+            source=street,
+            field='name',
+            language='de',
+            text='Domplatte',
+        )
+        new_street = _clone(street)
+
+        # savepoint, insert, release
+        with self.assertNumQueries(3):
+            clone_translations({Street: {street.pk: new_street.pk}})
+
+        self.assertListEqual(
+            _get_texts(new_street, 'de', 'name'),
+            ['Domplatte']
+        )
+        self.assertEqual(StreetTranslation.objects.count(), 2)
+
+    @skipUnless(hasattr(models, 'JSONField'), 'JSONField is not supported.')
+    def test_json(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+        )
+        landmark = Landmark.objects.create(
+            name='Cathedral',
+            city=City.objects.get(),
+            i18n={'de': {'name': 'Dom'}},
+        )
+        new_landmark = _clone(landmark, i18n={})
+
+        clone_translations({Landmark: {landmark.pk: new_landmark.pk}})
+
+        self.assertListEqual(
+            _get_texts(new_landmark, 'de', 'name'),
+            ['Dom']
+        )
+
+    @override_settings(TRANSLATIONS_REVISIONS=True)
+    def test_revisions(self):
+        cologne, munich = self.create_cities()
+        new_cologne = _clone(cologne)
+
+        count = clone_translations({City: {cologne.pk: new_cologne.pk}})
+
+        self.assertEqual(count, 1)
+        self.assertListEqual(
+            _get_texts(new_cologne, 'tr', 'name', 'denonym'),
+            ['Koln', 'Kolnlı']
+        )
+        self.assertQuerysetEqual(
+            TranslationRevision.objects.filter(
+                object_id=str(new_cologne.pk),
+            ).order_by('language', 'field').values_list(
+                'language', 'field', 'text',
+            ),
+            [
+                "('de', 'denonym', 'Kölner')",
+                "('de', 'name', 'Köln')",
+                "('tr', 'denonym', 'Kolnlı')",
+                "('tr', 'name', 'Koln')",
+            ]
+        )
+
+    @override_settings(TRANSLATIONS_REVISIONS=True)
+    def test_revisions_model_table(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+        )
+        street = Street.objects.create(
+            name='Cathedral Square',
+            city=City.objects.get(),
+        )
+        StreetTranslation.objects.create(
+            source=street,
+            field='name',
+            language='de',
+            text='Domplatte',
+        )
+        new_street = _clone(street)
+
+        clone_translations({Street: {street.pk: new_street.pk}})
+
+        self.assertListEqual(
+            _get_texts(new_street, 'de', 'name'),
+            ['Domplatte']
+        )
+        self.assertQuerysetEqual(
+            TranslationRevision.objects.filter(
+                object_id=str(new_street.pk),
+            ).values_list('language', 'field', 'text'),
+            ["('de', 'name', 'Domplatte')"]
+        )
+
+    def test_not_translatable(self):
+        with self.assertRaises(TypeError) as error:
+            clone_translations({Translation: {1: 2}})
+
+        self.assertEqual(
+            error.exception.args[0],
+            '`{}` is not Translatable!'.format(Translation)
+        )
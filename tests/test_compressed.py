@@ -0,0 +1,70 @@
+import zlib
+import lzma
+
+from django.test import TestCase
+
+from translations.compressed import _get_compression_methods, \
+    _get_compressed_text, _decompress_text
+
+
+LONG_TEXT = 'Der Kölner Dom ist eine römisch-katholische Kirche. ' * 10
+
+
+class GetCompressionMethodsTest(TestCase):
+    """Tests for `_get_compression_methods`."""
+
+    def test_methods(self):
+        self.assertListEqual(_get_compression_methods(), ['zlib', 'lzma'])
+
+
+class GetCompressedTextTest(TestCase):
+    """Tests for `_get_compressed_text`."""
+
+    def test_short(self):
+        self.assertIsNone(_get_compressed_text('Dom', 64, 'zlib'))
+
+    def test_incompressible(self):
+        text = 'Kölner Dom, Rathaus und Gürzenich'
+        self.assertIsNone(_get_compressed_text(text, 8, 'lzma'))
+
+    def test_zlib(self):
+        data = _get_compressed_text(LONG_TEXT, 64, 'zlib')
+        self.assertEqual(data[:1], b'z')
+        self.assertEqual(
+            zlib.decompress(data[1:]).decode('utf-8'),
+            LONG_TEXT
+        )
+        self.assertLess(len(data), len(LONG_TEXT.encode('utf-8')))
+
+    def test_lzma(self):
+        data = _get_compressed_text(LONG_TEXT, 64, 'lzma')
+        self.assertEqual(data[:1], b'x')
+        self.assertEqual(
+            lzma.decompress(data[1:]).decode('utf-8'),
+            LONG_TEXT
+        )
+
+
+class DecompressTextTest(TestCase):
+    """Tests for `_decompress_text`."""
+
+    def test_zlib(self):
+        data = _get_compressed_text(LONG_TEXT, 64, 'zlib')
+        self.assertEqual(_decompress_text(data), LONG_TEXT)
+
+    def test_lzma(self):
+        data = _get_compressed_text(LONG_TEXT, 64, 'lzma')
+        self.assertEqual(_decompress_text(data), LONG_TEXT)
+
+    def test_memoryview(self):
+        data = _get_compressed_text(LONG_TEXT, 64, 'zlib')
+        self.assertEqual(_decompress_text(memoryview(data)), LONG_TEXT)
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError) as error:
+            _decompress_text(b'?abc')
+
+        self.assertEqual(
+            error.exception.args[0],
+            'The compressed text has an unknown method.'
+        )
@@ -1,11 +1,27 @@
-from django.test import TestCase
+import asyncio
+import threading
+from unittest import mock, skipUnless
+
+try:
+    from asgiref.sync import async_to_sync
+except ImportError:  # Django < 3.0
+    async_to_sync = None
+
+import django
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.db import connection, connections, transaction, \
+    IntegrityError, OperationalError
 from django.utils.translation import override
 
-from translations.context import Context
+from translations.context import Context, _get_batches
+from translations.models import Translation, TranslationRevision
+from translations.storages import TableStorage
 
-from sample.models import Continent
+from sample.models import Continent, City
 from sample.utils import create_samples
 
+from tests.models import District
+
 
 class ContextTest(TestCase):
     """Tests for `Context`."""
@@ -7641,3 +7657,791 @@ class ContextTest(TestCase):
         self.assertEqual(south_korea.denonym, 'South Korean')
         self.assertEqual(seoul.name, 'Seoul')
         self.assertEqual(seoul.denonym, 'Seouler')
+
+
+class ContextConflictsTest(TestCase):
+    """Tests for the conflicts of the `Context` writes."""
+
+    def create_europe(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name'],
+            langs=['de'],
+        )
+        return Continent.objects.get(code='EU')
+
+    def test_create_conflicts_error(self):
+        europe = self.create_europe()
+
+        with Context(europe) as context:
+            europe.name = 'Europa (neu)'
+            europe.denonym = 'Europäisch'
+            with self.assertRaises(IntegrityError):
+                with transaction.atomic():
+                    context.create('de')
+
+        self.assertQuerysetEqual(
+            Translation.objects.order_by('field').values_list(
+                'field', 'text',
+            ),
+            ["('name', 'Europa')"]
+        )
+
+    def test_create_conflicts_ignore(self):
+        europe = self.create_europe()
+
+        with Context(europe) as context:
+            europe.name = 'Europa (neu)'
+            europe.denonym = 'Europäisch'
+            context.create('de', conflicts='ignore')
+
+        self.assertQuerysetEqual(
+            Translation.objects.order_by('field').values_list(
+                'field', 'text',
+            ),
+            ["('denonym', 'Europäisch')", "('name', 'Europa')"]
+        )
+
+    def test_create_conflicts_ignore_stale_read(self):
+        europe = self.create_europe()
+
+        with Context(europe) as context:
+            europe.name = 'Europa (neu)'
+            europe.denonym = 'Europäisch'
+            # like a stale cache which misses the existing translation
+            with mock.patch.object(TableStorage, 'read', return_value={}):
+                context.create('de', conflicts='ignore')
+
+        self.assertQuerysetEqual(
+            Translation.objects.order_by('field').values_list(
+                'field', 'text',
+            ),
+            ["('denonym', 'Europäisch')", "('name', 'Europa')"]
+        )
+
+    def test_create_conflicts_update(self):
+        europe = self.create_europe()
+
+        with Context(europe) as context:
+            europe.name = 'Europa (neu)'
+            europe.denonym = 'Europäisch'
+            context.create('de', conflicts='update')
+
+        self.assertQuerysetEqual(
+            Translation.objects.order_by('field').values_list(
+                'field', 'text',
+            ),
+            ["('denonym', 'Europäisch')", "('name', 'Europa (neu)')"]
+        )
+
+    def test_create_conflicts_invalid(self):
+        europe = self.create_europe()
+
+        with Context(europe) as context:
+            with self.assertRaises(ValueError) as error:
+                context.create('de', conflicts='replace')
+
+        self.assertEqual(
+            error.exception.args[0],
+            '`replace` is not a conflict mode.'
+        )
+
+    def test_create_lock(self):
+        europe = self.create_europe()
+
+        with Context(europe) as context:
+            europe.denonym = 'Europäisch'
+            context.create('de', lock=True)
+
+        self.assertEqual(Translation.objects.count(), 2)
+
+    def test_update_lock(self):
+        europe = self.create_europe()
+
+        with Context(europe) as context:
+            europe.name = 'Europa (neu)'
+            context.update('de', lock=True)
+
+        self.assertEqual(Translation.objects.get().text, 'Europa (neu)')
+
+    def test_update_retries(self):
+        europe = self.create_europe()
+        update = TableStorage.update
+        calls = []
+
+        def _update(storage, mapping, changes, lang):
+            calls.append(lang)
+            if len(calls) == 1:
+                raise IntegrityError('UNIQUE constraint failed')
+            update(storage, mapping, changes, lang)
+
+        with mock.patch.object(TableStorage, 'update', _update):
+            with Context(europe) as context:
+                europe.name = 'Europa (neu)'
+                context.update('de')
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(Translation.objects.get().text, 'Europa (neu)')
+
+    def test_update_retries_locked(self):
+        europe = self.create_europe()
+        update = TableStorage.update
+        calls = []
+
+        def _update(storage, mapping, changes, lang):
+            calls.append(lang)
+            if len(calls) == 1:
+                raise OperationalError('database is locked')
+            update(storage, mapping, changes, lang)
+
+        with mock.patch.object(TableStorage, 'update', _update):
+            with Context(europe) as context:
+                europe.name = 'Europa (neu)'
+                context.update('de')
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(Translation.objects.get().text, 'Europa (neu)')
+
+    def test_update_not_retried_integrity(self):
+        europe = self.create_europe()
+        calls = []
+
+        def _update(storage, mapping, changes, lang):
+            calls.append(lang)
+            raise IntegrityError('NOT NULL constraint failed: text')
+
+        with mock.patch.object(TableStorage, 'update', _update):
+            with Context(europe) as context:
+                europe.name = 'Europa (neu)'
+                with self.assertRaises(IntegrityError):
+                    context.update('de')
+
+        self.assertEqual(len(calls), 1)
+
+    def test_update_not_retried(self):
+        europe = self.create_europe()
+        calls = []
+
+        def _update(storage, mapping, changes, lang):
+            calls.append(lang)
+            raise OperationalError('no such column: text')
+
+        with mock.patch.object(TableStorage, 'update', _update):
+            with Context(europe) as context:
+                europe.name = 'Europa (neu)'
+                with self.assertRaises(OperationalError):
+                    context.update('de')
+
+        self.assertEqual(len(calls), 1)
+
+    @override_settings(TRANSLATIONS_WRITE_RETRIES=2)
+    def test_update_retries_exhausted(self):
+        europe = self.create_europe()
+        calls = []
+
+        def _update(storage, mapping, changes, lang):
+            calls.append(lang)
+            raise IntegrityError('UNIQUE constraint failed')
+
+        with mock.patch.object(TableStorage, 'update', _update):
+            with Context(europe) as context:
+                europe.name = 'Europa (neu)'
+                with self.assertRaises(IntegrityError):
+                    context.update('de')
+
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(Translation.objects.get().text, 'Europa')
+
+
+class ContextBatchesTest(TestCase):
+    """Tests for the batches of the `Context` writes."""
+
+    def create_continents(self, langs=None):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name'],
+            langs=langs or [],
+        )
+        return Continent.objects.order_by('code')
+
+    def translate(self, continents):
+        for continent in continents:
+            continent.name = '{} (de)'.format(continent.code)
+            continent.denonym = '{} (de)'.format(continent.code)
+
+    def test_create(self):
+        continents = self.create_continents()
+        calls = []
+
+        with Context(continents) as context:
+            self.translate(continents)
+            # savepoint, create each batch and bump the versions, which
+            # the first one creates and bumps again, release
+            with self.assertNumQueries(8):
+                context.create(
+                    'de', batch_size=3,
+                    progress=lambda done, total: calls.append((done, total)),
+                )
+
+        self.assertListEqual(calls, [(3, 4), (4, 4)])
+        self.assertEqual(Translation.objects.count(), 4)
+
+    def test_create_single_batch(self):
+        continents = self.create_continents()
+        calls = []
+
+        with Context(continents) as context:
+            self.translate(continents)
+            # create, bump, create and bump the versions
+            with self.assertNumQueries(4):
+                context.create(
+                    'de',
+                    progress=lambda done, total: calls.append((done, total)),
+                )
+
+        self.assertListEqual(calls, [(4, 4)])
+        self.assertEqual(Translation.objects.count(), 4)
+
+    def test_create_atomic(self):
+        continents = self.create_continents()
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name'],
+            langs=['de'],
+        )
+
+        with Context(continents) as context:
+            self.translate(continents)
+            with self.assertRaises(IntegrityError):
+                context.create('de', batch_size=2)
+
+        self.assertQuerysetEqual(
+            Translation.objects.values_list('object_id', 'text'),
+            ["('{}', 'Europa')".format(
+                Continent.objects.get(code='EU').pk,
+            )]
+        )
+
+    def test_update(self):
+        continents = self.create_continents(langs=['de'])
+        calls = []
+
+        with Context(continents) as context:
+            self.translate(continents)
+            # savepoint, delete, create and bump the versions of each batch,
+            # release
+            with self.assertNumQueries(8):
+                context.update(
+                    'de', batch_size=2,
+                    progress=lambda done, total: calls.append((done, total)),
+                )
+
+        self.assertListEqual(calls, [(2, 4), (4, 4)])
+        self.assertQuerysetEqual(
+            Translation.objects.order_by('text').values_list(
+                'text', flat=True,
+            ),
+            ['AS (de)', 'AS (de)', 'EU (de)', 'EU (de)'],
+            transform=str,
+        )
+
+    def test_update_not_atomic(self):
+        continents = self.create_continents(langs=['de'])
+
+        with Context(continents) as context:
+            self.translate(continents)
+            # delete, create and bump the versions of each batch
+            with self.assertNumQueries(6):
+                context.update('de', batch_size=2, atomic=False)
+
+        self.assertEqual(Translation.objects.count(), 4)
+
+    def test_delete(self):
+        continents = self.create_continents(langs=['de'])
+        calls = []
+
+        with Context(continents) as context:
+            # savepoint, delete each batch and bump the versions, release
+            with self.assertNumQueries(6):
+                context.delete(
+                    'de', batch_size=1,
+                    progress=lambda done, total: calls.append((done, total)),
+                )
+
+        self.assertListEqual(calls, [(1, 2), (2, 2)])
+        self.assertEqual(Translation.objects.count(), 0)
+
+    @override_settings(TRANSLATIONS_BATCH_SIZE=1)
+    def test_batch_size_setting(self):
+        continents = self.create_continents()
+        calls = []
+
+        with Context(continents) as context:
+            self.translate(continents)
+            context.create(
+                'de',
+                progress=lambda done, total: calls.append((done, total)),
+            )
+
+        self.assertListEqual(calls, [(1, 4), (2, 4), (3, 4), (4, 4)])
+
+    def test_batch_size_default(self):
+        continents = self.create_continents()
+
+        with mock.patch(
+            'translations.context._get_batches', wraps=_get_batches,
+        ) as get_batches:
+            with Context(continents) as context:
+                self.translate(continents)
+                context.create('de')
+
+        self.assertEqual(get_batches.call_args[0][3], 250)
+        self.assertEqual(Translation.objects.count(), 4)
+
+    @override_settings(TRANSLATIONS_BATCH_SIZE=None)
+    def test_batch_size_setting_none(self):
+        continents = self.create_continents()
+        calls = []
+
+        with Context(continents) as context:
+            self.translate(continents)
+            context.create(
+                'de', batch_size=None,
+                progress=lambda done, total: calls.append((done, total)),
+            )
+
+        self.assertListEqual(calls, [(4, 4)])
+
+    @override_settings(TRANSLATIONS_ATOMIC=False)
+    def test_atomic_setting(self):
+        continents = self.create_continents()
+
+        with Context(continents) as context:
+            self.translate(continents)
+            # create each batch and bump the versions, which the first one
+            # creates and bumps again
+            with self.assertNumQueries(6):
+                context.create('de', batch_size=2)
+
+        self.assertEqual(Translation.objects.count(), 4)
+
+
+class ContextManyTest(TestCase):
+    """Tests for the multi-language `Context` writes."""
+
+    def create_continents(self, langs=None):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name'],
+            langs=langs or [],
+        )
+        return (
+            Continent.objects.get(code='EU'),
+            Continent.objects.get(code='AS'),
+        )
+
+    def get_texts(self):
+        return list(
+            Translation.objects.order_by(
+                'language', 'object_id', 'field',
+            ).values_list('language', 'object_id', 'field', 'text')
+        )
+
+    def test_update_many(self):
+        europe, asia = self.create_continents(langs=['de', 'tr'])
+
+        with Context(Continent.objects.all()) as context:
+            # savepoint, delete the old rows, create the new ones, bump
+            # the versions, release
+            with self.assertNumQueries(5):
+                context.update_many({
+                    'de': {
+                        europe: {'name': 'Europa (neu)'},
+                        asia: {'denonym': 'Asiatisch'},
+                    },
+                    'tr': {
+                        europe: {'name': 'Avrupa (yeni)'},
+                    },
+                })
+
+        self.assertListEqual(
+            self.get_texts(),
+            [
+                ('de', 'AS', 'denonym', 'Asiatisch'),
+                ('de', 'AS', 'name', 'Asien'),
+                ('de', 'EU', 'name', 'Europa (neu)'),
+                ('tr', 'AS', 'name', 'Asya'),
+                ('tr', 'EU', 'name', 'Avrupa (yeni)'),
+            ]
+        )
+        self.assertEqual(europe.name, 'Europe')
+
+    def test_update_many_getters(self):
+        europe, asia = self.create_continents()
+
+        with Context(Continent.objects.all()) as context:
+            context.update_many({
+                'de': lambda obj: {'name': '{} (de)'.format(obj.code)},
+                'tr': lambda obj: {'name': '{} (tr)'.format(obj.code)},
+            })
+
+        self.assertListEqual(
+            self.get_texts(),
+            [
+                ('de', 'AS', 'name', 'AS (de)'),
+                ('de', 'EU', 'name', 'EU (de)'),
+                ('tr', 'AS', 'name', 'AS (tr)'),
+                ('tr', 'EU', 'name', 'EU (tr)'),
+            ]
+        )
+
+    def test_update_many_skipped_texts(self):
+        europe, asia = self.create_continents()
+
+        with Context(europe) as context:
+            context.update_many({
+                'en': {europe: {'name': 'Old World'}},
+                'de': {
+                    europe: {'name': 'Europe', 'denonym': ''},
+                    asia: {'name': 'Asien'},
+                },
+            })
+
+        self.assertListEqual(self.get_texts(), [])
+
+    def test_update_many_invalid_field(self):
+        europe, asia = self.create_continents()
+
+        with Context(europe) as context:
+            with self.assertRaises(ValueError) as error:
+                context.update_many({'de': {europe: {'code': 'EU'}}})
+
+        self.assertEqual(
+            error.exception.args[0],
+            '`code` is not a translatable field of `Continent`.'
+        )
+
+    def test_update_many_invalid_language(self):
+        europe, asia = self.create_continents()
+
+        with Context(europe) as context:
+            with self.assertRaises(ValueError) as error:
+                context.update_many({
+                    'de': {europe: {'name': 'Europa'}},
+                    'xx': {europe: {'name': 'Europa'}},
+                })
+
+        self.assertEqual(
+            error.exception.args[0],
+            '`xx` is not a supported language.'
+        )
+        self.assertListEqual(self.get_texts(), [])
+
+    def test_update_many_batches(self):
+        europe, asia = self.create_continents()
+        calls = []
+
+        with Context(Continent.objects.all()) as context:
+            context.update_many(
+                {
+                    'de': lambda obj: {'name': obj.code},
+                    'tr': lambda obj: {'name': obj.code},
+                },
+                batch_size=3,
+                progress=lambda done, total: calls.append((done, total)),
+            )
+
+        self.assertListEqual(calls, [(3, 4), (4, 4)])
+        self.assertEqual(Translation.objects.count(), 4)
+
+    def test_create_many(self):
+        europe, asia = self.create_continents()
+
+        with Context(Continent.objects.all()) as context:
+            # create, bump, create and bump the versions
+            with self.assertNumQueries(4):
+                context.create_many({
+                    'de': {europe: {'name': 'Europa'}},
+                    'tr': {europe: {'name': 'Avrupa'}},
+                })
+
+        self.assertListEqual(
+            self.get_texts(),
+            [
+                ('de', 'EU', 'name', 'Europa'),
+                ('tr', 'EU', 'name', 'Avrupa'),
+            ]
+        )
+
+    def test_create_many_conflicts_error(self):
+        europe, asia = self.create_continents(langs=['de'])
+
+        with Context(europe) as context:
+            with self.assertRaises(IntegrityError):
+                with transaction.atomic():
+                    context.create_many({
+                        'de': {europe: {'name': 'Europa (neu)'}},
+                        'tr': {europe: {'name': 'Avrupa'}},
+                    })
+
+        self.assertEqual(Translation.objects.filter(language='tr').count(), 0)
+
+    def test_create_many_conflicts_ignore(self):
+        europe, asia = self.create_continents(langs=['de'])
+
+        with Context(europe) as context:
+            context.create_many(
+                {
+                    'de': {europe: {'name': 'Europa (neu)'}},
+                    'tr': {europe: {'name': 'Avrupa (yeni)'}},
+                },
+                conflicts='ignore',
+            )
+
+        self.assertListEqual(
+            self.get_texts(),
+            [
+                ('de', 'AS', 'name', 'Asien'),
+                ('de', 'EU', 'name', 'Europa'),
+                ('tr', 'EU', 'name', 'Avrupa (yeni)'),
+            ]
+        )
+
+    def test_create_many_conflicts_update(self):
+        europe, asia = self.create_continents(langs=['de'])
+
+        with Context(europe) as context:
+            context.create_many(
+                {
+                    'de': {europe: {'name': 'Europa (neu)'}},
+                    'tr': {europe: {'name': 'Avrupa (yeni)'}},
+                },
+                conflicts='update',
+            )
+
+        self.assertListEqual(
+            self.get_texts(),
+            [
+                ('de', 'AS', 'name', 'Asien'),
+                ('de', 'EU', 'name', 'Europa (neu)'),
+                ('tr', 'EU', 'name', 'Avrupa (yeni)'),
+            ]
+        )
+
+    def test_create_many_conflicts_invalid(self):
+        europe, asia = self.create_continents()
+
+        with Context(europe) as context:
+            with self.assertRaises(ValueError) as error:
+                context.create_many({}, conflicts='merge')
+
+        self.assertEqual(
+            error.exception.args[0],
+            '`merge` is not a conflict mode.'
+        )
+
+    def test_update_many_materialized(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+        )
+        district = District.objects.create(
+            name='Old Town', city=City.objects.get(),
+        )
+
+        with Context(district) as context:
+            context.update_many({
+                'de': {district: {'name': 'Altstadt'}},
+                'tr': {district: {'name': 'Eski Şehir'}},
+            })
+
+        district.refresh_from_db()
+        self.assertEqual(district.name_de, 'Altstadt')
+        self.assertEqual(Translation.objects.count(), 2)
+
+    @override_settings(TRANSLATIONS_REVISIONS=True)
+    def test_update_many_revisions(self):
+        europe, asia = self.create_continents()
+
+        with Context(europe) as context:
+            context.update_many({
+                'de': {europe: {'name': 'Europa'}},
+                'tr': {europe: {'name': 'Avrupa'}},
+            })
+
+        self.assertQuerysetEqual(
+            TranslationRevision.objects.order_by('language').values_list(
+                'language', 'text',
+            ),
+            ["('de', 'Europa')", "('tr', 'Avrupa')"]
+        )
+
+
+class ContextConcurrencyTest(TransactionTestCase):
+    """Tests for the concurrent `Context` writes."""
+
+    def setUp(self):
+        if connection.vendor == 'sqlite' and \
+                not connection.is_in_memory_db():
+            with connection.cursor() as cursor:
+                cursor.execute('PRAGMA journal_mode=WAL')
+
+    def run_threads(self, target, count=8):
+        errors = []
+
+        def _run(i):
+            try:
+                target(i)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connections.close_all()
+
+        threads = [
+            threading.Thread(target=_run, args=(i,)) for i in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return errors
+
+    def test_update(self):
+        create_samples(continent_names=['europe'])
+
+        def _update(i):
+            for j in range(5):
+                europe = Continent.objects.get(code='EU')
+                with Context(europe) as context:
+                    europe.name = 'Europa {} {}'.format(i, j)
+                    europe.denonym = 'Europäisch {} {}'.format(i, j)
+                    context.update('de')
+
+        errors = self.run_threads(_update)
+
+        self.assertListEqual(errors, [])
+        self.assertQuerysetEqual(
+            Translation.objects.order_by('field').values_list(
+                'field', flat=True,
+            ),
+            ["'denonym'", "'name'"]
+        )
+
+    def test_create_ignore(self):
+        create_samples(continent_names=['europe'])
+
+        def _create(i):
+            europe = Continent.objects.get(code='EU')
+            with Context(europe) as context:
+                europe.name = 'Europa {}'.format(i)
+                context.create('de', conflicts='ignore')
+
+        errors = self.run_threads(_create)
+
+        self.assertListEqual(errors, [])
+        self.assertEqual(Translation.objects.count(), 1)
+
+
+@skipUnless(async_to_sync is not None, 'asgiref is not installed.')
+class ContextAsyncTest(TransactionTestCase):
+    """Tests for the async API of `Context`."""
+
+    def create_continents(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de'],
+        )
+        return (
+            Continent.objects.get(code='EU'),
+            Continent.objects.get(code='AS'),
+        )
+
+    def test_aread(self):
+        europe, asia = self.create_continents()
+
+        with Context(europe) as context:
+            async_to_sync(context.aread)('de')
+
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(europe.denonym, 'Europäisch')
+
+    @skipUnless(
+        django.VERSION >= (3, 0),
+        'The active language is not async-aware before Django 3.0.'
+    )
+    def test_aread_active_language(self):
+        europe, asia = self.create_continents()
+
+        with Context(europe) as context:
+            with override('de'):
+                async_to_sync(context.aread)()
+
+        self.assertEqual(europe.name, 'Europa')
+
+    def test_aread_invalid_language(self):
+        europe, asia = self.create_continents()
+
+        with Context(europe) as context:
+            with self.assertRaises(ValueError) as error:
+                async_to_sync(context.aread)('xx')
+
+        self.assertEqual(
+            error.exception.args[0],
+            '`xx` is not a supported language.'
+        )
+
+    def test_aread_gather(self):
+        europe, asia = self.create_continents()
+
+        async def _read():
+            await asyncio.gather(
+                Context(europe).aread('de'),
+                Context(asia).aread('de'),
+            )
+
+        async_to_sync(_read)()
+
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(asia.name, 'Asien')
+
+    def test_acreate(self):
+        create_samples(continent_names=['europe'])
+        europe = Continent.objects.get()
+
+        with Context(europe) as context:
+            europe.name = 'Europa'
+            async_to_sync(context.acreate)('de')
+
+        self.assertQuerysetEqual(
+            Translation.objects.values_list('field', 'text'),
+            ["('name', 'Europa')"]
+        )
+
+    def test_aupdate(self):
+        europe, asia = self.create_continents()
+
+        with Context(europe) as context:
+            europe.name = 'Europa (neu)'
+            async_to_sync(context.aupdate)('de')
+
+        self.assertEqual(
+            Translation.objects.get(
+                object_id=europe.pk, field='name',
+            ).text,
+            'Europa (neu)'
+        )
+
+    def test_adelete(self):
+        europe, asia = self.create_continents()
+
+        with Context(europe) as context:
+            async_to_sync(context.adelete)('de')
+
+        self.assertEqual(
+            Translation.objects.filter(object_id=europe.pk).count(), 0
+        )
+        self.assertEqual(
+            Translation.objects.filter(object_id=asia.pk).count(), 2
+        )
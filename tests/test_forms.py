@@ -1,6 +1,10 @@
 from django.test import TestCase, override_settings
 
+from django.contrib.contenttypes.models import ContentType
+
+from translations.models import Translation
 from translations.forms import generate_translation_form
+from translations.interned import _intern_texts
 
 from sample.models import Timezone, Continent, City
 
@@ -14,6 +18,21 @@ class GenerateTranslationFormTest(TestCase):
             [(None, '---------'), ('name', 'Name'), ('denonym', 'Denonym')]
         )
 
+    def test_initial_shared_text(self):
+        europe = Continent.objects.create(name='Europe', code='EU')
+        ids = _intern_texts(['Europa'])
+        translation = Translation.objects.create(
+            content_type=ContentType.objects.get_for_model(Continent),
+            object_id=europe.pk,
+            field='name',
+            language='de',
+            text='',
+            shared_text_id=ids['Europa'],
+        )
+
+        form = generate_translation_form(Continent)(instance=translation)
+        self.assertEqual(form.initial['text'], 'Europa')
+
     def test_field_choices_empty(self):
         form = generate_translation_form(Timezone)
         self.assertListEqual(
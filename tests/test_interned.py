@@ -0,0 +1,83 @@
+from django.test import TestCase
+
+from translations.models import TranslationText
+from translations.interned import _get_text_hash, _intern_texts, \
+    _get_shared_texts
+
+
+class GetTextHashTest(TestCase):
+    """Tests for `_get_text_hash`."""
+
+    def test_hash(self):
+        self.assertEqual(
+            _get_text_hash('Klein'),
+            'd3e963a0a44e2bb58eb11664d52bfc49'
+            '91405fb431c23bed20f7c4b736c28975'
+        )
+
+    def test_unicode(self):
+        self.assertEqual(len(_get_text_hash('Köln')), 64)
+
+
+class InternTextsTest(TestCase):
+    """Tests for `_intern_texts`."""
+
+    def test_no_texts(self):
+        with self.assertNumQueries(0):
+            self.assertDictEqual(_intern_texts([]), {})
+
+    def test_new_texts(self):
+        with self.assertNumQueries(3):
+            ids = _intern_texts(['Klein', 'Groß', 'Klein'])
+
+        self.assertDictEqual(
+            ids,
+            dict(TranslationText.objects.values_list('text', 'id'))
+        )
+        self.assertEqual(TranslationText.objects.count(), 2)
+
+    def test_existing_texts(self):
+        small = TranslationText.objects.create(
+            hash=_get_text_hash('Klein'),
+            text='Klein',
+        )
+
+        with self.assertNumQueries(1):
+            ids = _intern_texts(['Klein'])
+
+        self.assertDictEqual(ids, {'Klein': small.id})
+
+    def test_mixed_texts(self):
+        small = TranslationText.objects.create(
+            hash=_get_text_hash('Klein'),
+            text='Klein',
+        )
+
+        ids = _intern_texts(['Klein', 'Groß'])
+
+        self.assertEqual(ids['Klein'], small.id)
+        self.assertEqual(
+            TranslationText.objects.get(id=ids['Groß']).text,
+            'Groß'
+        )
+
+
+class GetSharedTextsTest(TestCase):
+    """Tests for `_get_shared_texts`."""
+
+    def test_no_ids(self):
+        with self.assertNumQueries(0):
+            self.assertDictEqual(_get_shared_texts([]), {})
+
+    def test_ids(self):
+        ids = _intern_texts(['Klein', 'Groß'])
+
+        with self.assertNumQueries(1):
+            texts = _get_shared_texts(
+                [ids['Klein'], ids['Klein'], ids['Groß']]
+            )
+
+        self.assertDictEqual(
+            texts,
+            {ids['Klein']: 'Klein', ids['Groß']: 'Groß'}
+        )
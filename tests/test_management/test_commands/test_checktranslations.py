@@ -0,0 +1,112 @@
+from io import StringIO
+
+from django.test import TestCase
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.contrib.contenttypes.models import ContentType
+
+from translations.context import Context
+from translations.management.commands.checktranslations import Command
+
+from sample.models import Continent, City
+from sample.utils import create_samples
+
+
+def create_stale_translations():
+    create_samples(
+        continent_names=['europe', 'asia'],
+        continent_fields=['name', 'denonym'],
+        langs=['de', 'tr']
+    )
+    continents = list(Continent.objects.order_by('code'))
+    for lang in ['de', 'tr']:
+        with Context(continents) as context:
+            context.read(lang)
+            context.update(lang)
+    Continent.objects.filter(code='EU').update(name='The Europe')
+    Continent.objects.filter(code='AS').update(denonym='Asiatic')
+
+
+class CommandTest(TestCase):
+    """Tests for `Command`."""
+
+    def test_get_content_types(self):
+        command = Command()
+        self.assertCountEqual(
+            command.get_content_types('sample.Continent', 'sample.City'),
+            [
+                ContentType.objects.get_for_model(Continent),
+                ContentType.objects.get_for_model(City),
+            ]
+        )
+
+    def test_get_content_types_all(self):
+        command = Command()
+        content_types = command.get_content_types()
+        self.assertIn(
+            ContentType.objects.get_for_model(Continent),
+            content_types
+        )
+        self.assertNotIn(
+            ContentType.objects.get_for_model(ContentType),
+            content_types
+        )
+
+    def test_get_content_types_not_translatable(self):
+        command = Command()
+        with self.assertRaises(CommandError) as error:
+            command.get_content_types('contenttypes.ContentType')
+
+        self.assertEqual(
+            error.exception.args[0],
+            "Model 'contenttypes.ContentType' is not Translatable."
+        )
+
+    def test_get_stale_translations_invalid_language(self):
+        command = Command()
+        with self.assertRaises(CommandError) as error:
+            command.get_stale_translations([], ['xx'])
+
+        self.assertEqual(
+            error.exception.args[0],
+            '`xx` is not a supported language.'
+        )
+
+    def test_handle(self):
+        create_stale_translations()
+
+        stdout = StringIO()
+        call_command('checktranslations', 'sample.Continent', stdout=stdout)
+
+        self.assertEqual(
+            stdout.getvalue(),
+            'Found 2 stale translations of `sample.Continent` in `de`.\n' +
+            'Found 2 stale translations of `sample.Continent` in `tr`.\n' +
+            'Check successful.\n'
+        )
+
+    def test_handle_language_verbose(self):
+        create_stale_translations()
+
+        stdout = StringIO()
+        call_command(
+            'checktranslations',
+            'sample.Continent',
+            languages=['de'],
+            verbosity=2,
+            stdout=stdout,
+        )
+
+        self.assertEqual(
+            stdout.getvalue(),
+            'Found 2 stale translations of `sample.Continent` in `de`.\n' +
+            '  AS: denonym\n' +
+            '  EU: name\n' +
+            'Check successful.\n'
+        )
+
+    def test_handle_fresh(self):
+        stdout = StringIO()
+        call_command('checktranslations', stdout=stdout)
+
+        self.assertEqual(stdout.getvalue(), 'Check successful.\n')
@@ -0,0 +1,113 @@
+from io import StringIO
+
+from django.test import TestCase
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from translations.models import Translation
+
+from sample.models import Continent, Country
+from sample.utils import create_samples
+
+
+def create_translations():
+    create_samples(
+        continent_names=['europe'],
+        country_names=['germany'],
+        continent_fields=['name', 'denonym'],
+        country_fields=['name'],
+        langs=['de'],
+    )
+
+
+class CommandTest(TestCase):
+    """Tests for `Command`."""
+
+    def test_handle(self):
+        create_translations()
+
+        stdout = StringIO()
+        call_command('clonetranslations', 'de', 'tr', stdout=stdout)
+
+        self.assertEqual(
+            stdout.getvalue(),
+            'Cloned 3 translations from `de` to `tr`.\n' +
+            'Cloning successful.\n'
+        )
+        self.assertEqual(Translation.objects.filter(language='tr').count(), 3)
+
+    def test_handle_models(self):
+        create_translations()
+
+        stdout = StringIO()
+        call_command(
+            'clonetranslations', 'de', 'tr', 'sample.Country',
+            stdout=stdout,
+        )
+
+        self.assertEqual(
+            stdout.getvalue(),
+            'Cloned 1 translations of `sample.Country` from `de` to `tr`.\n' +
+            'Cloning successful.\n'
+        )
+        self.assertEqual(
+            Country.objects.translate('tr').get().name, 'Deutschland'
+        )
+        self.assertEqual(
+            Continent.objects.translate('tr').get().name, 'Europe'
+        )
+
+    def test_handle_skip_conflicts(self):
+        create_translations()
+        call_command(
+            'clonetranslations', 'de', 'tr', 'sample.Country',
+            stdout=StringIO(),
+        )
+
+        stdout = StringIO()
+        call_command(
+            'clonetranslations', 'de', 'tr', skip_conflicts=True,
+            stdout=stdout,
+        )
+
+        self.assertEqual(
+            stdout.getvalue(),
+            'Cloned 2 translations from `de` to `tr`.\n' +
+            'Cloning successful.\n'
+        )
+
+    def test_handle_same_language(self):
+        with self.assertRaises(CommandError) as error:
+            call_command('clonetranslations', 'de', 'de')
+
+        self.assertEqual(
+            error.exception.args[0],
+            'Cannot clone `de` to itself.'
+        )
+
+    def test_handle_invalid_language(self):
+        with self.assertRaises(CommandError) as error:
+            call_command('clonetranslations', 'de', 'xx')
+
+        self.assertEqual(
+            error.exception.args[0],
+            '`xx` is not a supported language.'
+        )
+
+    def test_handle_not_found(self):
+        with self.assertRaises(CommandError) as error:
+            call_command('clonetranslations', 'de', 'tr', 'tests.Village')
+
+        self.assertEqual(
+            error.exception.args[0],
+            "Model 'tests.Village' is not found."
+        )
+
+    def test_handle_not_translatable(self):
+        with self.assertRaises(CommandError) as error:
+            call_command('clonetranslations', 'de', 'tr', 'auth.User')
+
+        self.assertEqual(
+            error.exception.args[0],
+            "Model 'auth.User' is not Translatable."
+        )
@@ -0,0 +1,203 @@
+import os
+import shutil
+import tempfile
+from io import StringIO
+
+from django.test import TestCase
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.contrib.contenttypes.models import ContentType
+
+from translations.catalogs import _Catalog, _get_catalog_path
+
+from sample.models import Continent, Country
+from sample.utils import create_samples
+
+
+class CommandTest(TestCase):
+    """Tests for `Command`."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_handle_one_model_one_language(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        stdout = StringIO()
+        call_command(
+            'compiletranslations',
+            'sample.Continent',
+            language=['de'],
+            output=self.directory,
+            stdout=stdout,
+        )
+
+        self.assertEqual(
+            stdout.getvalue(),
+            'Compiled 4 translations in `de`.\n' +
+            'Compilation successful.\n'
+        )
+        self.assertListEqual(os.listdir(self.directory), ['de.catalog'])
+
+        continent_ct = ContentType.objects.get_for_model(Continent)
+        catalog = _Catalog(_get_catalog_path(self.directory, 'de'))
+        self.assertSetEqual(catalog.ct_ids, {continent_ct.id})
+        self.assertDictEqual(
+            catalog.get_texts(continent_ct.id, 'EU'),
+            {'name': 'Europa', 'denonym': 'Europäisch'}
+        )
+        self.assertDictEqual(
+            catalog.get_texts(continent_ct.id, 'AS'),
+            {'name': 'Asien', 'denonym': 'Asiatisch'}
+        )
+
+    def test_handle_two_models_all_languages(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            continent_fields=['name'],
+            country_fields=['name'],
+            langs=['de', 'tr']
+        )
+
+        with self.settings(TRANSLATIONS_CATALOGS=self.directory):
+            call_command(
+                'compiletranslations',
+                'sample.Continent',
+                'sample.Country',
+                verbosity=0,
+                stdout=StringIO(),
+            )
+
+        self.assertListEqual(
+            sorted(os.listdir(self.directory)),
+            ['de.catalog', 'en-gb.catalog', 'tr.catalog']
+        )
+
+        country_ct = ContentType.objects.get_for_model(Country)
+        catalog = _Catalog(_get_catalog_path(self.directory, 'tr'))
+        self.assertDictEqual(
+            catalog.get_texts(country_ct.id, 'DE'),
+            {'name': 'Almanya'}
+        )
+        catalog = _Catalog(_get_catalog_path(self.directory, 'en-gb'))
+        self.assertDictEqual(catalog.get_texts(country_ct.id, 'DE'), {})
+
+    def test_handle_keeps_other_models(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            continent_fields=['name'],
+            country_fields=['name'],
+            langs=['de']
+        )
+
+        for model_label in ['sample.Continent', 'sample.Country']:
+            call_command(
+                'compiletranslations',
+                model_label,
+                language=['de'],
+                output=self.directory,
+                stdout=StringIO(),
+            )
+
+        continent_ct = ContentType.objects.get_for_model(Continent)
+        country_ct = ContentType.objects.get_for_model(Country)
+        catalog = _Catalog(_get_catalog_path(self.directory, 'de'))
+        self.assertSetEqual(catalog.ct_ids, {continent_ct.id, country_ct.id})
+        self.assertDictEqual(
+            catalog.get_texts(continent_ct.id, 'EU'),
+            {'name': 'Europa'}
+        )
+        self.assertDictEqual(
+            catalog.get_texts(country_ct.id, 'DE'),
+            {'name': 'Deutschland'}
+        )
+
+    def test_handle_replace(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            continent_fields=['name'],
+            country_fields=['name'],
+            langs=['de']
+        )
+
+        call_command(
+            'compiletranslations',
+            'sample.Continent',
+            language=['de'],
+            output=self.directory,
+            stdout=StringIO(),
+        )
+        call_command(
+            'compiletranslations',
+            'sample.Country',
+            language=['de'],
+            output=self.directory,
+            replace=True,
+            stdout=StringIO(),
+        )
+
+        continent_ct = ContentType.objects.get_for_model(Continent)
+        country_ct = ContentType.objects.get_for_model(Country)
+        catalog = _Catalog(_get_catalog_path(self.directory, 'de'))
+        self.assertSetEqual(catalog.ct_ids, {country_ct.id})
+        self.assertDictEqual(catalog.get_texts(continent_ct.id, 'EU'), {})
+
+    def test_handle_no_output(self):
+        with self.assertRaises(CommandError) as error:
+            call_command('compiletranslations', 'sample.Continent')
+
+        self.assertEqual(
+            error.exception.args[0],
+            'Specify the output directory with --output or the ' +
+            'TRANSLATIONS_CATALOGS setting.'
+        )
+
+    def test_handle_invalid_model(self):
+        with self.assertRaises(CommandError) as error:
+            call_command(
+                'compiletranslations',
+                'sample.Planet',
+                output=self.directory,
+            )
+
+        self.assertEqual(
+            error.exception.args[0],
+            "Model 'sample.Planet' is not found."
+        )
+
+    def test_handle_untranslatable_model(self):
+        with self.assertRaises(CommandError) as error:
+            call_command(
+                'compiletranslations',
+                'auth.User',
+                output=self.directory,
+            )
+
+        self.assertEqual(
+            error.exception.args[0],
+            "Model 'auth.User' is not Translatable."
+        )
+
+    def test_handle_invalid_language(self):
+        with self.assertRaises(CommandError) as error:
+            call_command(
+                'compiletranslations',
+                'sample.Continent',
+                language=['xx'],
+                output=self.directory,
+            )
+
+        self.assertEqual(
+            error.exception.args[0],
+            '`xx` is not a supported language.'
+        )
@@ -0,0 +1,175 @@
+from io import StringIO
+
+from django.test import TestCase
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.contrib.contenttypes.models import ContentType
+
+from translations.models import Translation
+from translations.management.commands.compresstranslations import Command
+
+from sample.models import City
+from sample.utils import create_samples
+
+from tests.models import Monument, Street
+
+
+LONG_TEXT = 'Ein gotischer Dom. ' * 10
+
+
+def create_monuments():
+    create_samples(
+        continent_names=['europe'],
+        country_names=['germany'],
+        city_names=['cologne'],
+        langs=['de']
+    )
+    cologne = City.objects.get(name='Cologne')
+    cathedral = Monument.objects.create(name='Cathedral', city=cologne)
+    Translation.objects.bulk_create([
+        Translation(
+            content_type=ContentType.objects.get_for_model(Monument),
+            object_id=str(cathedral.pk),
+            field=field,
+            language='de',
+            text=text,
+        ) for (field, text) in [('name', 'Dom'),
+                                ('description', LONG_TEXT)]
+    ])
+    return cathedral
+
+
+class CommandTest(TestCase):
+    """Tests for `Command`."""
+
+    def test_get_models(self):
+        command = Command()
+        self.assertListEqual(
+            command.get_models('tests.Monument'),
+            [Monument]
+        )
+
+    def test_get_models_not_compressed(self):
+        command = Command()
+        with self.assertRaises(CommandError) as error:
+            command.get_models('sample.City')
+
+        self.assertEqual(
+            error.exception.args[0],
+            "Model 'sample.City' has no compressed translations."
+        )
+
+    def test_get_models_benchmark(self):
+        command = Command()
+        self.assertListEqual(
+            command.get_models('sample.City', benchmark=True),
+            [City]
+        )
+
+    def test_get_models_benchmark_no_table(self):
+        command = Command()
+        with self.assertRaises(CommandError) as error:
+            command.get_models('tests.Street', benchmark=True)
+
+        self.assertEqual(
+            error.exception.args[0],
+            "Model 'tests.Street' has no translations in the translation "
+            "table."
+        )
+
+    def test_get_models_not_found(self):
+        command = Command()
+        with self.assertRaises(CommandError) as error:
+            command.get_models('tests.Nothing')
+
+        self.assertEqual(
+            error.exception.args[0],
+            "Model 'tests.Nothing' is not found."
+        )
+
+    def test_get_threshold(self):
+        command = Command()
+        self.assertEqual(command.get_threshold(Monument), 64)
+        self.assertEqual(command.get_threshold(Street), 1024)
+        self.assertEqual(command.get_threshold(Monument, 16), 16)
+
+    def test_handle(self):
+        cathedral = create_monuments()
+
+        stdout = StringIO()
+        call_command(
+            'compresstranslations',
+            'tests.Monument',
+            chunk_size=1,
+            stdout=stdout,
+        )
+
+        self.assertEqual(
+            stdout.getvalue(),
+            'Compressed 1 translations of `tests.Monument`.\n' +
+            'Compression successful.\n'
+        )
+        name = cathedral.translations.get(field='name')
+        description = cathedral.translations.get(field='description')
+        self.assertIsNone(name.compressed_text)
+        self.assertEqual(description.text, '')
+        self.assertEqual(description.get_text(), LONG_TEXT)
+
+    def test_handle_twice(self):
+        create_monuments()
+        call_command('compresstranslations', 'tests.Monument',
+                     stdout=StringIO())
+
+        stdout = StringIO()
+        call_command(
+            'compresstranslations',
+            'tests.Monument',
+            stdout=stdout,
+        )
+
+        self.assertEqual(
+            stdout.getvalue(),
+            'Compressed 0 translations of `tests.Monument`.\n' +
+            'Compression successful.\n'
+        )
+
+    def test_benchmark(self):
+        create_monuments()
+        command = Command()
+
+        results = command.benchmark(Monument, 64)
+
+        self.assertListEqual(
+            [result[:2] for result in results],
+            [('zlib', 1), ('lzma', 1)]
+        )
+        for (method, count, raw_size, stored_size, elapsed) in results:
+            self.assertEqual(raw_size, len('Dom') + len(LONG_TEXT))
+            self.assertLess(stored_size, raw_size)
+
+    def test_handle_benchmark(self):
+        create_monuments()
+
+        stdout = StringIO()
+        call_command(
+            'compresstranslations',
+            'tests.Monument',
+            benchmark=True,
+            threshold=1024,
+            stdout=stdout,
+        )
+
+        self.assertEqual(
+            stdout.getvalue(),
+            '`tests.Monument` with zlib: 0 translations compressed, '
+            '193 bytes stored of 193 (100.0%), 0.0 µs per compressed '
+            'read.\n' +
+            '`tests.Monument` with lzma: 0 translations compressed, '
+            '193 bytes stored of 193 (100.0%), 0.0 µs per compressed '
+            'read.\n' +
+            'Benchmark successful.\n'
+        )
+        self.assertEqual(
+            Translation.objects.filter(compressed_text__isnull=False).count(),
+            0
+        )
@@ -0,0 +1,162 @@
+from io import StringIO
+
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.core.cache import caches
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.contrib.contenttypes.models import ContentType
+
+from translations.models import Translation
+from translations.context import Context
+from translations import cache as translations_cache
+
+from sample.models import City
+from sample.utils import create_samples
+
+from tests.models import District
+
+
+class CommandTest(TestCase):
+    """Tests for `Command`."""
+
+    def test_handle(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+            langs=['de']
+        )
+        cologne = City.objects.get(name='Cologne')
+        old_town = District.objects.create(name='Old Town', city=cologne)
+        harbour = District.objects.create(name='Harbour', city=cologne)
+        District.objects.filter(pk=harbour.pk).update(name_de='Stale')
+        Translation.objects.bulk_create([
+            Translation(
+                content_type=ContentType.objects.get_for_model(District),
+                object_id=str(old_town.pk),
+                field=field,
+                language='de',
+                text=text,
+            ) for (field, text) in [('name', 'Altstadt'),
+                                    ('description', 'Alt.')]
+        ])
+
+        stdout = StringIO()
+        call_command(
+            'materializetranslations',
+            'tests.District',
+            chunk_size=1,
+            stdout=stdout,
+        )
+
+        self.assertEqual(
+            stdout.getvalue(),
+            'Filled 2 translations of `tests.District` in `de`.\n' +
+            'Materialization successful.\n'
+        )
+        self.assertQuerysetEqual(
+            District.objects.order_by('id').values_list(
+                'name_de', 'description_de'
+            ),
+            ["('Altstadt', 'Alt.')", '(None, None)']
+        )
+
+    def test_handle_queries(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+        )
+        cologne = City.objects.get(name='Cologne')
+        districts = District.objects.bulk_create([
+            District(name='District {}'.format(i), city=cologne)
+            for i in range(50)
+        ])
+        Translation.objects.bulk_create([
+            Translation(
+                content_type=ContentType.objects.get_for_model(District),
+                object_id=str(district.pk),
+                field='name',
+                language='de',
+                text='Bezirk {}'.format(i),
+            ) for (i, district) in enumerate(
+                District.objects.order_by('id')
+            )
+        ])
+
+        # savepoint, objects, translations, update, no more objects, release
+        with self.assertNumQueries(6):
+            call_command(
+                'materializetranslations',
+                'tests.District',
+                stdout=StringIO(),
+            )
+
+        self.assertEqual(
+            District.objects.filter(name_de__startswith='Bezirk').count(),
+            len(districts)
+        )
+
+    def test_handle_not_materialized(self):
+        with self.assertRaises(CommandError) as error:
+            call_command(
+                'materializetranslations', 'tests.District', language=['tr']
+            )
+
+        self.assertEqual(
+            error.exception.args[0],
+            "Model 'tests.District' does not materialize `tr`."
+        )
+
+    def test_handle_not_found(self):
+        with self.assertRaises(CommandError) as error:
+            call_command('materializetranslations', 'tests.Village')
+
+        self.assertEqual(
+            error.exception.args[0],
+            "Model 'tests.Village' is not found."
+        )
+
+
+@override_settings(
+    CACHES={
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        },
+    },
+    TRANSLATIONS_CACHE=True,
+    TRANSLATIONS_VERSION_CHECK_INTERVAL=None,
+)
+class CommandCacheTest(TransactionTestCase):
+    """Tests for `Command` with the translations cache."""
+
+    def setUp(self):
+        caches['default'].clear()
+        # the versions get checked by the first read of each test only
+        translations_cache._translation_versions_checked = None
+
+    def test_handle_stale_cache(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+        )
+        cologne = City.objects.get(name='Cologne')
+        old_town = District.objects.create(name='Old Town', city=cologne)
+        with Context(old_town) as context:
+            old_town.name = 'Altstadt'
+            context.create('de')
+            context.read('de')
+        # a write which bypasses the invalidation leaves the cache stale
+        Translation.objects.filter(field='name').update(text='Altstädtchen')
+
+        call_command(
+            'materializetranslations',
+            'tests.District',
+            stdout=StringIO(),
+        )
+
+        self.assertEqual(
+            District.objects.get().name_de,
+            'Altstädtchen'
+        )
@@ -0,0 +1,111 @@
+from io import StringIO
+
+from django.test import TestCase
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.contrib.contenttypes.models import ContentType
+
+from translations.models import Translation
+
+from sample.models import City
+from sample.utils import create_samples
+
+from tests.models import Street, StreetTranslation
+
+
+class CommandTest(TestCase):
+    """Tests for `Command`."""
+
+    def create_streets(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+            city_fields=['name', 'denonym'],
+            langs=['de']
+        )
+        cologne = City.objects.get(name='Cologne')
+        street_ct = ContentType.objects.get_for_model(Street)
+        for (name, text) in [('Cathedral Square', 'Domplatte'),
+                             ('Ring', 'Ringe')]:
+            street = Street.objects.create(name=name, city=cologne)
+            Translation.objects.create(
+                content_type=street_ct,
+                object_id=street.pk,
+                field='name',
+                language='de',
+                text=text,
+            )
+        Translation.objects.create(
+            content_type=street_ct,
+            object_id='1000',
+            field='name',
+            language='de',
+            text='Weg',
+        )
+
+    def test_handle(self):
+        self.create_streets()
+
+        stdout = StringIO()
+        call_command(
+            'movetranslations',
+            'tests.Street',
+            chunk_size=2,
+            stdout=stdout,
+        )
+
+        self.assertEqual(
+            stdout.getvalue(),
+            'Moved 2 translations of `tests.Street`.\n' +
+            'Dropped 1 translations of missing `tests.Street` objects.\n' +
+            'Move successful.\n'
+        )
+        self.assertQuerysetEqual(
+            StreetTranslation.objects.order_by('id').values_list(
+                'source__name', 'text'
+            ),
+            [
+                "('Cathedral Square', 'Domplatte')",
+                "('Ring', 'Ringe')",
+            ]
+        )
+        self.assertFalse(
+            Translation.objects.filter(
+                content_type=ContentType.objects.get_for_model(Street),
+            ).exists()
+        )
+        self.assertEqual(
+            Translation.objects.filter(
+                content_type=ContentType.objects.get_for_model(City),
+            ).count(),
+            2
+        )
+
+    def test_handle_translated(self):
+        self.create_streets()
+
+        call_command('movetranslations', 'tests.Street', verbosity=0,
+                     stdout=StringIO())
+
+        streets = Street.objects.translate('de').order_by('id')
+        self.assertEqual(streets[0].name, 'Domplatte')
+        self.assertEqual(streets[1].name, 'Ringe')
+
+    def test_handle_not_found(self):
+        with self.assertRaises(CommandError) as error:
+            call_command('movetranslations', 'tests.Avenue')
+
+        self.assertEqual(
+            error.exception.args[0],
+            "Model 'tests.Avenue' is not found."
+        )
+
+    def test_handle_no_dedicated_table(self):
+        with self.assertRaises(CommandError) as error:
+            call_command('movetranslations', 'sample.City')
+
+        self.assertEqual(
+            error.exception.args[0],
+            "Model 'sample.City' has no dedicated translation table."
+        )
@@ -0,0 +1,166 @@
+from io import StringIO
+from unittest import skipIf, skipUnless
+from unittest.mock import patch, MagicMock
+
+from django.test import TestCase
+from django.db import connection
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from translations.management.commands.partitiontranslations import Command
+from translations.context import Context
+
+from sample.models import Continent
+from sample.utils import create_samples
+
+
+class CommandTest(TestCase):
+    """Tests for `Command`."""
+
+    @skipIf(connection.vendor == 'postgresql', 'PostgreSQL is supported.')
+    def test_handle_unsupported_backend(self):
+        with self.assertRaises(CommandError) as error:
+            call_command('partitiontranslations')
+
+        self.assertEqual(
+            error.exception.args[0],
+            'Partitioning the translations is only supported on PostgreSQL.'
+        )
+
+    def test_get_languages(self):
+        command = Command()
+
+        self.assertListEqual(
+            command.get_languages(['de', 'tr']),
+            ['de', 'tr']
+        )
+        self.assertListEqual(
+            command.get_languages(),
+            ['en-gb', 'de', 'tr']
+        )
+
+    def test_get_languages_unsupported(self):
+        with self.assertRaises(CommandError) as error:
+            Command().get_languages(['xx'])
+
+        self.assertEqual(
+            error.exception.args[0],
+            '`xx` is not a supported language.'
+        )
+
+    def test_get_statements_unpartitioned(self):
+        command = Command()
+        rows = [
+            [],
+            [('translations_translation_pkey', 'PRIMARY KEY (id)')],
+            [],
+            [('public.translations_translation_id_seq',)],
+        ]
+        with patch.object(command, 'fetch', side_effect=rows):
+            statements = command.get_statements(MagicMock(), ['de'])
+
+        self.assertEqual(
+            statements[0],
+            'ALTER TABLE "translations_translation" RENAME TO '
+            '"translations_translation_unpartitioned"'
+        )
+        self.assertIn(
+            'ALTER TABLE "translations_translation" ADD CONSTRAINT '
+            '"translations_translation_pkey" PRIMARY KEY (id, "language")',
+            statements
+        )
+
+    def test_get_statements_partitioned(self):
+        command = Command()
+        rows = [
+            [(1,)],
+            [("FOR VALUES IN ('de')",), ('DEFAULT',)],
+        ]
+        with patch.object(command, 'fetch', side_effect=rows):
+            statements = command.get_statements(MagicMock(), ['de', 'tr'])
+
+        self.assertEqual(len(statements), 5)
+        self.assertEqual(
+            statements[1],
+            'CREATE TABLE "translations_translation_tr" PARTITION OF '
+            '"translations_translation" FOR VALUES IN (\'tr\')'
+        )
+
+
+@skipUnless(connection.vendor == 'postgresql', 'PostgreSQL is not used.')
+class CommandPostgreSQLTest(TestCase):
+    """Tests for `Command` on PostgreSQL."""
+
+    def setUp(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr'],
+        )
+        # the table cannot be altered with the foreign key checks pending
+        with connection.cursor() as cursor:
+            cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+
+    def get_partitions(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT c.relname, COUNT(t.id) '
+                'FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid '
+                'LEFT JOIN translations_translation t '
+                'ON t.tableoid = c.oid '
+                "WHERE i.inhparent = 'translations_translation'::regclass "
+                'GROUP BY c.relname ORDER BY c.relname'
+            )
+            return cursor.fetchall()
+
+    def test_handle(self):
+        call_command('partitiontranslations', language=['de'],
+                     stdout=StringIO())
+
+        self.assertListEqual(
+            self.get_partitions(),
+            [
+                ('translations_translation_de', 4),
+                ('translations_translation_default', 4),
+            ]
+        )
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('tr')
+            self.assertEqual(europe.name, 'Avrupa')
+            europe.name = 'Avrupa (yeni)'
+            context.update('tr')
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('tr')
+
+        self.assertEqual(europe.name, 'Avrupa (yeni)')
+
+    def test_handle_repartition(self):
+        call_command('partitiontranslations', language=['de'],
+                     stdout=StringIO())
+        call_command('partitiontranslations', language=['de', 'tr'],
+                     stdout=StringIO())
+
+        self.assertListEqual(
+            self.get_partitions(),
+            [
+                ('translations_translation_de', 4),
+                ('translations_translation_default', 0),
+                ('translations_translation_tr', 4),
+            ]
+        )
+
+    def test_handle_sql(self):
+        stdout = StringIO()
+        call_command('partitiontranslations', language=['de'], sql=True,
+                     stdout=stdout)
+
+        self.assertIn(
+            'CREATE TABLE "translations_translation_de" PARTITION OF '
+            '"translations_translation" FOR VALUES IN (\'de\');',
+            stdout.getvalue()
+        )
+        self.assertListEqual(self.get_partitions(), [])
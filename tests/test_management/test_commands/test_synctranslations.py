@@ -3,6 +3,7 @@ from contextlib import ContextDecorator
 from unittest.mock import patch
 
 from django.test import TestCase
+from django.db import models, connections
 from django.core.management import call_command
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.auth.models import User
@@ -73,7 +74,10 @@ class CommandTest(TestCase):
     def test_execute(self):
         stdout = StringIO()
         command = Command(stdout=stdout)
-        command.run_from_argv(['manage.py', 'synctranslations'])
+        # `run_from_argv` closes the connections, which would end the test
+        # transaction on a file database
+        with patch.object(connections, 'close_all'):
+            command.run_from_argv(['manage.py', 'synctranslations'])
 
         self.assertIs(
             hasattr(command, 'stdin'),
@@ -100,7 +104,19 @@ class CommandTest(TestCase):
                 ('sample', 'country'),
                 ('sample', 'timezone'),
                 ('sessions', 'session'),
+                ('tests', 'district'),
+            ] + (
+                [('tests', 'landmark')] if hasattr(models, 'JSONField')
+                else []
+            ) + [
+                ('tests', 'monument'),
+                ('tests', 'park'),
+                ('tests', 'street'),
+                ('tests', 'streettranslation'),
                 ('translations', 'translation'),
+                ('translations', 'translationrevision'),
+                ('translations', 'translationtext'),
+                ('translations', 'translationversion'),
             ]
         )
 
@@ -136,6 +152,9 @@ class CommandTest(TestCase):
                 ('sample', 'country'),
                 ('sample', 'timezone'),
                 ('translations', 'translation'),
+                ('translations', 'translationrevision'),
+                ('translations', 'translationtext'),
+                ('translations', 'translationversion'),
             ]
         )
 
@@ -163,6 +182,9 @@ class CommandTest(TestCase):
                 ('sample', 'timezone'),
                 ('sessions', 'session'),
                 ('translations', 'translation'),
+                ('translations', 'translationrevision'),
+                ('translations', 'translationtext'),
+                ('translations', 'translationversion'),
             ]
         )
 
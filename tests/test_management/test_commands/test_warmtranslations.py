@@ -0,0 +1,126 @@
+from io import StringIO
+
+from django.test import TransactionTestCase, override_settings
+from django.core.cache import caches
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from translations.context import Context
+from translations import cache as translations_cache
+
+from sample.models import Continent
+from sample.utils import create_samples
+
+
+@override_settings(
+    CACHES={
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        },
+    },
+    TRANSLATIONS_CACHE=True,
+    TRANSLATIONS_VERSION_CHECK_INTERVAL=None,
+)
+class CommandTest(TransactionTestCase):
+    """Tests for `Command`."""
+
+    def setUp(self):
+        caches['default'].clear()
+        # the versions get checked by the first read of each test only
+        translations_cache._translation_versions_checked = None
+
+    def test_handle_one_model(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        stdout = StringIO()
+        call_command(
+            'warmtranslations',
+            'sample.Continent',
+            language=['de'],
+            stdout=stdout,
+        )
+
+        self.assertEqual(
+            stdout.getvalue(),
+            'Loaded 4 translations of `sample.Continent`.\n' +
+            'Warm-up successful.\n'
+        )
+
+        europe = Continent.objects.get(code='EU')
+        with self.assertNumQueries(0):
+            with Context(europe) as context:
+                context.read('de')
+
+        self.assertEqual(europe.name, 'Europa')
+
+    @override_settings(TRANSLATIONS_WARMUP={
+        'sample.Continent': ['tr'],
+        'sample.Country': None,
+    })
+    def test_handle_configured_models(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        stdout = StringIO()
+        call_command('warmtranslations', chunk_size=1, stdout=stdout)
+
+        self.assertEqual(
+            stdout.getvalue(),
+            'Loaded 2 translations of `sample.Continent`.\n' +
+            'Loaded 4 translations of `sample.Country`.\n' +
+            'Warm-up successful.\n'
+        )
+
+    @override_settings(TRANSLATIONS_WARMUP={
+        'sample.Planet': None,
+    })
+    def test_handle_invalid_configured_model(self):
+        with self.assertRaises(CommandError) as error:
+            call_command('warmtranslations')
+
+        self.assertEqual(
+            error.exception.args[0],
+            "App 'sample' doesn't have a 'Planet' model."
+        )
+
+    def test_handle_invalid_model(self):
+        with self.assertRaises(CommandError) as error:
+            call_command('warmtranslations', 'sample.Planet')
+
+        self.assertEqual(
+            error.exception.args[0],
+            "Model 'sample.Planet' is not found."
+        )
+
+    def test_handle_untranslatable_model(self):
+        with self.assertRaises(CommandError) as error:
+            call_command('warmtranslations', 'auth.User')
+
+        self.assertEqual(
+            error.exception.args[0],
+            "Model 'auth.User' is not Translatable."
+        )
+
+    def test_handle_invalid_language(self):
+        with self.assertRaises(CommandError) as error:
+            call_command(
+                'warmtranslations',
+                'sample.Continent',
+                language=['xx'],
+            )
+
+        self.assertEqual(
+            error.exception.args[0],
+            '`xx` is not a supported language.'
+        )
@@ -0,0 +1,233 @@
+from django.test import TestCase
+from django.test.utils import isolate_apps
+from django.db import models
+from django.core.exceptions import ImproperlyConfigured
+from django.contrib.contenttypes.models import ContentType
+
+from translations.models import Translation, Translatable, \
+    TranslationVersion
+from translations.context import Context
+from translations.materialized import _get_shadow_name, \
+    _get_materialized_mapping, _get_materialized_query
+
+from sample.models import City
+from sample.utils import create_samples
+
+from tests.models import District
+
+
+def create_districts():
+    create_samples(
+        continent_names=['europe'],
+        country_names=['germany'],
+        city_names=['cologne'],
+        city_fields=['name', 'denonym'],
+        langs=['de']
+    )
+    cologne = City.objects.get(name='Cologne')
+    District.objects.create(name='Old Town', city=cologne)
+    District.objects.create(name='Harbour', city=cologne)
+
+
+class MaterializedTest(TestCase):
+    """Tests for the materialized languages."""
+
+    def test_get_shadow_name(self):
+        self.assertEqual(_get_shadow_name('name', 'de'), 'name_de')
+        self.assertEqual(_get_shadow_name('name', 'en-gb'), 'name_en_gb')
+
+    def test_get_materialized_languages(self):
+        self.assertListEqual(District._get_materialized_languages(), ['de'])
+        self.assertListEqual(City._get_materialized_languages(), [])
+
+    def test_shadow_fields(self):
+        field = District._meta.get_field('name_de')
+
+        self.assertIsInstance(field, models.CharField)
+        self.assertEqual(field.max_length, 64)
+        self.assertIs(field.null, True)
+        self.assertIs(field.editable, False)
+        self.assertIsInstance(
+            District._meta.get_field('description_de'),
+            models.TextField
+        )
+        self.assertListEqual(
+            District._get_translatable_fields_names(),
+            ['name', 'description']
+        )
+
+    @isolate_apps('tests')
+    def test_shadow_fields_automatic(self):
+        with self.assertRaises(ImproperlyConfigured) as error:
+            class Village(Translatable):
+                name = models.CharField(max_length=64)
+
+                class TranslatableMeta:
+                    materialized_languages = ['de']
+
+        self.assertEqual(
+            error.exception.args[0],
+            '`tests.Village` must list its translatable fields to '
+            'materialize languages.'
+        )
+
+    def test_get_materialized_mapping(self):
+        create_districts()
+        cologne = City.objects.get(name='Cologne')
+        context = Context(cologne, 'districts')
+        ct_district = ContentType.objects.get_for_model(District)
+
+        self.assertListEqual(
+            list(_get_materialized_mapping(context.mapping, 'de').keys()),
+            [ct_district.id]
+        )
+        self.assertDictEqual(
+            _get_materialized_mapping(context.mapping, 'tr'),
+            {}
+        )
+
+    def test_create_read(self):
+        create_districts()
+        old_town = District.objects.get(name='Old Town')
+
+        with Context(old_town) as context:
+            old_town.name = 'Altstadt'
+            context.create('de')
+
+        old_town = District.objects.get(name='Old Town')
+        self.assertEqual(old_town.name_de, 'Altstadt')
+        self.assertEqual(
+            old_town.translations.get(field='name', language='de').text,
+            'Altstadt'
+        )
+
+        with self.assertNumQueries(0):
+            with Context(old_town) as context:
+                context.read('de')
+        self.assertEqual(old_town.name, 'Altstadt')
+
+    def test_read_other_language(self):
+        create_districts()
+        old_town = District.objects.get(name='Old Town')
+
+        with Context(old_town) as context:
+            old_town.name = 'Eski Şehir'
+            context.create('tr')
+
+        old_town = District.objects.get(name='Old Town')
+        self.assertIsNone(old_town.name_de)
+
+        with Context(old_town) as context:
+            context.read('tr')
+        self.assertEqual(old_town.name, 'Eski Şehir')
+
+    def test_update(self):
+        create_districts()
+        old_town = District.objects.get(name='Old Town')
+
+        with Context(old_town) as context:
+            old_town.name = 'Altstadt'
+            context.create('de')
+            old_town.name = 'Altstädtchen'
+            context.update('de')
+
+        old_town.refresh_from_db()
+        self.assertEqual(old_town.name_de, 'Altstädtchen')
+
+    def test_update_queries(self):
+        create_districts()
+        cologne = City.objects.get(name='Cologne')
+        District.objects.bulk_create([
+            District(name='District {}'.format(i), city=cologne)
+            for i in range(98)
+        ])
+        districts = list(District.objects.order_by('id'))
+        # like after the first write, which creates it
+        TranslationVersion.objects.create(
+            content_type=ContentType.objects.get_for_model(District),
+            language='de',
+        )
+
+        for size in [10, 100]:
+            with Context(districts[:size]) as context:
+                for obj in districts[:size]:
+                    obj.name = '{} (de)'.format(obj.name)
+                # savepoints, delete, insert, materialize, bump the versions,
+                # releases
+                with self.assertNumQueries(8):
+                    context.update('de')
+                context.reset()
+
+        self.assertEqual(
+            District.objects.filter(name_de__endswith='(de)').count(),
+            100
+        )
+
+    def test_delete(self):
+        create_districts()
+        old_town = District.objects.get(name='Old Town')
+
+        with Context(old_town) as context:
+            old_town.name = 'Altstadt'
+            context.create('de')
+            context.delete('de')
+
+        old_town.refresh_from_db()
+        self.assertIsNone(old_town.name_de)
+        self.assertFalse(old_town.translations.filter(language='de').exists())
+
+    def test_translation_save_delete(self):
+        create_districts()
+        harbour = District.objects.get(name='Harbour')
+
+        translation = Translation.objects.create(
+            content_type=ContentType.objects.get_for_model(District),
+            object_id=harbour.pk,
+            field='name',
+            language='de',
+            text='Hafen',
+        )
+        harbour.refresh_from_db()
+        self.assertEqual(harbour.name_de, 'Hafen')
+
+        translation.delete()
+        harbour.refresh_from_db()
+        self.assertIsNone(harbour.name_de)
+
+    def test_get_materialized_query(self):
+        query, rest = _get_materialized_query(
+            District, ['districts'], 'name', 'icontains', 'stadt',
+            ['de', 'tr'],
+        )
+
+        self.assertEqual(
+            query,
+            models.Q(districts__name_de__icontains='stadt')
+        )
+        self.assertListEqual(rest, ['tr'])
+
+    def test_get_materialized_query_none(self):
+        query, rest = _get_materialized_query(
+            City, [], 'name', '', 'Köln', 'de',
+        )
+
+        self.assertEqual(query, models.Q())
+        self.assertEqual(rest, 'de')
+
+    def test_filter(self):
+        create_districts()
+        old_town = District.objects.get(name='Old Town')
+        with Context(old_town) as context:
+            old_town.name = 'Altstadt'
+            context.create('de')
+
+        districts = District.objects.probe('de').filter(name='Altstadt')
+        self.assertNotIn('translations_translation', str(districts.query))
+        self.assertQuerysetEqual(districts, ['<District: Old Town>'])
+
+        self.assertQuerysetEqual(
+            City.objects.probe(['de', 'tr']).filter(
+                districts__name__startswith='Alt'
+            ),
+            ['<City: Cologne>']
+        )
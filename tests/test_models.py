@@ -1,13 +1,42 @@
-from django.test import TestCase
+from contextlib import contextmanager
+
+from django.test import TestCase, override_settings
 from django.contrib.contenttypes.models import ContentType
 from django.db import utils
 
-from translations.models import Translation
+from translations.models import Translation, TranslationText, \
+    _route_integer_object_ids
+from translations.interned import _intern_texts
+from translations.sources import _get_source_hash
 
-from sample.models import Timezone, Continent, City
+from sample.models import Timezone, Continent, Country, City
 from sample.utils import create_samples
 
 
+def _reset_relation(relation, object_id_field_name):
+    """Reset the object id field of a translations relation."""
+    relation.object_id_field_name = object_id_field_name
+    # cached as `_related_fields` before Django 3.1
+    for name in ('_related_fields', 'related_fields', 'local_related_fields',
+                 'foreign_related_fields', 'reverse_related_fields'):
+        relation.__dict__.pop(name, None)
+
+
+@contextmanager
+def _integer_object_ids(*models):
+    """Route the translations relations of some models to the integer ids."""
+    relations = [model._meta.get_field('translations') for model in models]
+    with override_settings(TRANSLATIONS_INTEGER_OBJECT_IDS=True):
+        for (model, relation) in zip(models, relations):
+            _route_integer_object_ids(model)
+            _reset_relation(relation, relation.object_id_field_name)
+    try:
+        yield
+    finally:
+        for relation in relations:
+            _reset_relation(relation, 'object_id')
+
+
 class TranslationTest(TestCase):
     """Tests for `Translation`."""
 
@@ -159,6 +188,202 @@ class TranslationTest(TestCase):
              'translations_translation.language'),
         )
 
+    def test_object_int_id_filled(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+            langs=['de']
+        )
+        cologne = City.objects.get(name='Cologne')
+        city_ct = ContentType.objects.get_for_model(City)
+        translation = Translation.objects.create(
+            content_type=city_ct,
+            object_id=cologne.pk,
+            field='name',
+            language='de',
+            text='Köln'
+        )
+
+        translation.refresh_from_db()
+        self.assertEqual(translation.object_id, str(cologne.pk))
+        self.assertEqual(translation.object_int_id, cologne.pk)
+
+    def test_object_int_id_not_integer(self):
+        europe = Continent.objects.create(name='Europe', code='EU')
+        continent_ct = ContentType.objects.get_for_model(Continent)
+        translation = Translation.objects.create(
+            content_type=continent_ct,
+            object_id=europe.pk,
+            field='name',
+            language='de',
+            text='Europa'
+        )
+
+        translation.refresh_from_db()
+        self.assertEqual(translation.object_id, 'EU')
+        self.assertIsNone(translation.object_int_id)
+
+    def test_object_id_filled(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+            langs=['de']
+        )
+        cologne = City.objects.get(name='Cologne')
+        translation = cologne.translations.create(
+            field='name',
+            language='de',
+            text='Köln'
+        )
+
+        translation.refresh_from_db()
+        self.assertEqual(translation.object_id, str(cologne.pk))
+        self.assertEqual(translation.object_int_id, cologne.pk)
+
+    def test_object_ids_changed(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne', 'munich'],
+            city_fields=['name'],
+            langs=['de']
+        )
+        cologne = City.objects.get(name='Cologne')
+        munich = City.objects.get(name='Munich')
+
+        translation = cologne.translations.get(language='de')
+        translation.object_int_id = munich.pk
+        translation.field = 'denonym'
+        translation.save()
+        translation.refresh_from_db()
+        self.assertEqual(translation.object_id, str(munich.pk))
+
+        translation.object_id = str(cologne.pk)
+        translation.save()
+        translation.refresh_from_db()
+        self.assertEqual(translation.object_int_id, cologne.pk)
+
+    def test_bulk_create_object_int_ids(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+            langs=['de']
+        )
+        cologne = City.objects.get(name='Cologne')
+        city_ct = ContentType.objects.get_for_model(City)
+        Translation.objects.bulk_create([
+            Translation(
+                content_type=city_ct,
+                object_id=str(cologne.pk),
+                field='name',
+                language='de',
+                text='Köln'
+            ),
+        ])
+
+        self.assertEqual(
+            Translation.objects.get(content_type=city_ct).object_int_id,
+            cologne.pk,
+        )
+
+    def test_get_text_own(self):
+        europe = Continent.objects.create(name='Europe', code='EU')
+        continent_ct = ContentType.objects.get_for_model(Continent)
+        translation = Translation.objects.create(
+            content_type=continent_ct,
+            object_id=europe.pk,
+            field='name',
+            language='de',
+            text='Europa',
+        )
+
+        self.assertEqual(translation.get_text(), 'Europa')
+
+    def test_get_text_shared(self):
+        europe = Continent.objects.create(name='Europe', code='EU')
+        continent_ct = ContentType.objects.get_for_model(Continent)
+        ids = _intern_texts(['Europa'])
+        translation = Translation.objects.create(
+            content_type=continent_ct,
+            object_id=europe.pk,
+            field='name',
+            language='de',
+            text='',
+            shared_text_id=ids['Europa'],
+        )
+
+        self.assertEqual(translation.get_text(), 'Europa')
+        self.assertEqual(str(translation), 'Europe: Europa')
+
+    def test_save_changed_shared_text(self):
+        europe = Continent.objects.create(name='Europe', code='EU')
+        continent_ct = ContentType.objects.get_for_model(Continent)
+        ids = _intern_texts(['Europa'])
+        translation = Translation.objects.create(
+            content_type=continent_ct,
+            object_id=europe.pk,
+            field='name',
+            language='de',
+            text='',
+            shared_text_id=ids['Europa'],
+        )
+
+        translation.text = 'Europäischer Kontinent'
+        translation.save()
+        translation.refresh_from_db()
+
+        self.assertIsNone(translation.shared_text)
+        self.assertEqual(translation.get_text(), 'Europäischer Kontinent')
+        self.assertEqual(TranslationText.objects.count(), 1)
+
+    def test_save_changed_text_source_hash(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name'],
+            langs=['de'],
+        )
+        Translation.objects.update(source_hash=_get_source_hash('Europe'))
+        Continent.objects.update(name='The Europe')
+        self.assertEqual(Translation.objects.stale().count(), 1)
+
+        translation = Translation.objects.get()
+        translation.text = 'Das Europa'
+        translation.save()
+
+        self.assertEqual(
+            translation.source_hash,
+            _get_source_hash('The Europe')
+        )
+        self.assertQuerysetEqual(Translation.objects.stale(), [])
+
+    def test_save_same_text_source_hash(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name'],
+            langs=['de'],
+        )
+        Translation.objects.update(source_hash=_get_source_hash('Europe'))
+        Continent.objects.update(name='The Europe')
+
+        translation = Translation.objects.get()
+        translation.save()
+
+        self.assertEqual(Translation.objects.stale().count(), 1)
+
+
+class TranslationTextTest(TestCase):
+
+    def test_str(self):
+        ids = _intern_texts(['Europa'])
+
+        self.assertEqual(
+            str(TranslationText.objects.get(id=ids['Europa'])),
+            'Europa'
+        )
+
 
 class TranslatableTest(TestCase):
     """Tests for `Translatable`."""
@@ -264,3 +489,73 @@ class TranslatableTest(TestCase):
             Continent._get_translatable_fields_choices(),
             [(None, '---------'), ('name', 'Name'), ('denonym', 'Denonym')]
         )
+
+    def test_get_object_id_field_name_integer(self):
+        with _integer_object_ids(City, Timezone):
+            self.assertEqual(
+                City._get_object_id_field_name(),
+                'object_int_id'
+            )
+            self.assertEqual(
+                Timezone._get_object_id_field_name(),
+                'object_int_id'
+            )
+
+    def test_get_object_id_field_name_integer_default(self):
+        self.assertEqual(
+            City._get_object_id_field_name(),
+            'object_id'
+        )
+
+    def test_get_object_id_field_name_char(self):
+        self.assertEqual(
+            Continent._get_object_id_field_name(),
+            'object_id'
+        )
+        self.assertEqual(
+            Country._get_object_id_field_name(),
+            'object_id'
+        )
+
+    def test_translations_rel_integer_join(self):
+        with _integer_object_ids(City):
+            query = str(
+                City.objects.filter(translations__language='de').query
+            )
+
+        self.assertIn('"object_int_id"', query)
+        self.assertNotIn('CAST', query)
+
+    def test_translations_rel_integer_join_default(self):
+        query = str(
+            City.objects.filter(translations__language='de').query
+        )
+
+        self.assertNotIn('"object_int_id"', query)
+
+    def test_translations_rel_integer(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne', 'munich'],
+            city_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        cologne = City.objects.get(name='Cologne')
+
+        self.assertQuerysetEqual(
+            cologne.translations.order_by('id'),
+            [
+                '<Translation: Cologne: Köln>',
+                '<Translation: Cologner: Kölner>',
+            ]
+        )
+        self.assertQuerysetEqual(
+            City.objects.filter(
+                translations__text='Köln'
+            ).order_by('id'),
+            [
+                '<City: Cologne>',
+            ]
+        )
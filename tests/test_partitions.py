@@ -0,0 +1,126 @@
+from django.test import TestCase
+
+from translations.partitions import _get_partition_name, \
+    _get_default_partition_name, _get_partitioning_sql, \
+    _get_repartitioning_sql
+
+
+class GetPartitionNameTest(TestCase):
+    """Tests for `_get_partition_name`."""
+
+    def test_language(self):
+        self.assertEqual(
+            _get_partition_name('translations_translation', 'de'),
+            'translations_translation_de'
+        )
+
+    def test_accented_language(self):
+        self.assertEqual(
+            _get_partition_name('translations_translation', 'en-GB'),
+            'translations_translation_en_gb'
+        )
+
+    def test_default(self):
+        self.assertEqual(
+            _get_default_partition_name('translations_translation'),
+            'translations_translation_default'
+        )
+
+
+class GetPartitioningSQLTest(TestCase):
+    """Tests for `_get_partitioning_sql`."""
+
+    def test_statements(self):
+        statements = _get_partitioning_sql(
+            'translations_translation',
+            ['de', 'tr'],
+            [
+                ('translations_translation_pkey', 'PRIMARY KEY (id)'),
+                ('translations_translation_uniq',
+                 'UNIQUE (content_type_id, object_id, field, language)'),
+            ],
+            [
+                ('translation_ct_lang_int_idx',
+                 'CREATE INDEX translation_ct_lang_int_idx ON '
+                 'public.translations_translation USING btree '
+                 '(content_type_id, language, object_int_id)'),
+            ],
+            'public.translations_translation_id_seq',
+        )
+
+        self.assertListEqual(
+            statements,
+            [
+                'ALTER TABLE "translations_translation" RENAME TO '
+                '"translations_translation_unpartitioned"',
+                'CREATE TABLE "translations_translation" (LIKE '
+                '"translations_translation_unpartitioned" INCLUDING DEFAULTS)'
+                ' PARTITION BY LIST ("language")',
+                'CREATE TABLE "translations_translation_de" PARTITION OF '
+                '"translations_translation" FOR VALUES IN (\'de\')',
+                'CREATE TABLE "translations_translation_tr" PARTITION OF '
+                '"translations_translation" FOR VALUES IN (\'tr\')',
+                'CREATE TABLE "translations_translation_default" PARTITION '
+                'OF "translations_translation" DEFAULT',
+                'INSERT INTO "translations_translation" SELECT * FROM '
+                '"translations_translation_unpartitioned"',
+                'ALTER SEQUENCE public.translations_translation_id_seq '
+                'OWNED BY "translations_translation"."id"',
+                'DROP TABLE "translations_translation_unpartitioned"',
+                'ALTER TABLE "translations_translation" ADD CONSTRAINT '
+                '"translations_translation_pkey" PRIMARY KEY (id, "language")',
+                'ALTER TABLE "translations_translation" ADD CONSTRAINT '
+                '"translations_translation_uniq" UNIQUE '
+                '(content_type_id, object_id, field, language)',
+                'CREATE INDEX translation_ct_lang_int_idx ON '
+                '"translations_translation" USING btree '
+                '(content_type_id, language, object_int_id)',
+            ]
+        )
+
+    def test_no_sequence(self):
+        statements = _get_partitioning_sql(
+            'translations_translation', [], [], [],
+        )
+
+        self.assertNotIn(
+            'ALTER SEQUENCE',
+            ' '.join(statements)
+        )
+
+    def test_quoted_language(self):
+        statements = _get_partitioning_sql(
+            'translations_translation', ["x'y"], [], [],
+        )
+
+        self.assertIn(
+            'FOR VALUES IN (\'x\'\'y\')',
+            statements[2]
+        )
+
+
+class GetRepartitioningSQLTest(TestCase):
+    """Tests for `_get_repartitioning_sql`."""
+
+    def test_statements(self):
+        self.assertListEqual(
+            _get_repartitioning_sql('translations_translation', ['de']),
+            [
+                'ALTER TABLE "translations_translation" DETACH PARTITION '
+                '"translations_translation_default"',
+                'CREATE TABLE "translations_translation_de" PARTITION OF '
+                '"translations_translation" FOR VALUES IN (\'de\')',
+                'INSERT INTO "translations_translation" SELECT * FROM '
+                '"translations_translation_default" WHERE "language" = \'de\'',
+                'DELETE FROM "translations_translation_default" '
+                'WHERE "language" = \'de\'',
+                'ALTER TABLE "translations_translation" ATTACH PARTITION '
+                '"translations_translation_default" DEFAULT',
+            ]
+        )
+
+    def test_no_languages(self):
+        self.assertListEqual(
+            _get_repartitioning_sql('translations_translation', []),
+            []
+        )
@@ -1,8 +1,27 @@
-from django.test import TestCase, override_settings
+from unittest import mock, skipUnless
+
+try:
+    from asgiref.sync import async_to_sync
+except ImportError:  # Django < 3.0
+    async_to_sync = None
+
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.db import connection, transaction, IntegrityError, \
+    NotSupportedError
 from django.db.models import Q
+from django.db.models.signals import post_delete
 from django.utils.translation import override
+from django.contrib.contenttypes.models import ContentType
 
-from sample.models import Continent
+from translations.models import Translation, TranslationText, \
+    TranslationRevision
+from translations.context import Context
+from translations.sources import MD5
+
+from sample.models import Continent, Country, City
+from tests.models import Park, Monument, District, Street, \
+    StreetTranslation
 from sample.utils import create_samples
 
 
@@ -2321,3 +2340,1001 @@ class TranslatableQuerySetTest(TestCase):
             langs=['de']
         )
         Continent.objects.earliest('pk')
+
+
+class TranslatableQuerySetUpdateTest(TestCase):
+    """Tests for `TranslatableQuerySet.update`."""
+
+    def create_cities(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne', 'munich'],
+            city_fields=['name', 'denonym'],
+            langs=['de']
+        )
+        City.objects.filter(name='Munich').update(denonym='')
+        Translation.objects.filter(
+            object_id=str(City.objects.get(name='Munich').pk),
+        ).delete()
+        return list(City.objects.order_by('id'))
+
+    def get_texts(self, model, lang):
+        texts = {}
+        for obj in model.objects.order_by('pk'):
+            with Context(obj) as context:
+                context.read(lang)
+            texts[obj.pk] = {
+                field: getattr(obj, field)
+                for field in model._get_translatable_fields_names()
+            }
+        return texts
+
+    def test_default_language(self):
+        self.create_cities()
+
+        count = City.objects.filter(name='Cologne').update(name='Colonia')
+
+        self.assertEqual(count, 1)
+        self.assertTrue(City.objects.filter(name='Colonia').exists())
+
+    def test_translated(self):
+        cologne, munich = self.create_cities()
+
+        count = City.objects.translate('de').update(denonym='Stadtbewohner')
+
+        self.assertEqual(count, 2)
+        self.assertQuerysetEqual(
+            City.objects.order_by('id').values_list('name', 'denonym'),
+            ["('Cologne', 'Cologner')", "('Munich', '')"]
+        )
+        self.assertDictEqual(
+            self.get_texts(City, 'de'),
+            {
+                cologne.pk: {'name': 'Köln', 'denonym': 'Stadtbewohner'},
+                munich.pk: {'name': 'Munich', 'denonym': 'Stadtbewohner'},
+            }
+        )
+        self.assertEqual(
+            Translation.objects.filter(field='denonym').count(),
+            2
+        )
+        self.assertQuerysetEqual(Translation.objects.stale(), [])
+
+    @skipUnless(MD5 is not None, 'MD5 is not supported.')
+    def test_translated_queries(self):
+        self.create_cities()
+
+        # savepoint, count, update, insert, bump the versions, release
+        with self.assertNumQueries(6):
+            City.objects.translate('de').update(denonym='Stadtbewohner')
+
+    def test_translated_without_md5(self):
+        cologne, munich = self.create_cities()
+
+        with mock.patch('translations.storages.MD5', None):
+            City.objects.translate('de').update(denonym='Stadtbewohner')
+
+        self.assertDictEqual(
+            self.get_texts(City, 'de'),
+            {
+                cologne.pk: {'name': 'Köln', 'denonym': 'Stadtbewohner'},
+                munich.pk: {'name': 'Munich', 'denonym': 'Stadtbewohner'},
+            }
+        )
+
+    def test_translated_filtered(self):
+        cologne, munich = self.create_cities()
+
+        City.objects.translate('de').filter(
+            name='Munich',
+        ).update(name='München')
+
+        self.assertDictEqual(
+            self.get_texts(City, 'de'),
+            {
+                cologne.pk: {'name': 'Köln', 'denonym': 'Kölner'},
+                munich.pk: {'name': 'München', 'denonym': ''},
+            }
+        )
+
+    def test_translated_same_as_source(self):
+        cologne, munich = self.create_cities()
+
+        City.objects.translate('de').update(name='Munich')
+
+        self.assertFalse(
+            Translation.objects.filter(
+                object_id=str(munich.pk),
+            ).exists()
+        )
+        self.assertEqual(
+            Translation.objects.get(
+                object_id=str(cologne.pk), field='name',
+            ).text,
+            'Munich'
+        )
+
+    def test_translated_empty(self):
+        self.create_cities()
+
+        City.objects.translate('de').update(name='')
+
+        self.assertEqual(Translation.objects.filter(field='name').count(), 1)
+
+    def test_translated_mixed(self):
+        cologne, munich = self.create_cities()
+        country = cologne.country
+
+        City.objects.translate('de').filter(pk=munich.pk).update(
+            name='München', country=country,
+        )
+
+        self.assertEqual(
+            Translation.objects.get(object_id=str(munich.pk)).text,
+            'München'
+        )
+
+    def test_translated_char_keyed(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name'],
+            langs=['de']
+        )
+
+        Continent.objects.translate('de').update(denonym='Kontinental')
+
+        self.assertQuerysetEqual(
+            Translation.objects.filter(
+                field='denonym',
+            ).order_by('object_id').values_list('object_id', 'text'),
+            ["('AS', 'Kontinental')", "('EU', 'Kontinental')"]
+        )
+
+    def test_translated_sliced(self):
+        self.create_cities()
+
+        with self.assertRaises(TypeError) as error:
+            City.objects.translate('de')[:1].update(name='Stadt')
+
+        self.assertEqual(
+            error.exception.args[0],
+            'Cannot update a query once a slice has been taken.'
+        )
+
+    def test_translated_interned(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+        )
+        cologne = City.objects.get(name='Cologne')
+        for name in ['Rhine Park', 'City Garden']:
+            Park.objects.create(name=name, city=cologne)
+
+        Park.objects.translate('de').update(description='Klein')
+
+        self.assertEqual(TranslationText.objects.count(), 1)
+        self.assertListEqual(
+            [texts['description']
+             for texts in self.get_texts(Park, 'de').values()],
+            ['Klein', 'Klein']
+        )
+
+    def test_translated_compressed(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+        )
+        cologne = City.objects.get(name='Cologne')
+        Monument.objects.create(name='Cathedral', city=cologne)
+
+        Monument.objects.translate('de').update(
+            description='Ein gotischer Dom. ' * 10,
+        )
+
+        translation = Translation.objects.get(field='description')
+        self.assertIsNotNone(translation.compressed_text)
+        self.assertEqual(translation.get_text(), 'Ein gotischer Dom. ' * 10)
+
+    def test_translated_materialized(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+        )
+        cologne = City.objects.get(name='Cologne')
+        District.objects.create(name='Old Town', city=cologne)
+
+        District.objects.translate('de').update(name='Altstadt')
+
+        self.assertEqual(District.objects.get().name_de, 'Altstadt')
+        self.assertEqual(Translation.objects.get().text, 'Altstadt')
+
+    def test_translated_dedicated_table(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+        )
+        cologne = City.objects.get(name='Cologne')
+        Street.objects.create(name='Ring', city=cologne)
+
+        Street.objects.translate('de').update(name='Ringe')
+
+        self.assertQuerysetEqual(
+            StreetTranslation.objects.values_list('field', 'text'),
+            ["('name', 'Ringe')"]
+        )
+
+    @override_settings(TRANSLATIONS_REVISIONS=True)
+    def test_translated_revisions(self):
+        self.create_cities()
+
+        City.objects.translate('de').update(denonym='Stadtbewohner')
+
+        self.assertEqual(
+            TranslationRevision.objects.filter(field='denonym').count(),
+            2
+        )
+
+
+class TranslatableQuerySetBulkCreateTest(TestCase):
+    """Tests for `TranslatableQuerySet.bulk_create`."""
+
+    def get_texts(self, objs, lang):
+        texts = []
+        for obj in objs:
+            with Context(obj) as context:
+                context.read(lang)
+            texts.append((obj.name, obj.denonym))
+        return texts
+
+    def test_no_translations(self):
+        Continent.objects.bulk_create([
+            Continent(code='EU', name='Europe'),
+            Continent(code='AS', name='Asia'),
+        ])
+
+        self.assertEqual(Continent.objects.count(), 2)
+        self.assertEqual(Translation.objects.count(), 0)
+
+    def test_translations(self):
+        continents = Continent.objects.bulk_create(
+            [
+                Continent(code='EU', name='Europe', denonym='European'),
+                Continent(code='AS', name='Asia', denonym='Asian'),
+            ],
+            texts=[
+                {
+                    'de': {'name': 'Europa', 'denonym': 'Europäisch'},
+                    'tr': {'name': 'Avrupa'},
+                },
+                {
+                    'de': {'name': 'Asien'},
+                },
+            ],
+        )
+
+        self.assertListEqual(
+            [(continent.name, continent.denonym) for continent in continents],
+            [('Europe', 'European'), ('Asia', 'Asian')]
+        )
+        self.assertListEqual(
+            self.get_texts(Continent.objects.order_by('-code'), 'de'),
+            [('Europa', 'Europäisch'), ('Asien', 'Asian')]
+        )
+        self.assertListEqual(
+            self.get_texts(Continent.objects.order_by('-code'), 'tr'),
+            [('Avrupa', 'European'), ('Asia', 'Asian')]
+        )
+        self.assertQuerysetEqual(Translation.objects.stale(), [])
+
+    def test_translations_queries(self):
+        continents = [
+            Continent(code=code, name=code) for code in ['EU', 'AS', 'AF']
+        ]
+
+        ContentType.objects.get_for_model(Continent)
+
+        # objects in two batches, savepoint, translations in two batches,
+        # each with a new language whose versions get bumped, created and
+        # bumped again, release
+        with self.assertNumQueries(12):
+            Continent.objects.bulk_create(
+                continents,
+                batch_size=2,
+                texts=[
+                    {'de': {'name': 'Europa'}, 'tr': {'name': 'Avrupa'}},
+                    {'de': {'name': 'Asien'}},
+                    {'de': {'name': 'Afrika'}},
+                ],
+            )
+
+        self.assertEqual(Translation.objects.count(), 4)
+
+    def test_translations_auto_pks(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+        )
+        germany = Country.objects.get()
+
+        cities = City.objects.bulk_create(
+            [
+                City(name='Cologne', country=germany),
+                City(name='Munich', country=germany),
+            ],
+            texts=[
+                {'de': {'name': 'Köln'}},
+                {'de': {'name': 'München'}},
+            ],
+        )
+
+        self.assertTrue(all(city.pk is not None for city in cities))
+        self.assertListEqual(
+            [city.name for city in cities],
+            ['Cologne', 'Munich']
+        )
+        self.assertListEqual(
+            [
+                city.name for city in
+                City.objects.translate('de').order_by('id')
+            ],
+            ['Köln', 'München']
+        )
+
+    def test_translations_auto_pks_untranslated(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+        )
+        germany = Country.objects.get()
+
+        City.objects.bulk_create(
+            [
+                City(name='Cologne', country=germany),
+                City(name='Munich', country=germany),
+                City(name='Berlin', country=germany),
+            ],
+            texts=[
+                {},
+                {'de': {'name': 'München'}},
+                {'de': {}},
+            ],
+        )
+
+        self.assertListEqual(
+            [
+                city.name for city in
+                City.objects.translate('de').order_by('name')
+            ],
+            ['Berlin', 'Cologne', 'München']
+        )
+        self.assertEqual(Translation.objects.count(), 1)
+
+    def test_translations_same_as_source(self):
+        Continent.objects.bulk_create(
+            [Continent(code='EU', name='Europe')],
+            texts=[{'de': {'name': 'Europe'}}],
+        )
+
+        self.assertEqual(Translation.objects.count(), 0)
+
+    def test_translations_length(self):
+        with self.assertRaises(ValueError) as error:
+            Continent.objects.bulk_create(
+                [Continent(code='EU', name='Europe')],
+                texts=[],
+            )
+
+        self.assertEqual(
+            error.exception.args[0],
+            'The texts must be as many as the objects.'
+        )
+        self.assertEqual(Continent.objects.count(), 0)
+
+    def test_translations_ignore_conflicts(self):
+        with self.assertRaises(ValueError) as error:
+            Continent.objects.bulk_create(
+                [Continent(code='EU', name='Europe')],
+                ignore_conflicts=True,
+                texts=[{'de': {'name': 'Europa'}}],
+            )
+
+        self.assertEqual(
+            error.exception.args[0],
+            'Cannot create the translations of the objects while ignoring '
+            'the conflicts.'
+        )
+
+    def test_translations_invalid_field(self):
+        with self.assertRaises(ValueError) as error:
+            Continent.objects.bulk_create(
+                [Continent(code='EU', name='Europe')],
+                texts=[{'de': {'code': 'DE'}}],
+            )
+
+        self.assertEqual(
+            error.exception.args[0],
+            '`code` is not a translatable field of `Continent`.'
+        )
+        self.assertEqual(Continent.objects.count(), 0)
+
+    def test_translations_invalid_language(self):
+        with self.assertRaises(ValueError) as error:
+            Continent.objects.bulk_create(
+                [Continent(code='EU', name='Europe')],
+                texts=[{'xx': {'name': 'Europa'}}],
+            )
+
+        self.assertEqual(
+            error.exception.args[0],
+            '`xx` is not a supported language.'
+        )
+        self.assertEqual(Continent.objects.count(), 0)
+
+    def test_translations_interned(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+        )
+        cologne = City.objects.get()
+
+        Park.objects.bulk_create(
+            [
+                Park(name='Rhine Park', city=cologne),
+                Park(name='City Garden', city=cologne),
+            ],
+            texts=[
+                {'de': {'description': 'Ein Park'}},
+                {'de': {'description': 'Ein Park'}},
+            ],
+        )
+
+        self.assertEqual(TranslationText.objects.count(), 1)
+        self.assertEqual(Translation.objects.count(), 2)
+
+    def test_translations_materialized(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+        )
+        cologne = City.objects.get()
+
+        District.objects.bulk_create(
+            [District(name='Old Town', city=cologne)],
+            texts=[{'de': {'name': 'Altstadt'}}],
+        )
+
+        self.assertEqual(District.objects.get().name_de, 'Altstadt')
+
+
+class TranslatableQuerySetDeleteTest(TestCase):
+    """Tests for `TranslatableQuerySet.delete`."""
+
+    def create_parks(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+        )
+        cologne = City.objects.get()
+        Park.objects.bulk_create(
+            [
+                Park(name='Rhine Park', city=cologne),
+                Park(name='City Garden', city=cologne),
+            ],
+            texts=[
+                {'de': {'name': 'Rheinpark'}},
+                {'de': {'name': 'Stadtgarten'}},
+            ],
+        )
+
+    def test_cascade(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            city_names=['cologne', 'seoul'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            city_fields=['name', 'denonym'],
+            langs=['de', 'tr'],
+        )
+
+        with CaptureQueriesContext(connection) as context:
+            deleted = Continent.objects.filter(code='EU').delete()
+
+        self.assertEqual(
+            deleted,
+            (
+                15,
+                {
+                    'sample.Continent': 1,
+                    'sample.Country': 1,
+                    'sample.City': 1,
+                    'translations.Translation': 12,
+                },
+            )
+        )
+        self.assertFalse(
+            any(
+                query['sql'].startswith('SELECT') and
+                'translations_translation' in query['sql']
+                for query in context.captured_queries
+            )
+        )
+        self.assertEqual(Translation.objects.count(), 12)
+        self.assertQuerysetEqual(
+            Translation.objects.filter(
+                field='name', language='de',
+            ).order_by('text').values_list('text', flat=True),
+            ["'Asien'", "'Seül'", "'Südkorea'"]
+        )
+
+    def test_fast(self):
+        self.create_parks()
+
+        # translations, parks
+        with self.assertNumQueries(2):
+            deleted = Park.objects.all().delete()
+
+        self.assertEqual(
+            deleted,
+            (4, {'tests.Park': 2, 'translations.Translation': 2})
+        )
+        self.assertEqual(Translation.objects.count(), 0)
+        self.assertEqual(TranslationText.objects.count(), 2)
+
+    def test_signals(self):
+        self.create_parks()
+        receiver = mock.Mock()
+        post_delete.connect(receiver, sender=Park)
+        self.addCleanup(post_delete.disconnect, receiver, sender=Park)
+
+        Park.objects.filter(name='Rhine Park').delete()
+
+        self.assertEqual(receiver.call_count, 1)
+        self.assertEqual(
+            receiver.call_args[1]['instance'].name,
+            'Rhine Park'
+        )
+        self.assertQuerysetEqual(
+            Translation.objects.values_list('shared_text__text', flat=True),
+            ["'Stadtgarten'"]
+        )
+
+    def test_no_signals(self):
+        self.create_parks()
+        receiver = mock.Mock()
+        post_delete.connect(receiver, sender=Park)
+        self.addCleanup(post_delete.disconnect, receiver, sender=Park)
+
+        with self.assertNumQueries(2):
+            Park.objects.all().delete(signals=False)
+
+        receiver.assert_not_called()
+        self.assertEqual(Translation.objects.count(), 0)
+
+    def test_translation_signals(self):
+        self.create_parks()
+        receiver = mock.Mock()
+        post_delete.connect(receiver, sender=Translation)
+        self.addCleanup(post_delete.disconnect, receiver, sender=Translation)
+
+        Park.objects.all().delete()
+
+        self.assertEqual(receiver.call_count, 2)
+        self.assertEqual(Translation.objects.count(), 0)
+
+    def test_char_keyed(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name'],
+            langs=['de'],
+        )
+
+        Continent.objects.filter(code='AS').delete()
+
+        self.assertQuerysetEqual(
+            Translation.objects.values_list('object_id', flat=True),
+            ["'EU'"]
+        )
+
+    def test_sliced(self):
+        self.create_parks()
+
+        with self.assertRaises(TypeError) as error:
+            Park.objects.all()[:1].delete()
+
+        self.assertEqual(
+            error.exception.args[0],
+            "Cannot use 'limit' or 'offset' with delete."
+        )
+
+    def test_combined(self):
+        self.create_parks()
+
+        with self.assertRaises(NotSupportedError) as error:
+            Park.objects.all().union(Park.objects.all()).delete()
+
+        self.assertEqual(
+            error.exception.args[0],
+            'Calling QuerySet.delete() after union() is not supported.'
+        )
+
+
+@skipUnless(async_to_sync is not None, 'asgiref is not installed.')
+class TranslatableQuerySetAsyncTest(TransactionTestCase):
+    """Tests for the async API of `TranslatableQuerySet`."""
+
+    def setUp(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            continent_fields=['name'],
+            country_fields=['name'],
+            langs=['de'],
+        )
+
+    def test_aiter(self):
+        continents = Continent.objects.translate('de').translate_related(
+            'countries',
+        ).order_by('code')
+
+        async def _iterate():
+            return [continent async for continent in continents]
+
+        result = async_to_sync(_iterate)()
+
+        self.assertListEqual(
+            [continent.name for continent in result],
+            ['Asien', 'Europa']
+        )
+        self.assertListEqual(
+            [country.name for country in result[1].countries.all()],
+            ['Deutschland']
+        )
+
+    def test_aiter_default_language(self):
+        continents = Continent.objects.order_by('code')
+
+        async def _iterate():
+            return [continent async for continent in continents]
+
+        self.assertListEqual(
+            [continent.name for continent in async_to_sync(_iterate)()],
+            ['Asia', 'Europe']
+        )
+
+    def test_aiter_values(self):
+        continents = Continent.objects.translate('de').values()
+
+        async def _iterate():
+            return [continent async for continent in continents]
+
+        with self.assertRaises(TypeError):
+            async_to_sync(_iterate)()
+
+    def test_aget(self):
+        europe = async_to_sync(
+            Continent.objects.translate('de').aget
+        )(code='EU')
+
+        self.assertEqual(europe.name, 'Europa')
+
+    def test_aget_does_not_exist(self):
+        with self.assertRaises(Continent.DoesNotExist):
+            async_to_sync(Continent.objects.translate('de').aget)(code='AF')
+
+    def test_afirst(self):
+        asia = async_to_sync(
+            Continent.objects.translate('de').order_by('code').afirst
+        )()
+
+        self.assertEqual(asia.name, 'Asien')
+
+    def test_afirst_active_language(self):
+        with override('de'):
+            continents = Continent.objects.translate().order_by('code')
+        asia = async_to_sync(continents.afirst)()
+
+        self.assertEqual(asia.name, 'Asien')
+
+
+class TranslationQuerySetTest(TestCase):
+    """Tests for `TranslationQuerySet`."""
+
+    def test_stale(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+            continent_fields=['name', 'denonym'],
+            city_fields=['name', 'denonym'],
+            langs=['de']
+        )
+        europe = Continent.objects.get(code='EU')
+        cologne = City.objects.get(name='Cologne')
+        with Context(europe) as context:
+            europe.name = 'Europa'
+            context.update('de')
+        with Context(cologne) as context:
+            cologne.name = 'Köln'
+            context.update('de')
+        Continent.objects.filter(code='EU').update(name='The Europe')
+        City.objects.filter(pk=cologne.pk).update(name='Cologne City')
+
+        # without `MD5`, the hashes of each model are computed in Python
+        with self.assertNumQueries(2 if MD5 is not None else 6):
+            stale = list(
+                Translation.objects.stale().order_by('object_id')
+                .values_list('object_id', 'field', 'language')
+            )
+
+        self.assertListEqual(
+            stale,
+            [
+                (str(cologne.pk), 'name', 'de'),
+                ('EU', 'name', 'de'),
+            ]
+        )
+
+    def test_stale_without_md5(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+            continent_fields=['name', 'denonym'],
+            city_fields=['name', 'denonym'],
+            langs=['de']
+        )
+        europe = Continent.objects.get(code='EU')
+        cologne = City.objects.get(name='Cologne')
+        with Context(europe) as context:
+            europe.name = 'Europa'
+            context.update('de')
+        with Context(cologne) as context:
+            cologne.name = 'Köln'
+            context.update('de')
+        City.objects.filter(pk=cologne.pk).update(name='Cologne City')
+
+        with mock.patch('translations.sources.MD5', None):
+            stale = list(
+                Translation.objects.stale()
+                .values_list('object_id', 'field', 'language')
+            )
+
+        self.assertListEqual(stale, [(str(cologne.pk), 'name', 'de')])
+
+    def test_stale_filtered(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+        continents = list(Continent.objects.order_by('code'))
+        with Context(continents) as context:
+            context.read('tr')
+            context.update('tr')
+        Continent.objects.update(denonym='Continental')
+
+        self.assertQuerysetEqual(
+            Translation.objects.filter(
+                object_id='EU', language='tr',
+            ).stale().values_list('field', flat=True),
+            ["'denonym'"]
+        )
+
+    def test_stale_untracked(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+        Continent.objects.update(name='The Europe')
+
+        self.assertQuerysetEqual(Translation.objects.stale(), [])
+
+    def test_stale_none(self):
+        with self.assertNumQueries(1):
+            self.assertQuerysetEqual(Translation.objects.stale(), [])
+
+    def get_texts(self, lang):
+        return list(
+            Translation.objects.filter(language=lang).order_by(
+                'content_type_id', 'object_id', 'field',
+            ).values_list('object_id', 'field', 'text')
+        )
+
+    def test_clone_language(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name'],
+            langs=['de'],
+        )
+        germany = Country.objects.get()
+
+        # savepoint, content types, insert per content type and bump, create
+        # and bump its versions, release
+        with self.assertNumQueries(11):
+            count = Translation.objects.clone_language('de', 'tr')
+
+        self.assertEqual(count, 3)
+        self.assertListEqual(
+            self.get_texts('tr'),
+            [
+                ('EU', 'denonym', 'Europäisch'),
+                ('EU', 'name', 'Europa'),
+                (str(germany.pk), 'name', 'Deutschland'),
+            ]
+        )
+        self.assertEqual(Translation.objects.count(), 6)
+
+    @override_settings(TRANSLATIONS_REVISIONS=True)
+    def test_clone_language_revisions(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de'],
+        )
+
+        count = Translation.objects.filter(
+            field='name',
+        ).clone_language('de', 'tr')
+
+        self.assertEqual(count, 2)
+        self.assertListEqual(
+            self.get_texts('tr'),
+            [('AS', 'name', 'Asien'), ('EU', 'name', 'Europa')]
+        )
+        self.assertQuerysetEqual(
+            TranslationRevision.objects.filter(language='tr').order_by(
+                'object_id',
+            ).values_list('object_id', 'field', 'text'),
+            ["('AS', 'name', 'Asien')", "('EU', 'name', 'Europa')"]
+        )
+
+    def test_clone_language_filtered(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de'],
+        )
+
+        count = Translation.objects.filter(
+            object_id='EU', field='name',
+        ).clone_language('de', 'tr')
+
+        self.assertEqual(count, 1)
+        self.assertListEqual(
+            self.get_texts('tr'),
+            [('EU', 'name', 'Europa')]
+        )
+
+    def test_clone_language_read(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name'],
+            langs=['de'],
+        )
+        europe = Continent.objects.get()
+        with Context(europe) as context:
+            context.read('tr')
+
+        Translation.objects.clone_language('de', 'tr')
+
+        self.assertEqual(
+            Continent.objects.translate('tr').get().name, 'Europa'
+        )
+
+    def test_clone_language_conflicts(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr'],
+        )
+
+        with self.assertRaises(IntegrityError):
+            with transaction.atomic():
+                Translation.objects.clone_language('de', 'tr')
+
+        self.assertListEqual(
+            self.get_texts('tr'),
+            [('EU', 'denonym', 'Avrupalı'), ('EU', 'name', 'Avrupa')]
+        )
+
+    def test_clone_language_skip_conflicts(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr'],
+        )
+        Translation.objects.filter(language='tr', field='name').delete()
+
+        count = Translation.objects.clone_language(
+            'de', 'tr', skip_conflicts=True,
+        )
+
+        self.assertEqual(count, 1)
+        self.assertListEqual(
+            self.get_texts('tr'),
+            [('EU', 'denonym', 'Avrupalı'), ('EU', 'name', 'Europa')]
+        )
+
+    def test_clone_language_interned(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+        )
+        park = Park.objects.create(name='Rhine Park', city=City.objects.get())
+        with Context(park) as context:
+            park.name = 'Rheinpark'
+            context.create('de')
+
+        Translation.objects.clone_language('de', 'tr')
+
+        self.assertEqual(
+            Park.objects.translate('tr').get().name, 'Rheinpark'
+        )
+        self.assertEqual(TranslationText.objects.count(), 1)
+
+    def test_clone_language_materialized(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+            langs=['tr'],
+        )
+        district = District.objects.create(
+            name='Old Town', description='Old.', city=City.objects.get(),
+        )
+        Translation.objects.bulk_create([
+            Translation(
+                content_type=ContentType.objects.get_for_model(District),
+                object_id=str(district.pk),
+                field='name',
+                language='tr',
+                text='Eski Şehir',
+            ),
+        ])
+        District.objects.filter(pk=district.pk).update(description_de='Alt.')
+
+        Translation.objects.clone_language('tr', 'de')
+
+        district.refresh_from_db()
+        self.assertEqual(district.name_de, 'Eski Şehir')
+        self.assertEqual(district.description_de, 'Alt.')
+
+    def test_clone_language_same(self):
+        with self.assertRaises(ValueError) as error:
+            Translation.objects.clone_language('de', 'de')
+
+        self.assertEqual(
+            error.exception.args[0],
+            'Cannot clone `de` to itself.'
+        )
+
+    def test_clone_language_default(self):
+        with self.assertRaises(ValueError) as error:
+            Translation.objects.clone_language('en', 'de')
+
+        self.assertEqual(
+            error.exception.args[0],
+            '`en` is the default language, which has no translations.'
+        )
+
+    def test_clone_language_invalid(self):
+        with self.assertRaises(ValueError) as error:
+            Translation.objects.clone_language('de', 'xx')
+
+        self.assertEqual(
+            error.exception.args[0],
+            '`xx` is not a supported language.'
+        )
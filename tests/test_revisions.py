@@ -0,0 +1,248 @@
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from django.contrib.contenttypes.models import ContentType
+
+from translations.models import TranslationRevision
+from translations.context import Context
+from translations.revisions import _is_revision_log_enabled, \
+    _is_keyframe, _get_keyframe, _get_delta, _apply_delta, \
+    _get_head_revisions, _log_revisions, _log_deletions, _read_revisions
+
+from sample.models import Continent, City
+from sample.utils import create_samples
+
+
+def get_changes(obj, **texts):
+    ct_id = ContentType.objects.get_for_model(obj).id
+    return [
+        ({
+            'content_type_id': ct_id,
+            'object_id': str(obj.pk),
+            'field': field,
+        }, text) for (field, text) in sorted(texts.items())
+    ]
+
+
+class IsRevisionLogEnabledTest(TestCase):
+    """Tests for `_is_revision_log_enabled`."""
+
+    def test_default(self):
+        self.assertFalse(_is_revision_log_enabled())
+
+    @override_settings(TRANSLATIONS_REVISIONS=True)
+    def test_enabled(self):
+        self.assertTrue(_is_revision_log_enabled())
+
+
+class KeyframeTest(TestCase):
+    """Tests for `_is_keyframe` and `_get_keyframe`."""
+
+    def test_is_keyframe(self):
+        self.assertListEqual(
+            [_is_keyframe(sequence) for sequence in [0, 1, 7, 8, 9, 16]],
+            [True, False, False, True, False, True]
+        )
+
+    def test_get_keyframe(self):
+        self.assertListEqual(
+            [_get_keyframe(sequence) for sequence in [0, 1, 7, 8, 9, 16]],
+            [0, 0, 0, 8, 8, 16]
+        )
+
+
+class DeltaTest(TestCase):
+    """Tests for `_get_delta` and `_apply_delta`."""
+
+    def test_delta(self):
+        self.assertEqual(
+            _get_delta('Der Kölner Dom', 'Der große Kölner Dom'),
+            '[[0,3]," große",[3,14]]'
+        )
+
+    def test_apply_delta(self):
+        self.assertEqual(
+            _apply_delta('Der Kölner Dom', '[[0,3]," große",[3,14]]'),
+            'Der große Kölner Dom'
+        )
+
+    def test_round_trip(self):
+        base = 'Die Hohe Domkirche Sankt Petrus ist eine Kathedrale.'
+        for text in ['', base, 'Ganz anders.', base.replace('ist', 'war')]:
+            self.assertEqual(_apply_delta(base, _get_delta(base, text)), text)
+
+
+class LogRevisionsTest(TestCase):
+    """Tests for `_log_revisions` and `_log_deletions`."""
+
+    def test_first(self):
+        europe = Continent.objects.create(name='Europe', code='EU')
+
+        with self.assertNumQueries(2):
+            _log_revisions(get_changes(europe, name='Europa'), 'de')
+
+        revision = TranslationRevision.objects.get()
+        self.assertEqual(revision.sequence, 0)
+        self.assertEqual(revision.text, 'Europa')
+        self.assertIsNone(revision.delta)
+        self.assertFalse(revision.deleted)
+
+    def test_deltas(self):
+        europe = Continent.objects.create(name='Europe', code='EU')
+        _log_revisions(get_changes(europe, name='Europa'), 'de')
+
+        with self.assertNumQueries(3):
+            _log_revisions(get_changes(europe, name='Das Europa'), 'de')
+
+        revision = TranslationRevision.objects.get(sequence=1)
+        self.assertEqual(revision.text, '')
+        self.assertEqual(revision.delta, '["Das ",[0,6]]')
+
+    def test_keyframes(self):
+        europe = Continent.objects.create(name='Europe', code='EU')
+        for i in range(10):
+            _log_revisions(
+                get_changes(europe, name='Europa {}'.format(i)), 'de'
+            )
+
+        self.assertQuerysetEqual(
+            TranslationRevision.objects.filter(
+                delta__isnull=True,
+            ).order_by('sequence').values_list('sequence', 'text'),
+            ["(0, 'Europa 0')", "(8, 'Europa 8')"]
+        )
+        heads = _get_head_revisions([(
+            ContentType.objects.get_for_model(Continent).id, 'EU', 'name',
+        )], 'de')
+        self.assertListEqual(
+            [text for (_, _, text) in heads.values()],
+            ['Europa 9']
+        )
+
+    def test_deletions(self):
+        europe = Continent.objects.create(name='Europe', code='EU')
+        _log_revisions(get_changes(europe, name='Europa'), 'de')
+        mapping = {
+            ContentType.objects.get_for_model(Continent).id: {'EU': europe},
+        }
+
+        _log_deletions(mapping, 'de')
+        _log_deletions(mapping, 'de')
+
+        self.assertQuerysetEqual(
+            TranslationRevision.objects.order_by('sequence').values_list(
+                'field', 'sequence', 'deleted'
+            ),
+            ["('name', 0, False)", "('name', 1, True)"]
+        )
+
+
+class ReadRevisionsTest(TestCase):
+    """Tests for `_read_revisions`."""
+
+    def test_as_of(self):
+        europe = Continent.objects.create(name='Europe', code='EU')
+        ct_id = ContentType.objects.get_for_model(Continent).id
+        mapping = {ct_id: {'EU': europe}}
+        times = []
+        for text in ['Europa', 'Das Europa', 'Europa!']:
+            _log_revisions(get_changes(europe, name=text), 'de')
+            times.append(timezone.now())
+        _log_deletions(mapping, 'de')
+        times.append(timezone.now())
+
+        self.assertListEqual(
+            [_read_revisions(mapping, 'de', when) for when in times],
+            [
+                {(ct_id, 'EU'): {'name': 'Europa'}},
+                {(ct_id, 'EU'): {'name': 'Das Europa'}},
+                {(ct_id, 'EU'): {'name': 'Europa!'}},
+                {},
+            ]
+        )
+
+    def test_queries(self):
+        europe = Continent.objects.create(name='Europe', code='EU')
+        ct_id = ContentType.objects.get_for_model(Continent).id
+        for i in range(20):
+            _log_revisions(
+                get_changes(europe, name='Europa {}'.format(i),
+                            denonym='Europäisch {}'.format(i)),
+                'de'
+            )
+
+        with self.assertNumQueries(2):
+            texts = _read_revisions(
+                {ct_id: {'EU': europe}}, 'de', timezone.now()
+            )
+
+        self.assertDictEqual(
+            texts,
+            {(ct_id, 'EU'): {'name': 'Europa 19', 'denonym': 'Europäisch 19'}}
+        )
+
+    def test_before_history(self):
+        before = timezone.now()
+        europe = Continent.objects.create(name='Europe', code='EU')
+        _log_revisions(get_changes(europe, name='Europa'), 'de')
+
+        self.assertDictEqual(
+            _read_revisions(
+                {ContentType.objects.get_for_model(Continent).id: {
+                    'EU': europe,
+                }},
+                'de',
+                before,
+            ),
+            {}
+        )
+
+
+class ContextRevisionsTest(TestCase):
+    """Tests for the revision log of `Context`."""
+
+    def test_disabled(self):
+        europe = Continent.objects.create(name='Europe', code='EU')
+
+        with Context(europe) as context:
+            europe.name = 'Europa'
+            context.create('de')
+
+        self.assertEqual(TranslationRevision.objects.count(), 0)
+
+    @override_settings(TRANSLATIONS_REVISIONS=True)
+    def test_read_as_of(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+        )
+        cologne = City.objects.get(name='Cologne')
+
+        with Context(cologne) as context:
+            cologne.name = 'Köln'
+            context.create('de')
+            created = timezone.now()
+            cologne.name = 'Kölle'
+            context.update('de')
+            updated = timezone.now()
+            context.delete('de')
+            deleted = timezone.now()
+
+        cologne = City.objects.get(name='Cologne')
+        with Context(cologne) as context:
+            context.read('de', as_of=created)
+            self.assertEqual(cologne.name, 'Köln')
+            context.read('de', as_of=updated)
+            self.assertEqual(cologne.name, 'Kölle')
+            context.reset()
+            context.read('de', as_of=deleted)
+            self.assertEqual(cologne.name, 'Cologne')
+            context.read('de')
+            self.assertEqual(cologne.name, 'Cologne')
+
+        self.assertQuerysetEqual(
+            TranslationRevision.objects.order_by('sequence').values_list(
+                'field', 'sequence', 'deleted'
+            ),
+            ["('name', 0, False)", "('name', 1, False)", "('name', 2, True)"]
+        )
@@ -0,0 +1,126 @@
+from django.test import TestCase
+from django.contrib.contenttypes.models import ContentType
+
+from translations.models import Translation
+from translations.context import Context
+from translations.sources import _get_source_hash, _get_stale_query
+
+from sample.models import Timezone, Continent, City
+from sample.utils import create_samples
+
+
+class GetSourceHashTest(TestCase):
+    """Tests for `_get_source_hash`."""
+
+    def test_text(self):
+        self.assertEqual(
+            _get_source_hash('Europe'),
+            '912d59cdf1d3f551fae21f6f0062258f'
+        )
+
+    def test_unicode(self):
+        self.assertEqual(
+            _get_source_hash('Köln'),
+            '2fc01bde301ce78776bfd009c2edc542'
+        )
+
+    def test_none(self):
+        self.assertIsNone(_get_source_hash(None))
+
+
+class ContextSourceHashTest(TestCase):
+    """Tests for the source hashes written by `Context`."""
+
+    def test_create(self):
+        europe = Continent.objects.create(name='Europe', code='EU')
+
+        with Context(europe) as context:
+            europe.name = 'Europa'
+            context.create('de')
+
+        self.assertEqual(
+            europe.translations.get().source_hash,
+            _get_source_hash('Europe')
+        )
+
+    def test_update(self):
+        europe = Continent.objects.create(name='Europe', code='EU')
+        with Context(europe) as context:
+            europe.name = 'Europa'
+            context.create('de')
+
+        europe = Continent.objects.get(code='EU')
+        europe.name = 'The Europe'
+        europe.save()
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            europe.name = 'Das Europa'
+            context.update('de')
+
+        self.assertEqual(
+            europe.translations.get().source_hash,
+            _get_source_hash('The Europe')
+        )
+
+
+class GetStaleQueryTest(TestCase):
+    """Tests for `_get_stale_query`."""
+
+    def test_char_keyed(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+        Translation.objects.update(source_hash=None)
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            europe.name = 'Europa'
+            europe.denonym = 'Europäisch'
+            context.update('de')
+        Continent.objects.filter(code='EU').update(name='The Europe')
+
+        ct_id = ContentType.objects.get_for_model(Continent).id
+        stale = Translation.objects.filter(id__in=_get_stale_query(ct_id))
+
+        self.assertQuerysetEqual(
+            stale.values_list('object_id', 'field', 'language'),
+            ["('EU', 'name', 'de')"]
+        )
+
+    def test_integer_keyed(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne', 'munich'],
+            city_fields=['name', 'denonym'],
+            langs=['de']
+        )
+        cities = list(City.objects.order_by('id'))
+        with Context(cities) as context:
+            cities[0].name = 'Köln'
+            cities[1].name = 'München'
+            context.update('de')
+        City.objects.filter(pk=cities[1].pk).update(name='Munich City')
+
+        ct_id = ContentType.objects.get_for_model(City).id
+        stale = Translation.objects.filter(id__in=_get_stale_query(ct_id))
+
+        self.assertQuerysetEqual(
+            stale.values_list('object_id', 'field'),
+            ["('{}', 'name')".format(cities[1].pk)]
+        )
+
+    def test_not_translatable(self):
+        ct_id = ContentType.objects.get_for_model(Translation).id
+        self.assertQuerysetEqual(
+            Translation.objects.filter(id__in=_get_stale_query(ct_id)),
+            []
+        )
+
+    def test_no_translatable_fields(self):
+        ct_id = ContentType.objects.get_for_model(Timezone).id
+        self.assertQuerysetEqual(
+            Translation.objects.filter(id__in=_get_stale_query(ct_id)),
+            []
+        )
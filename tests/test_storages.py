@@ -0,0 +1,943 @@
+from unittest import skipUnless
+
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models, utils, connection
+from django.db.models import Q
+from django.contrib.contenttypes.models import ContentType
+
+from translations.models import Translation, TranslationText
+from translations.context import Context
+from translations.storages import TableStorage, JSONStorage, \
+    ModelTableStorage, InternedTableStorage, CompressedTableStorage, \
+    _get_storage, _get_storages_mappings
+from translations.sources import MD5
+
+from sample.models import Continent, City
+from sample.utils import create_samples
+
+from tests.models import Street, StreetTranslation, Park, Monument
+
+if hasattr(models, 'JSONField'):
+    from tests.models import Landmark
+
+
+def create_landmarks():
+    create_samples(
+        continent_names=['europe'],
+        country_names=['germany'],
+        city_names=['cologne'],
+        city_fields=['name', 'denonym'],
+        langs=['de']
+    )
+    cologne = City.objects.get(name='Cologne')
+    Landmark.objects.create(
+        name='Cathedral',
+        description='A gothic cathedral.',
+        city=cologne,
+        i18n={'de': {'name': 'Dom', 'description': 'Ein gotischer Dom.'}},
+    )
+    Landmark.objects.create(
+        name='Zoo',
+        city=cologne,
+    )
+
+
+def create_streets():
+    create_samples(
+        continent_names=['europe'],
+        country_names=['germany'],
+        city_names=['cologne'],
+        city_fields=['name', 'denonym'],
+        langs=['de']
+    )
+    cologne = City.objects.get(name='Cologne')
+    cathedral_square = Street.objects.create(
+        name='Cathedral Square',
+        city=cologne,
+    )
+    Street.objects.create(
+        name='Ring',
+        city=cologne,
+    )
+    StreetTranslation.objects.create(
+        source=cathedral_square,
+        field='name',
+        language='de',
+        text='Domplatte',
+    )
+
+
+def create_parks():
+    create_samples(
+        continent_names=['europe'],
+        country_names=['germany'],
+        city_names=['cologne'],
+        city_fields=['name', 'denonym'],
+        langs=['de']
+    )
+    cologne = City.objects.get(name='Cologne')
+    Park.objects.create(
+        name='Rhine Park',
+        description='Small',
+        city=cologne,
+    )
+    Park.objects.create(
+        name='City Garden',
+        description='Small',
+        city=cologne,
+    )
+
+
+def create_monuments():
+    create_samples(
+        continent_names=['europe'],
+        country_names=['germany'],
+        city_names=['cologne'],
+        city_fields=['name', 'denonym'],
+        langs=['de']
+    )
+    cologne = City.objects.get(name='Cologne')
+    Monument.objects.create(
+        name='Cathedral',
+        description='A gothic cathedral. ' * 10,
+        city=cologne,
+    )
+
+
+class TableStorageTest(TestCase):
+    """Tests for `TableStorage`."""
+
+    def test_get_storage(self):
+        self.assertIsInstance(_get_storage(Continent), TableStorage)
+
+    def test_read(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+        europe = Continent.objects.get(code='EU')
+        ct_continent = ContentType.objects.get_for_model(Continent)
+
+        self.assertDictEqual(
+            TableStorage().read({ct_continent.id: {'EU': europe}}, 'de'),
+            {
+                (ct_continent.id, 'EU'): {
+                    'name': 'Europa',
+                    'denonym': 'Europäisch',
+                },
+            }
+        )
+
+    def test_get_query(self):
+        self.assertEqual(
+            TableStorage().get_query(
+                ['countries'], 'name', 'icontains', 'Deutsch', 'de'
+            ),
+            Q(
+                countries__translations__field='name',
+                countries__translations__text__icontains='Deutsch',
+                countries__translations__language='de',
+            )
+        )
+
+    def test_get_query_languages(self):
+        self.assertEqual(
+            TableStorage().get_query(
+                [], 'name', '', 'Deutschland', ['de', 'tr']
+            ),
+            Q(
+                translations__field='name',
+                translations__text='Deutschland',
+                translations__language__in=['de', 'tr'],
+            )
+        )
+
+    def test_update_many(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name'],
+            langs=['de', 'tr'],
+        )
+        europe = Continent.objects.get(code='EU')
+        europe._default_translatable_fields = {'name': 'Europe'}
+        ct_id = ContentType.objects.get_for_model(Continent).id
+        address = {
+            'content_type_id': ct_id,
+            'object_id': 'EU',
+            'field': 'name',
+        }
+
+        # delete the old rows, create the new ones, bump the versions
+        with self.assertNumQueries(3):
+            TableStorage().update_many({ct_id: {'EU': europe}}, {
+                'de': [(address, 'Europa (neu)')],
+                'tr': [(address, 'Avrupa (yeni)')],
+            })
+
+        self.assertQuerysetEqual(
+            Translation.objects.order_by('language').values_list(
+                'language', 'text',
+            ),
+            ["('de', 'Europa (neu)')", "('tr', 'Avrupa (yeni)')"]
+        )
+
+    def test_update_many_language_once(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name'],
+            langs=['de', 'tr'],
+        )
+        ct_id = ContentType.objects.get_for_model(Continent).id
+        mapping = {ct_id: {}}
+        changes = {'de': [], 'tr': []}
+        for continent in Continent.objects.all():
+            continent._default_translatable_fields = {'name': continent.name}
+            mapping[ct_id][continent.pk] = continent
+            for lang in changes:
+                changes[lang].append((
+                    {
+                        'content_type_id': ct_id,
+                        'object_id': continent.pk,
+                        'field': 'name',
+                    },
+                    '{} ({})'.format(continent.name, lang),
+                ))
+
+        with CaptureQueriesContext(connection) as context:
+            TableStorage().update_many(mapping, changes)
+
+        delete = context.captured_queries[0]['sql']
+        self.assertTrue(delete.startswith('DELETE'))
+        self.assertEqual(delete.count('"language"'), 2)
+        self.assertEqual(Translation.objects.count(), 4)
+
+    @skipUnless(MD5 is not None, 'MD5 is not supported.')
+    def test_update_all_object_int_ids(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne', 'munich'],
+            city_fields=['name'],
+            langs=['de'],
+        )
+
+        TableStorage().update_all(City.objects.all(), 'denonym', 'Bayer', 'de')
+
+        self.assertQuerysetEqual(
+            Translation.objects.filter(field='denonym').order_by(
+                'object_int_id',
+            ).values_list('object_id', 'object_int_id'),
+            [
+                repr((str(pk), pk))
+                for pk in City.objects.order_by('pk').values_list(
+                    'pk', flat=True,
+                )
+            ]
+        )
+
+    def test_create_many(self):
+        create_samples(continent_names=['europe'])
+        europe = Continent.objects.get(code='EU')
+        europe._default_translatable_fields = {'name': 'Europe'}
+        ct_id = ContentType.objects.get_for_model(Continent).id
+        address = {
+            'content_type_id': ct_id,
+            'object_id': 'EU',
+            'field': 'name',
+        }
+
+        # create, bump, create and bump the versions
+        with self.assertNumQueries(4):
+            TableStorage().create_many({ct_id: {'EU': europe}}, {
+                'de': [(address, 'Europa')],
+                'tr': [(address, 'Avrupa')],
+            })
+
+        self.assertQuerysetEqual(
+            Translation.objects.order_by('language').values_list(
+                'language', 'text',
+            ),
+            ["('de', 'Europa')", "('tr', 'Avrupa')"]
+        )
+
+
+@skipUnless(hasattr(models, 'JSONField'), 'JSONField is not supported.')
+class JSONStorageTest(TestCase):
+    """Tests for `JSONStorage`."""
+
+    def test_get_storage(self):
+        storage = _get_storage(Landmark)
+        self.assertIsInstance(storage, JSONStorage)
+        self.assertEqual(storage.field, 'i18n')
+
+    def test_get_storages_mappings(self):
+        create_landmarks()
+        cologne = City.objects.get(name='Cologne')
+        context = Context(cologne, 'landmarks')
+
+        storages = _get_storages_mappings(context.mapping)
+
+        self.assertEqual(len(storages), 2)
+        self.assertIsInstance(storages[0][0], TableStorage)
+        self.assertIsInstance(storages[1][0], JSONStorage)
+
+    def test_read(self):
+        create_landmarks()
+        cathedral = Landmark.objects.get(name='Cathedral')
+
+        with self.assertNumQueries(0):
+            with Context(cathedral) as context:
+                context.read('de')
+
+        self.assertEqual(cathedral.name, 'Dom')
+        self.assertEqual(cathedral.description, 'Ein gotischer Dom.')
+
+    def test_read_untranslated(self):
+        create_landmarks()
+        zoo = Landmark.objects.get(name='Zoo')
+
+        with Context(zoo) as context:
+            context.read('de')
+
+        self.assertEqual(zoo.name, 'Zoo')
+
+    def test_read_mixed_storages(self):
+        create_landmarks()
+        cologne = City.objects.get(name='Cologne')
+
+        with Context(cologne, 'landmarks') as context:
+            context.read('de')
+
+        landmarks = sorted(cologne.landmarks.all(), key=lambda x: x.id)
+        self.assertEqual(cologne.name, 'Köln')
+        self.assertEqual(landmarks[0].name, 'Dom')
+        self.assertEqual(landmarks[1].name, 'Zoo')
+
+    def test_create(self):
+        create_landmarks()
+        zoo = Landmark.objects.get(name='Zoo')
+
+        with Context(zoo) as context:
+            zoo.name = 'Tierpark'
+            context.create('de')
+
+        zoo.refresh_from_db()
+        self.assertDictEqual(zoo.i18n, {'de': {'name': 'Tierpark'}})
+
+    def test_create_existing(self):
+        create_landmarks()
+        cathedral = Landmark.objects.get(name='Cathedral')
+
+        with Context(cathedral) as context:
+            cathedral.name = 'Kathedrale'
+            with self.assertRaises(utils.IntegrityError):
+                context.create('de')
+
+        cathedral.refresh_from_db()
+        self.assertEqual(cathedral.i18n['de']['name'], 'Dom')
+
+    def test_update(self):
+        create_landmarks()
+        cathedral = Landmark.objects.get(name='Cathedral')
+
+        with Context(cathedral) as context:
+            cathedral.name = 'Kathedrale'
+            context.update('de')
+
+        cathedral.refresh_from_db()
+        self.assertDictEqual(
+            cathedral.i18n,
+            {
+                'de': {
+                    'name': 'Kathedrale',
+                    'description': 'Ein gotischer Dom.',
+                },
+            }
+        )
+        self.assertEqual(cathedral.name, 'Cathedral')
+
+    def test_update_other_language_written(self):
+        create_landmarks()
+        cathedral = Landmark.objects.get(name='Cathedral')
+        # another writer adds a language after the object was loaded
+        Landmark.objects.filter(pk=cathedral.pk).update(
+            i18n={
+                'de': {'name': 'Dom'},
+                'tr': {'name': 'Katedral'},
+            },
+        )
+
+        with Context(cathedral) as context:
+            cathedral.name = 'Kathedrale'
+            context.update('de')
+
+        cathedral.refresh_from_db()
+        self.assertDictEqual(
+            cathedral.i18n,
+            {
+                'de': {'name': 'Kathedrale'},
+                'tr': {'name': 'Katedral'},
+            }
+        )
+
+    @skipUnless(
+        connection.features.has_select_for_update,
+        'SELECT ... FOR UPDATE is not supported.',
+    )
+    def test_update_locks(self):
+        create_landmarks()
+        cathedral = Landmark.objects.get(name='Cathedral')
+
+        with CaptureQueriesContext(connection) as queries:
+            with Context(cathedral) as context:
+                cathedral.name = 'Kathedrale'
+                context.update('de')
+
+        self.assertTrue(
+            any('FOR UPDATE' in query['sql'] for query in queries)
+        )
+
+    def test_update_many(self):
+        create_landmarks()
+        cathedral = Landmark.objects.get(name='Cathedral')
+
+        with Context(cathedral) as context:
+            context.update_many({
+                'de': {cathedral: {'name': 'Kathedrale'}},
+                'tr': {cathedral: {'name': 'Katedral'}},
+            })
+
+        cathedral.refresh_from_db()
+        self.assertDictEqual(
+            cathedral.i18n,
+            {
+                'de': {
+                    'name': 'Kathedrale',
+                    'description': 'Ein gotischer Dom.',
+                },
+                'tr': {
+                    'name': 'Katedral',
+                },
+            }
+        )
+
+    def test_delete(self):
+        create_landmarks()
+        cathedral = Landmark.objects.get(name='Cathedral')
+
+        with Context(cathedral) as context:
+            context.delete('de')
+            context.read('de')
+
+        self.assertEqual(cathedral.name, 'Cathedral')
+        cathedral.refresh_from_db()
+        self.assertDictEqual(cathedral.i18n, {})
+
+    def test_translate(self):
+        create_landmarks()
+
+        landmarks = Landmark.objects.translate('de').order_by('id')
+
+        self.assertEqual(landmarks[0].name, 'Dom')
+        self.assertEqual(landmarks[1].name, 'Zoo')
+
+    def test_get_query(self):
+        self.assertEqual(
+            JSONStorage('i18n').get_query(
+                ['landmarks'], 'name', 'icontains', 'dom', ['de', 'tr']
+            ),
+            Q(landmarks__i18n__de__name__icontains='dom') |
+            Q(landmarks__i18n__tr__name__icontains='dom')
+        )
+
+    def test_filter(self):
+        create_landmarks()
+
+        self.assertQuerysetEqual(
+            Landmark.objects.probe('de').filter(name='Dom'),
+            ['<Landmark: Cathedral>']
+        )
+        self.assertQuerysetEqual(
+            Landmark.objects.probe(['en', 'de']).filter(
+                name__icontains='zoo'
+            ),
+            ['<Landmark: Zoo>']
+        )
+
+    def test_filter_relation(self):
+        create_landmarks()
+
+        self.assertQuerysetEqual(
+            City.objects.probe('de').filter(landmarks__name__startswith='D'),
+            ['<City: Cologne>']
+        )
+        self.assertQuerysetEqual(
+            City.objects.probe('de').filter(landmarks__name='Zoo'),
+            []
+        )
+
+
+class ModelTableStorageTest(TestCase):
+    """Tests for `ModelTableStorage`."""
+
+    def test_get_storage(self):
+        self.assertIsInstance(_get_storage(Street), ModelTableStorage)
+
+    def test_translation_model(self):
+        self.assertIs(
+            _get_storage(Street).get_translation_model(Street),
+            StreetTranslation
+        )
+        source = StreetTranslation._meta.get_field('source')
+        self.assertIs(source.related_model, Street)
+        self.assertEqual(
+            StreetTranslation._meta.db_table,
+            'tests_street_translation'
+        )
+        self.assertEqual(
+            StreetTranslation._meta.unique_together,
+            (('source', 'field', 'language'),)
+        )
+
+    def test_read(self):
+        create_streets()
+        streets = list(Street.objects.order_by('id'))
+
+        with self.assertNumQueries(1):
+            with Context(streets) as context:
+                context.read('de')
+
+        self.assertEqual(streets[0].name, 'Domplatte')
+        self.assertEqual(streets[1].name, 'Ring')
+
+    def test_read_mixed_storages(self):
+        create_streets()
+        cologne = City.objects.get(name='Cologne')
+
+        with Context(cologne, 'streets') as context:
+            context.read('de')
+
+        streets = sorted(cologne.streets.all(), key=lambda x: x.id)
+        self.assertEqual(cologne.name, 'Köln')
+        self.assertEqual(streets[0].name, 'Domplatte')
+        self.assertEqual(streets[1].name, 'Ring')
+
+    def test_create(self):
+        create_streets()
+        ring = Street.objects.get(name='Ring')
+
+        with Context(ring) as context:
+            ring.name = 'Ringe'
+            context.create('de')
+
+        self.assertQuerysetEqual(
+            StreetTranslation.objects.filter(source=ring).values_list(
+                'field', 'language', 'text'
+            ),
+            ["('name', 'de', 'Ringe')"]
+        )
+
+    def test_create_existing(self):
+        create_streets()
+        cathedral_square = Street.objects.get(name='Cathedral Square')
+
+        with Context(cathedral_square) as context:
+            cathedral_square.name = 'Domplatz'
+            with self.assertRaises(utils.IntegrityError):
+                context.create('de')
+
+    def test_update(self):
+        create_streets()
+        cathedral_square = Street.objects.get(name='Cathedral Square')
+
+        with Context(cathedral_square) as context:
+            cathedral_square.name = 'Domplatz'
+            context.update('de')
+            cathedral_square.name = 'Cathedral Square'
+            context.read('de')
+
+        self.assertEqual(cathedral_square.name, 'Domplatz')
+        self.assertEqual(StreetTranslation.objects.count(), 1)
+
+    def test_update_many(self):
+        create_streets()
+        cathedral_square = Street.objects.get(name='Cathedral Square')
+
+        with Context(cathedral_square) as context:
+            # savepoint, delete the old rows, create the new ones, release
+            with self.assertNumQueries(4):
+                context.update_many({
+                    'de': {cathedral_square: {'name': 'Domplatz'}},
+                    'tr': {cathedral_square: {'name': 'Katedral Meydanı'}},
+                })
+
+        self.assertQuerysetEqual(
+            StreetTranslation.objects.order_by('language').values_list(
+                'language', 'text',
+            ),
+            ["('de', 'Domplatz')", "('tr', 'Katedral Meydanı')"]
+        )
+
+    def test_update_all(self):
+        create_streets()
+
+        # update, insert
+        with self.assertNumQueries(2):
+            _get_storage(Street).update_all(
+                Street.objects.all(), 'name', 'Straße', 'de',
+            )
+
+        self.assertQuerysetEqual(
+            StreetTranslation.objects.order_by('source__name').values_list(
+                'source__name', 'language', 'text',
+            ),
+            [
+                "('Cathedral Square', 'de', 'Straße')",
+                "('Ring', 'de', 'Straße')",
+            ]
+        )
+
+    def test_delete(self):
+        create_streets()
+        cathedral_square = Street.objects.get(name='Cathedral Square')
+
+        with Context(cathedral_square) as context:
+            context.delete('de')
+
+        self.assertEqual(StreetTranslation.objects.count(), 0)
+
+    def test_delete_source_cascades(self):
+        create_streets()
+
+        Street.objects.all().delete()
+
+        self.assertEqual(StreetTranslation.objects.count(), 0)
+
+    def test_get_query(self):
+        self.assertEqual(
+            ModelTableStorage().get_query(
+                ['streets'], 'name', '', 'Domplatte', 'de'
+            ),
+            Q(
+                streets__translation_texts__field='name',
+                streets__translation_texts__text='Domplatte',
+                streets__translation_texts__language='de',
+            )
+        )
+
+    def test_filter(self):
+        create_streets()
+
+        self.assertQuerysetEqual(
+            Street.objects.probe('de').filter(name__startswith='Dom'),
+            ['<Street: Cathedral Square>']
+        )
+        self.assertQuerysetEqual(
+            City.objects.probe(['de', 'tr']).filter(
+                streets__name='Domplatte'
+            ),
+            ['<City: Cologne>']
+        )
+
+
+class InternedTableStorageTest(TestCase):
+    """Tests for `InternedTableStorage`."""
+
+    def test_get_storage(self):
+        self.assertIsInstance(_get_storage(Park), InternedTableStorage)
+
+    def test_create(self):
+        create_parks()
+        parks = list(Park.objects.order_by('id'))
+
+        with Context(parks) as context:
+            parks[0].name = 'Rheinpark'
+            parks[0].description = 'Klein'
+            parks[1].name = 'Stadtgarten'
+            parks[1].description = 'Klein'
+            context.create('de')
+
+        self.assertEqual(Translation.objects.filter(
+            content_type__model='park',
+        ).count(), 4)
+        self.assertEqual(
+            sorted(TranslationText.objects.values_list('text', flat=True)),
+            ['Klein', 'Rheinpark', 'Stadtgarten']
+        )
+        self.assertFalse(
+            Translation.objects.filter(
+                content_type__model='park',
+            ).exclude(text='').exists()
+        )
+
+    def test_create_queries(self):
+        create_parks()
+        parks = list(Park.objects.order_by('id'))
+
+        with Context(parks) as context:
+            for park in parks:
+                park.name = 'Park'
+                park.description = 'Klein'
+            # the shared texts are looked up, created and looked up again,
+            # then the translations are created and the versions bumped,
+            # created and bumped again
+            with self.assertNumQueries(7):
+                context.create('de')
+
+    def test_create_existing_texts(self):
+        create_parks()
+        parks = list(Park.objects.order_by('id'))
+
+        with Context(parks[0]) as context:
+            parks[0].name = 'Rheinpark'
+            parks[0].description = 'Klein'
+            context.create('de')
+        with Context(parks[1]) as context:
+            parks[1].name = 'Rheinpark'
+            parks[1].description = 'Klein'
+            # look up the shared texts, create, bump the versions
+            with self.assertNumQueries(3):
+                context.create('de')
+
+        self.assertEqual(TranslationText.objects.count(), 2)
+
+    def test_create_existing(self):
+        create_parks()
+        park = Park.objects.get(name='Rhine Park')
+
+        with Context(park) as context:
+            park.name = 'Rheinpark'
+            context.create('de')
+            with self.assertRaises(utils.IntegrityError):
+                context.create('de')
+
+    def test_read(self):
+        create_parks()
+        parks = list(Park.objects.order_by('id'))
+        with Context(parks) as context:
+            parks[0].name = 'Rheinpark'
+            parks[0].description = 'Klein'
+            parks[1].description = 'Klein'
+            context.create('de')
+
+        parks = list(Park.objects.order_by('id'))
+        with Context(parks) as context:
+            with self.assertNumQueries(2):
+                context.read('de')
+
+        self.assertEqual(parks[0].name, 'Rheinpark')
+        self.assertEqual(parks[0].description, 'Klein')
+        self.assertEqual(parks[1].name, 'City Garden')
+        self.assertEqual(parks[1].description, 'Klein')
+
+    def test_read_own_text(self):
+        create_parks()
+        park = Park.objects.get(name='Rhine Park')
+        with Context(park) as context:
+            park.name = 'Rheinpark'
+            context.create('de')
+
+        translation = park.translations.get()
+        translation.text = 'Rheinpark Köln'
+        translation.save()
+
+        with Context(park) as context:
+            context.read('de')
+
+        self.assertIsNone(translation.shared_text)
+        self.assertEqual(park.name, 'Rheinpark Köln')
+
+    def test_update(self):
+        create_parks()
+        park = Park.objects.get(name='Rhine Park')
+
+        with Context(park) as context:
+            park.name = 'Rheinpark'
+            context.create('de')
+            park.name = 'Rheinaue'
+            context.update('de')
+            park.name = 'Rhine Park'
+            context.read('de')
+
+        self.assertEqual(park.name, 'Rheinaue')
+        self.assertEqual(park.translations.count(), 1)
+
+    def test_delete(self):
+        create_parks()
+        park = Park.objects.get(name='Rhine Park')
+
+        with Context(park) as context:
+            park.name = 'Rheinpark'
+            context.create('de')
+            context.delete('de')
+
+        self.assertEqual(park.translations.count(), 0)
+        self.assertEqual(TranslationText.objects.count(), 1)
+
+    def test_get_query(self):
+        self.assertEqual(
+            InternedTableStorage().get_query(
+                ['parks'], 'name', '', 'Rheinpark', 'de'
+            ),
+            Q(
+                parks__translations__field='name',
+                parks__translations__shared_text__text='Rheinpark',
+                parks__translations__language='de',
+            ) | (
+                Q(
+                    parks__translations__field='name',
+                    parks__translations__text='Rheinpark',
+                    parks__translations__language='de',
+                ) &
+                Q(parks__translations__shared_text__isnull=True)
+            )
+        )
+
+    def test_filter(self):
+        create_parks()
+        parks = list(Park.objects.order_by('id'))
+        with Context(parks) as context:
+            parks[0].name = 'Rheinpark'
+            parks[1].name = 'Stadtgarten'
+            context.create('de')
+        translation = parks[1].translations.get()
+        translation.text = 'Stadtgarten Köln'
+        translation.save()
+
+        self.assertQuerysetEqual(
+            Park.objects.probe('de').filter(name__startswith='Rhein'),
+            ['<Park: Rhine Park>']
+        )
+        self.assertQuerysetEqual(
+            Park.objects.probe('de').filter(name__endswith='Köln'),
+            ['<Park: City Garden>']
+        )
+        self.assertQuerysetEqual(
+            City.objects.probe(['de', 'tr']).filter(
+                parks__name='Rheinpark'
+            ),
+            ['<City: Cologne>']
+        )
+
+
+class CompressedTableStorageTest(TestCase):
+    """Tests for `CompressedTableStorage`."""
+
+    def test_get_storage(self):
+        self.assertIsInstance(_get_storage(Monument), CompressedTableStorage)
+
+    def test_init_invalid_method(self):
+        with self.assertRaises(ImproperlyConfigured) as error:
+            CompressedTableStorage(method='bz2')
+
+        self.assertEqual(
+            error.exception.args[0],
+            '`bz2` is not a supported compression method.'
+        )
+
+    def test_create(self):
+        create_monuments()
+        cathedral = Monument.objects.get(name='Cathedral')
+
+        with Context(cathedral) as context:
+            cathedral.name = 'Dom'
+            cathedral.description = 'Ein gotischer Dom. ' * 10
+            context.create('de')
+
+        name = cathedral.translations.get(field='name')
+        description = cathedral.translations.get(field='description')
+        self.assertEqual(name.text, 'Dom')
+        self.assertIsNone(name.compressed_text)
+        self.assertEqual(description.text, '')
+        self.assertLess(
+            len(description.compressed_text),
+            len('Ein gotischer Dom. ' * 10)
+        )
+        self.assertEqual(description.get_text(), 'Ein gotischer Dom. ' * 10)
+
+    def test_read(self):
+        create_monuments()
+        cathedral = Monument.objects.get(name='Cathedral')
+        with Context(cathedral) as context:
+            cathedral.name = 'Dom'
+            cathedral.description = 'Ein gotischer Dom. ' * 10
+            context.create('de')
+
+        cathedral = Monument.objects.get(name='Cathedral')
+        with Context(cathedral) as context:
+            with self.assertNumQueries(1):
+                context.read('de')
+
+        self.assertEqual(cathedral.name, 'Dom')
+        self.assertEqual(cathedral.description, 'Ein gotischer Dom. ' * 10)
+
+    def test_update(self):
+        create_monuments()
+        cathedral = Monument.objects.get(name='Cathedral')
+
+        with Context(cathedral) as context:
+            cathedral.description = 'Ein gotischer Dom. ' * 10
+            context.create('de')
+            cathedral.description = 'Ein Dom.'
+            context.update('de')
+            cathedral.description = ''
+            context.read('de')
+
+        description = cathedral.translations.get(field='description')
+        self.assertEqual(cathedral.description, 'Ein Dom.')
+        self.assertEqual(description.text, 'Ein Dom.')
+        self.assertIsNone(description.compressed_text)
+
+    def test_save_changed_text(self):
+        create_monuments()
+        cathedral = Monument.objects.get(name='Cathedral')
+        with Context(cathedral) as context:
+            cathedral.description = 'Ein gotischer Dom. ' * 10
+            context.create('de')
+
+        description = cathedral.translations.get(field='description')
+        description.text = 'Ein Dom.'
+        description.save()
+        description.refresh_from_db()
+
+        self.assertIsNone(description.compressed_text)
+        self.assertEqual(description.get_text(), 'Ein Dom.')
+
+    def test_get_query(self):
+        self.assertEqual(
+            CompressedTableStorage().get_query(
+                ['monuments'], 'name', '', 'Dom', 'de'
+            ),
+            Q(
+                monuments__translations__field='name',
+                monuments__translations__text='Dom',
+                monuments__translations__language='de',
+            ) &
+            Q(monuments__translations__compressed_text__isnull=True)
+        )
+
+    def test_filter(self):
+        create_monuments()
+        cathedral = Monument.objects.get(name='Cathedral')
+        with Context(cathedral) as context:
+            cathedral.name = 'Dom'
+            cathedral.description = 'Ein gotischer Dom. ' * 10
+            context.create('de')
+
+        self.assertQuerysetEqual(
+            Monument.objects.probe('de').filter(name='Dom'),
+            ['<Monument: Cathedral>']
+        )
+        self.assertQuerysetEqual(
+            Monument.objects.probe('de').filter(description__contains=''),
+            []
+        )
+        self.assertQuerysetEqual(
+            City.objects.probe(['de', 'tr']).filter(
+                monuments__name='Dom'
+            ),
+            ['<City: Cologne>']
+        )
@@ -1,9 +1,12 @@
+from unittest import mock
+
 from django.test import TestCase
 from django.core.exceptions import FieldDoesNotExist
 from django.contrib.contenttypes.models import ContentType
 
 from translations.utils import _get_reverse_relation, _get_dissected_lookup, \
     _get_relations_hierarchy, _get_entity_details, \
+    _get_object_int_id, _get_object_ids_lookup, _get_object_ids_query, \
     _get_purview, _get_translations
 
 from sample.models import Continent, Country, City
@@ -581,6 +584,92 @@ class GetEntityDetailsTest(TestCase):
         )
 
 
+class GetObjectIntIdTest(TestCase):
+    """Tests for `_get_object_int_id`."""
+
+    def test_integer(self):
+        self.assertEqual(_get_object_int_id(12), 12)
+        self.assertEqual(_get_object_int_id('12'), 12)
+        self.assertEqual(_get_object_int_id('0'), 0)
+        self.assertEqual(_get_object_int_id('-12'), -12)
+
+    def test_not_integer(self):
+        self.assertIsNone(_get_object_int_id('EU'))
+        self.assertIsNone(_get_object_int_id('012'))
+        self.assertIsNone(_get_object_int_id('1.2'))
+        self.assertIsNone(_get_object_int_id(''))
+        self.assertIsNone(_get_object_int_id(None))
+
+    def test_out_of_range(self):
+        self.assertEqual(
+            _get_object_int_id('9' * 18),
+            int('9' * 18)
+        )
+        self.assertIsNone(_get_object_int_id('9' * 19))
+
+
+class GetObjectIdsLookupTest(TestCase):
+    """Tests for `_get_object_ids_lookup`."""
+
+    def test_integer_keyed(self):
+        with mock.patch.object(
+                City, '_get_object_id_field_name',
+                return_value='object_int_id'):
+            self.assertDictEqual(
+                _get_object_ids_lookup(City, ['1', '2']),
+                {'object_int_id__in': [1, 2]}
+            )
+
+    def test_integer_keyed_default(self):
+        self.assertDictEqual(
+            _get_object_ids_lookup(City, ['1', '2']),
+            {'object_id__in': ['1', '2']}
+        )
+
+    def test_char_keyed(self):
+        self.assertDictEqual(
+            _get_object_ids_lookup(Continent, ['EU', 'AS']),
+            {'object_id__in': ['EU', 'AS']}
+        )
+
+
+class GetObjectIdsQueryTest(TestCase):
+    """Tests for `_get_object_ids_query`."""
+
+    def test_integer_keyed(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne', 'munich'],
+        )
+
+        with mock.patch.object(
+                City, '_get_object_id_field_name',
+                return_value='object_int_id'):
+            self.assertListEqual(
+                [
+                    row['pk'] for row in _get_object_ids_query(
+                        City, City.objects.order_by('id'),
+                    )
+                ],
+                list(
+                    City.objects.order_by('id').values_list('id', flat=True)
+                )
+            )
+
+    def test_char_keyed(self):
+        create_samples(continent_names=['europe', 'asia'])
+
+        self.assertListEqual(
+            [
+                row['_object_id'] for row in _get_object_ids_query(
+                    Continent, Continent.objects.order_by('code'),
+                )
+            ],
+            ['AS', 'EU']
+        )
+
+
 class GetPurviewTest(TestCase):
     """Tests for `_get_purview`."""
 
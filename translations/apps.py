@@ -1,7 +1,25 @@
+import sys
+import logging
+import threading
+
 from django.apps import AppConfig
+from django.conf import settings
 from django.utils.translation import ugettext_lazy as _
 
 
+logger = logging.getLogger(__name__)
+
+
+def _is_management_command():
+    r"""
+    Return whether the process runs a management command other than
+    `runserver`, which may run before the tables exist.
+    """
+    from django.core.management import get_commands
+    return len(sys.argv) > 1 and sys.argv[1] != 'runserver' and \
+        sys.argv[1] in get_commands()
+
+
 class TranslationsConfig(AppConfig):
     name = 'translations'
     verbose_name = _('translations')
@@ -14,3 +32,34 @@ class TranslationsConfig(AppConfig):
             ContentType.objects.get_for_models(*models)
         except Exception:
             pass
+
+        if getattr(settings, 'TRANSLATIONS_WARMUP_ON_STARTUP', False) and \
+                not _is_management_command():
+            # warm up the caches without holding up the startup
+            threading.Thread(
+                target=self.warm_up,
+                name='translations-warmup',
+                daemon=True,
+            ).start()
+
+    def warm_up(self):
+        r"""
+        Load the translations of the `TRANSLATIONS_WARMUP` models into
+        the configured caches and return the number of the loaded
+        translations.
+
+        A failure is logged rather than raised, since the caches are only
+        an optimization.
+        """
+        from django.db import connections
+        from translations.cache import _get_warmup_config, \
+            _warm_translations
+        count = 0
+        try:
+            for (model, langs) in _get_warmup_config():
+                count += _warm_translations(model, langs)
+        except Exception:
+            logger.exception('Failed to warm up the translations caches.')
+        finally:
+            connections.close_all()
+        return count
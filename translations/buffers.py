@@ -0,0 +1,230 @@
+"""This module contains the write-behind buffers for the Translations app."""
+
+from django.db import transaction
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+
+import translations.models
+from translations.languages import _get_default_language, \
+    _get_translate_language
+from translations.utils import _get_commit_hooks
+from translations.context import _get_batch_size, _get_batches, \
+    _run_batches, _write_translations
+
+
+__docformat__ = 'restructuredtext'
+
+
+def _get_buffer_size():
+    """Return the number of the writes which make a buffer flush."""
+    return getattr(settings, 'TRANSLATIONS_BUFFER_SIZE', 1000)
+
+
+class TranslationBuffer:
+    r"""
+    A write-behind buffer which collects the writes and the deletions of
+    the translations and flushes them in batched statements.
+
+    The last write or deletion of each object, field and language wins.
+    The buffer flushes when the transaction it was written in commits, when
+    it reaches `max_size` writes, when it is flushed explicitly, or when its
+    `with` block exits without an error. The writes and the deletions of
+    a transaction or a savepoint which rolls back get discarded.
+    """
+
+    def __init__(self, max_size=None, using=None):
+        r"""
+        Initialize a `TranslationBuffer` with the number of the writes which
+        make it flush and the database alias of the transactions to flush on
+        the commits of.
+        """
+        self.max_size = max_size if max_size is not None \
+            else _get_buffer_size()
+        self.using = using
+        self.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+        else:
+            self.clear()
+
+    def __len__(self):
+        """Return the number of the buffered writes and deletions."""
+        self._discard_rolled_back()
+        return len(self._texts) + len(self._deletions)
+
+    def _get_address(self, obj):
+        r"""
+        Return the `(ct_id, obj_id)` address of a `Translatable` object and
+        remember the object for the flush.
+        """
+        model = type(obj)
+        if not issubclass(model, translations.models.Translatable):
+            raise TypeError('`{}` is not Translatable!'.format(model))
+        if not hasattr(obj, '_default_translatable_fields'):
+            obj._default_translatable_fields = {
+                field: getattr(obj, field) for field in
+                model._get_translatable_fields_names()
+            }
+        address = (ContentType.objects.get_for_model(model).id, str(obj.pk))
+        self._objs[address] = obj
+        return address
+
+    def write(self, obj, field, text, lang=None):
+        r"""
+        Buffer the write of the translation of an object's field in
+        a language.
+
+        Like the `Context`, an empty text or a text which is the same as
+        the source text leaves the translation as it is.
+        """
+        lang = _get_translate_language(lang)
+        if field not in type(obj)._get_translatable_fields_names():
+            raise ValueError(
+                '`{}` is not a translatable field of `{}`.'.format(
+                    field, type(obj).__name__,
+                )
+            )
+        if lang == _get_default_language():
+            return
+        self._track()
+        (ct_id, obj_id) = self._get_address(obj)
+        key = (ct_id, obj_id, field, lang)
+        if text and text != obj._default_translatable_fields.get(field):
+            self._texts[key] = text
+        else:
+            self._texts.pop(key, None)
+        self._schedule()
+
+    def delete(self, obj, lang=None):
+        r"""
+        Buffer the deletion of the translations of an object in a language.
+        """
+        lang = _get_translate_language(lang)
+        if lang == _get_default_language():
+            return
+        self._track()
+        (ct_id, obj_id) = self._get_address(obj)
+        for field in type(obj)._get_translatable_fields_names():
+            self._texts.pop((ct_id, obj_id, field, lang), None)
+        self._deletions.add((ct_id, obj_id, lang))
+        self._schedule()
+
+    def _discard_rolled_back(self):
+        r"""
+        Restore the buffer to its state before the first rolled back
+        transaction or savepoint it was written in, whose flush was dropped
+        from the commit hooks.
+        """
+        hooks = _get_commit_hooks(self.using)
+        for (i, (sids, hook, snapshot)) in enumerate(self._savepoints):
+            if hook not in hooks:
+                self._objs, self._texts, self._deletions = snapshot
+                del self._savepoints[i:]
+                return
+
+    def _track(self):
+        r"""
+        Discard the writes of the rolled back transactions, and remember
+        the state of the buffer before its first write in the current
+        transaction or savepoint, making it flush when the transaction
+        commits.
+        """
+        self._discard_rolled_back()
+        connection = transaction.get_connection(self.using)
+        if not connection.in_atomic_block:
+            return
+        sids = set(connection.savepoint_ids)
+        if any(entry[0] == sids for entry in self._savepoints):
+            return
+
+        def hook():
+            # the transaction committed, nothing can roll it back now
+            self._savepoints = []
+            self.flush()
+
+        snapshot = (
+            dict(self._objs), dict(self._texts), set(self._deletions),
+        )
+        self._savepoints.append((sids, hook, snapshot))
+        transaction.on_commit(hook, using=self.using)
+
+    def _schedule(self):
+        """Flush the buffer if it is full."""
+        if len(self) >= self.max_size:
+            self.flush()
+
+    def clear(self):
+        """Discard the buffered writes and deletions."""
+        self._objs = {}
+        self._texts = {}
+        self._deletions = set()
+        self._savepoints = []
+
+    def flush(self):
+        r"""
+        Write the buffered deletions and then the buffered writes of each
+        language in batched statements of `TRANSLATIONS_BATCH_SIZE` objects
+        or writes each.
+        """
+        self._discard_rolled_back()
+        objs, texts, deletions = self._objs, self._texts, self._deletions
+        self.clear()
+
+        langs = []
+        for key in list(deletions) + list(texts):
+            if key[-1] not in langs:
+                langs.append(key[-1])
+
+        batch_size = _get_batch_size()
+        # the whole flush is atomic already
+        with transaction.atomic(using=self.using):
+            for lang in langs:
+                mapping = {}
+                for (ct_id, obj_id, deleted_lang) in deletions:
+                    if deleted_lang == lang:
+                        mapping.setdefault(ct_id, {})[obj_id] = \
+                            objs[(ct_id, obj_id)]
+                if mapping:
+                    _run_batches(
+                        _get_batches(
+                            mapping, clear=True, batch_size=batch_size,
+                        ),
+                        lambda part, part_changes: _write_translations(
+                            part,
+                            lambda storage, mapping, changes:
+                                storage.delete(mapping, lang),
+                            lang,
+                            clear=True,
+                        ),
+                        atomic=False,
+                    )
+
+                mapping = {}
+                changes = []
+                for ((ct_id, obj_id, field, text_lang), text) in \
+                        texts.items():
+                    if text_lang == lang:
+                        mapping.setdefault(ct_id, {})[obj_id] = \
+                            objs[(ct_id, obj_id)]
+                        changes.append(({
+                            'content_type_id': ct_id,
+                            'object_id': obj_id,
+                            'field': field,
+                        }, text))
+                if changes:
+                    _run_batches(
+                        _get_batches(mapping, changes, batch_size=batch_size),
+                        lambda part, part_changes: _write_translations(
+                            part,
+                            lambda storage, mapping, changes:
+                                storage.update(mapping, changes, lang),
+                            lang,
+                            part_changes,
+                        ),
+                        atomic=False,
+                    )
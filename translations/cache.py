@@ -0,0 +1,536 @@
+"""This module contains the caches for the Translations app."""
+
+import time
+import itertools
+
+from django.db import models, transaction
+from django.conf import settings
+from django.core.signals import request_started
+from django.dispatch import receiver
+from django.core.cache import caches, DEFAULT_CACHE_ALIAS
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+
+import translations.models
+from translations.languages import _get_translation_languages, \
+    _get_supported_language
+from translations.utils import _get_translations, _get_object_ids_lookup, \
+    _get_commit_hooks
+from translations.catalogs import _get_catalog_texts
+from translations.interned import _get_shared_texts
+from translations.compressed import _decompress_text
+
+
+__docformat__ = 'restructuredtext'
+
+
+_VERSION_KEY = 'translations:version:{ct_id}'
+_TEXTS_KEY = \
+    'translations:texts:{ct_id}:{version}:{table_version}:{lang}:{obj_id}'
+
+_absentees = {}
+
+_translation_versions = {}
+_translation_versions_checked = None
+
+
+class _Absentees:
+    """A compact set of the ids of the objects without translations."""
+
+    MAX_INDEX = 1 << 26
+
+    def __init__(self):
+        """Initialize an empty `_Absentees`."""
+        self.bits = bytearray()
+        self.ids = set()
+
+    def _get_index(self, obj_id):
+        """Return the bit index of an object id or `None`."""
+        try:
+            index = int(obj_id)
+        except ValueError:
+            return None
+        if str(index) != obj_id or not 0 <= index < self.MAX_INDEX:
+            return None
+        return index
+
+    def add(self, obj_id):
+        """Add an object id to the `_Absentees`."""
+        index = self._get_index(obj_id)
+        if index is None:
+            self.ids.add(obj_id)
+        else:
+            byte = index >> 3
+            if byte >= len(self.bits):
+                self.bits.extend(bytes(byte + 1 - len(self.bits)))
+            self.bits[byte] |= 1 << (index & 7)
+
+    def __contains__(self, obj_id):
+        """Return whether an object id is in the `_Absentees`."""
+        index = self._get_index(obj_id)
+        if index is None:
+            return obj_id in self.ids
+        else:
+            byte = index >> 3
+            return byte < len(self.bits) and \
+                bool(self.bits[byte] & (1 << (index & 7)))
+
+
+def _get_cache():
+    """Return the cache which stores the translations or `None`."""
+    alias = getattr(settings, 'TRANSLATIONS_CACHE', None)
+    if alias is None:
+        return None
+    if alias is True:
+        alias = DEFAULT_CACHE_ALIAS
+    return caches[alias]
+
+
+def _get_cache_timeout():
+    """Return the timeout of the cached translations."""
+    return getattr(settings, 'TRANSLATIONS_CACHE_TIMEOUT', DEFAULT_TIMEOUT)
+
+
+def _get_negative_cache():
+    """Return whether to remember the objects without translations."""
+    return getattr(settings, 'TRANSLATIONS_NEGATIVE_CACHE', False)
+
+
+def _exclude_absentees(mapping, lang):
+    r"""
+    Return a `purview`\ 's mapping without the objects which are known to have
+    no translations in a language.
+    """
+    excluded = {}
+    for (ct_id, objs) in mapping.items():
+        absentees = _absentees.get((ct_id, lang))
+        if absentees is None:
+            excluded[ct_id] = objs
+        else:
+            excluded[ct_id] = {
+                obj_id: obj for (obj_id, obj) in objs.items()
+                if obj_id not in absentees
+            }
+    return excluded
+
+
+def _add_absentees(mapping, texts, lang):
+    r"""
+    Remember the objects of a `purview`\ 's mapping which have no texts in
+    a language.
+    """
+    for (ct_id, objs) in mapping.items():
+        absentees = None
+        for obj_id in objs:
+            if not texts.get((ct_id, obj_id)):
+                if absentees is None:
+                    absentees = _absentees.setdefault(
+                        (ct_id, lang), _Absentees()
+                    )
+                absentees.add(obj_id)
+
+
+def _forget_absentees(ct_ids, lang=None):
+    r"""
+    Forget the objects of some `ContentType`\ s which were known to have no
+    translations in a language or all of them.
+    """
+    ct_ids = set(ct_ids)
+    for (ct_id, absentees_lang) in list(_absentees.keys()):
+        if ct_id in ct_ids and lang in (None, absentees_lang):
+            _absentees.pop((ct_id, absentees_lang), None)
+
+
+def _get_translation_versions_interval():
+    """Return the number of seconds between the translation versions checks."""
+    return getattr(settings, 'TRANSLATIONS_VERSION_CHECK_INTERVAL', 1)
+
+
+def _bump_translation_versions(ct_ids, langs=None):
+    r"""
+    Bump the `TranslationVersion`\ s of some `ContentType`\ s in some
+    languages or all of them, creating the missing ones.
+    """
+    TranslationVersion = translations.models.TranslationVersion
+    ct_ids = set(ct_ids)
+    if langs is None:
+        langs = _get_translation_languages()
+    versions = TranslationVersion.objects.filter(
+        content_type__id__in=ct_ids,
+        language__in=langs,
+    )
+
+    bumped = versions.update(version=models.F('version') + 1)
+
+    if bumped < len(ct_ids) * len(langs):
+        # the versions of a racing writer are ignored and then bumped again
+        # along with the rest, which only has to change them
+        TranslationVersion.objects.bulk_create(
+            [
+                TranslationVersion(
+                    content_type_id=ct_id,
+                    language=lang,
+                    version=0,
+                )
+                for ct_id in ct_ids
+                for lang in langs
+            ],
+            ignore_conflicts=True,
+        )
+        versions.update(version=models.F('version') + 1)
+
+
+def _check_translation_versions():
+    r"""
+    Forget the translations known by the process which were changed by other
+    processes, at most once per request or per the configured interval.
+    """
+    global _translation_versions, _translation_versions_checked
+
+    interval = _get_translation_versions_interval()
+    now = time.monotonic()
+    if _translation_versions_checked is not None and (
+            interval is None or
+            now - _translation_versions_checked < interval):
+        return
+    _translation_versions_checked = now
+
+    versions = {
+        (ct_id, lang): version for (ct_id, lang, version) in
+        translations.models.TranslationVersion.objects.values_list(
+            'content_type_id', 'language', 'version',
+        )
+    }
+    for key in set(_translation_versions.keys()) | set(versions.keys()):
+        if _translation_versions.get(key) != versions.get(key):
+            _absentees.pop(key, None)
+    _translation_versions = versions
+
+
+@receiver(
+    request_started,
+    dispatch_uid='translations.cache.request_started',
+)
+def _expire_translation_versions(**kwargs):
+    """Let the translation versions be checked again in a new request."""
+    global _translation_versions_checked
+    if _get_translation_versions_interval() is None:
+        _translation_versions_checked = None
+
+
+def _get_initial_version():
+    """Return a version to start a content type's counter from."""
+    # a counter which was evicted from the cache must not restart at a value
+    # that the keys of its old (possibly stale) texts are still stamped with
+    return int(time.time() * 1000000)
+
+
+def _get_versions(cache, ct_ids):
+    r"""Return the cached versions of some `ContentType`\ s."""
+    keys = {ct_id: _VERSION_KEY.format(ct_id=ct_id) for ct_id in ct_ids}
+    found = cache.get_many(list(keys.values()))
+
+    versions = {}
+    for (ct_id, key) in keys.items():
+        if key in found:
+            versions[ct_id] = found[key]
+        else:
+            version = _get_initial_version()
+            if not cache.add(key, version, None):
+                version = cache.get(key, version)
+            versions[ct_id] = version
+    return versions
+
+
+class _VersionsBump:
+    r"""
+    The bump of the cached versions of some `ContentType`\ s which runs
+    when the transaction they were written in commits.
+    """
+
+    def __init__(self, ct_ids):
+        """Initialize a `_VersionsBump` with some `ContentType` ids."""
+        self.ct_ids = set(ct_ids)
+
+    def __call__(self):
+        r"""Bump the cached versions of the `ContentType`\ s."""
+        cache = _get_cache()
+        if cache is None:
+            return
+        for ct_id in self.ct_ids:
+            key = _VERSION_KEY.format(ct_id=ct_id)
+            # a lost increment of a racing writer still changes the version
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.add(key, _get_initial_version(), None)
+
+
+def _bump_versions(ct_ids):
+    r"""
+    Invalidate the cached translations of some `ContentType`\ s now and
+    again once the current transaction is committed.
+
+    The second bump drops the texts which other processes cached from
+    the committed rows while the transaction was in progress.
+    """
+    if _get_cache() is None:
+        return
+
+    bump = _VersionsBump(ct_ids)
+    bump()
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(bump)
+
+
+def _get_uncommitted_ct_ids():
+    r"""
+    Return the ids of the `ContentType`\ s whose translations were written
+    in the current transaction, which is not committed yet.
+    """
+    connection = transaction.get_connection()
+    ct_ids = set()
+    if connection.in_atomic_block:
+        for hook in _get_commit_hooks():
+            if isinstance(hook, _VersionsBump):
+                ct_ids |= hook.ct_ids
+    return ct_ids
+
+
+def _get_queried_texts(query, lang):
+    """Return the texts of the translations of a query in a language."""
+    texts = {}
+    interned = []
+    _translations = _get_translations(query, lang).values_list(
+        'content_type_id', 'object_id', 'field', 'text', 'shared_text_id',
+        'compressed_text',
+    )
+    for (ct_id, obj_id, field, text, shared_id, data) in _translations:
+        if data is not None:
+            text = _decompress_text(data)
+        texts.setdefault((ct_id, obj_id), {})[field] = text
+        if shared_id is not None:
+            interned.append((ct_id, obj_id, field, shared_id))
+
+    shared_texts = _get_shared_texts(
+        [shared_id for (_, _, _, shared_id) in interned]
+    )
+    for (ct_id, obj_id, field, shared_id) in interned:
+        texts[(ct_id, obj_id)][field] = shared_texts[shared_id]
+    return texts
+
+
+def _get_mapping_query(mapping):
+    r"""Return the query of a `purview`\ 's mapping."""
+    query = models.Q()
+    for (ct_id, objs) in mapping.items():
+        if objs:
+            model = ContentType.objects.get_for_id(ct_id).model_class()
+            query |= models.Q(
+                content_type__id=ct_id,
+                **_get_object_ids_lookup(model, objs)
+            )
+    return query
+
+
+def _get_texts_keys(versions, mapping, lang):
+    r"""
+    Return the cache keys of the texts of a `purview`\ 's mapping.
+
+    The keys carry the `TranslationVersion`\ s last checked by the process
+    too, so a cache of the process (like the `LocMemCache`) gets invalidated
+    by the writes of the other processes as well.
+    """
+    keys = {}
+    for (ct_id, objs) in mapping.items():
+        for obj_id in objs:
+            key = _TEXTS_KEY.format(
+                ct_id=ct_id,
+                version=versions[ct_id],
+                table_version=_translation_versions.get((ct_id, lang), 0),
+                lang=lang,
+                obj_id=obj_id,
+            )
+            keys[key] = (ct_id, obj_id)
+    return keys
+
+
+def _get_cached_texts(mapping, lang):
+    r"""
+    Return the texts of the translations of a `purview` in a language using
+    the cache.
+    """
+    cache = _get_cache()
+    versions = _get_versions(cache, mapping.keys())
+    keys = _get_texts_keys(versions, mapping, lang)
+
+    cached = cache.get_many(list(keys.keys()))
+
+    texts = {}
+    missing = {}
+    missing_mapping = {}
+    for (key, address) in keys.items():
+        if key in cached:
+            texts[address] = cached[key]
+        else:
+            missing[key] = address
+            missing_mapping.setdefault(address[0], {})[address[1]] = None
+
+    if missing:
+        fetched = _get_queried_texts(
+            _get_mapping_query(missing_mapping),
+            lang,
+        )
+        cache.set_many(
+            {
+                key: fetched.get(address, {})
+                for (key, address) in missing.items()
+            },
+            _get_cache_timeout(),
+        )
+        texts.update(fetched)
+
+    return texts
+
+
+def _warm_texts(mapping, lang):
+    r"""
+    Load the texts of the translations of a `purview` in a language into
+    the configured caches.
+    """
+    texts = _get_queried_texts(_get_mapping_query(mapping), lang)
+
+    cache = _get_cache()
+    if cache is not None:
+        versions = _get_versions(cache, mapping.keys())
+        keys = _get_texts_keys(versions, mapping, lang)
+        cache.set_many(
+            {key: texts.get(address, {}) for (key, address) in keys.items()},
+            _get_cache_timeout(),
+        )
+
+    if _get_negative_cache():
+        _add_absentees(mapping, texts, lang)
+
+    return texts
+
+
+def _get_warmup_chunk_size():
+    """Return the number of objects to warm up the translations of at once."""
+    return getattr(settings, 'TRANSLATIONS_WARMUP_CHUNK_SIZE', 2000)
+
+
+def _get_warmup_config():
+    r"""
+    Return the models and the languages to warm up the translations of,
+    as configured in the settings.
+    """
+    config = []
+    for (model_label, langs) in getattr(
+            settings, 'TRANSLATIONS_WARMUP', {}).items():
+        model = apps.get_model(model_label)
+        if langs is None:
+            langs = _get_translation_languages()
+        else:
+            langs = [_get_supported_language(lang) for lang in langs]
+        config.append((model, langs))
+    return config
+
+
+def _warm_translations(model, langs, chunk_size=None):
+    """
+    Load the translations of a model's objects in some languages into
+    the configured caches and return the number of the loaded translations.
+    """
+    if chunk_size is None:
+        chunk_size = _get_warmup_chunk_size()
+    if _get_cache() is not None or _get_negative_cache():
+        _check_translation_versions()
+
+    ct_id = ContentType.objects.get_for_model(model).id
+    pks = model._default_manager.order_by().values_list(
+        'pk', flat=True
+    ).iterator(chunk_size=chunk_size)
+
+    count = 0
+    while True:
+        chunk = [str(pk) for pk in itertools.islice(pks, chunk_size)]
+        if not chunk:
+            break
+        mapping = {ct_id: dict.fromkeys(chunk)}
+        for lang in langs:
+            texts = _warm_texts(mapping, lang)
+            count += sum(len(fields) for fields in texts.values())
+    return count
+
+
+def _get_texts(mapping, query, lang):
+    r"""
+    Return the texts of the translations of a `purview` in a language using
+    the configured caches.
+    """
+    catalog_texts, rest = _get_catalog_texts(mapping, lang)
+    if rest is not mapping:
+        mapping = rest
+        query = _get_mapping_query(mapping)
+
+    cache = _get_cache()
+    negative = _get_negative_cache()
+    if cache is not None or negative:
+        _check_translation_versions()
+    if negative:
+        mapping = _exclude_absentees(mapping, lang)
+        query = _get_mapping_query(mapping)
+
+    uncommitted = set(mapping) & _get_uncommitted_ct_ids() \
+        if cache is not None else set()
+    if cache is None:
+        texts = _get_queried_texts(query, lang)
+    elif uncommitted:
+        # the uncommitted texts must not be cached for the other processes
+        texts = {}
+        queried = {ct_id: mapping[ct_id] for ct_id in uncommitted}
+        if any(queried.values()):
+            texts.update(
+                _get_queried_texts(_get_mapping_query(queried), lang)
+            )
+        cached = {
+            ct_id: objs for (ct_id, objs) in mapping.items()
+            if ct_id not in uncommitted
+        }
+        if cached:
+            texts.update(_get_cached_texts(cached, lang))
+    else:
+        texts = _get_cached_texts(mapping, lang)
+
+    if negative:
+        _add_absentees(mapping, texts, lang)
+
+    texts.update(catalog_texts)
+    return texts
+
+
+def _forget_translations(ct_ids, lang=None):
+    r"""
+    Invalidate the translations of some `ContentType`\ s in a language,
+    a list of languages or all of them which are cached or remembered by
+    the process, without bumping their `TranslationVersion`\ s.
+    """
+    ct_ids = set(ct_ids)
+    langs = [lang] if isinstance(lang, str) else lang
+    _bump_versions(ct_ids)
+    if _get_negative_cache():
+        for absentees_lang in (langs if langs is not None else [None]):
+            _forget_absentees(ct_ids, absentees_lang)
+
+
+def _invalidate_translations(ct_ids, lang=None):
+    r"""
+    Invalidate the cached translations of some `ContentType`\ s in a language,
+    a list of languages or all of them, for the other processes too.
+    """
+    _forget_translations(ct_ids, lang)
+    _bump_translation_versions(
+        ct_ids, [lang] if isinstance(lang, str) else lang,
+    )
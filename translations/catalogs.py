@@ -0,0 +1,202 @@
+"""This module contains the compiled catalogs for the Translations app."""
+
+import os
+import mmap
+import struct
+
+from django.conf import settings
+
+
+__docformat__ = 'restructuredtext'
+
+
+_MAGIC = b'TRCATLG1'
+_HEADER = struct.Struct('<8sII')
+_CT_ID = struct.Struct('<I')
+_ENTRY = struct.Struct('<IIII')
+_SEP = '\x1f'
+
+_catalogs = {}
+
+
+def _get_catalogs_dir():
+    """Return the directory of the compiled catalogs or `None`."""
+    return getattr(settings, 'TRANSLATIONS_CATALOGS', None)
+
+
+def _get_catalog_path(directory, lang):
+    """Return the path of the compiled catalog of a language."""
+    return os.path.join(directory, '{}.catalog'.format(lang))
+
+
+def _get_key(ct_id, obj_id, field=''):
+    """Return the catalog key of an address."""
+    return _SEP.join([str(ct_id), obj_id, field]).encode('utf-8')
+
+
+def _write_catalog(path, ct_ids, entries, merge=False):
+    r"""
+    Write a compiled catalog of some `ContentType`\ s' translations to a path.
+
+    The entries are `(ct_id, obj_id, field, text)` tuples. When merging, the
+    other `ContentType`\ s of the catalog already at the path are kept with
+    their entries. The catalog is written next to the path and then moved
+    onto it, so the processes which have the old catalog mapped keep reading
+    it until they reload.
+    """
+    ct_ids = set(ct_ids)
+    entries = list(entries)
+
+    if merge:
+        try:
+            catalog = _Catalog(path)
+        except FileNotFoundError:
+            pass
+        else:
+            try:
+                kept_ct_ids = catalog.ct_ids - ct_ids
+                entries.extend(
+                    entry for entry in catalog.get_entries()
+                    if entry[0] in kept_ct_ids
+                )
+            finally:
+                catalog.buffer.close()
+            ct_ids |= kept_ct_ids
+
+    ct_ids = sorted(ct_ids)
+    items = sorted(
+        (_get_key(ct_id, obj_id, field), text.encode('utf-8'))
+        for (ct_id, obj_id, field, text) in entries
+    )
+
+    index = []
+    keys_size = sum(len(key) for (key, text) in items)
+    key_offset = 0
+    text_offset = keys_size
+    for (key, text) in items:
+        index.append(
+            _ENTRY.pack(key_offset, len(key), text_offset, len(text))
+        )
+        key_offset += len(key)
+        text_offset += len(text)
+
+    temp_path = '{}.{}.tmp'.format(path, os.getpid())
+    with open(temp_path, 'wb') as fh:
+        fh.write(_HEADER.pack(_MAGIC, len(ct_ids), len(items)))
+        for ct_id in ct_ids:
+            fh.write(_CT_ID.pack(ct_id))
+        fh.write(b''.join(index))
+        for (key, text) in items:
+            fh.write(key)
+        for (key, text) in items:
+            fh.write(text)
+    os.replace(temp_path, path)
+
+
+class _Catalog:
+    """A compiled catalog of translations mapped into the memory."""
+
+    def __init__(self, path):
+        """Initialize a `_Catalog` with the path of a compiled catalog."""
+        with open(path, 'rb') as fh:
+            self.mtime = os.fstat(fh.fileno()).st_mtime_ns
+            self.buffer = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, ct_count, self.count = _HEADER.unpack_from(self.buffer, 0)
+        if magic != _MAGIC:
+            raise ValueError(
+                '`{}` is not a translations catalog.'.format(path)
+            )
+
+        offset = _HEADER.size
+        self.ct_ids = {
+            _CT_ID.unpack_from(self.buffer, offset + i * _CT_ID.size)[0]
+            for i in range(ct_count)
+        }
+        self.index = offset + ct_count * _CT_ID.size
+        self.blob = self.index + self.count * _ENTRY.size
+
+    def _get_entry(self, i):
+        """Return the key and the text bounds of the i-th entry."""
+        key_offset, key_len, text_offset, text_len = _ENTRY.unpack_from(
+            self.buffer, self.index + i * _ENTRY.size
+        )
+        start = self.blob + key_offset
+        return self.buffer[start:start + key_len], text_offset, text_len
+
+    def _get_text(self, text_offset, text_len):
+        """Return a text of the catalog by its bounds."""
+        start = self.blob + text_offset
+        return self.buffer[start:start + text_len].decode('utf-8')
+
+    def get_entries(self):
+        """Yield the `(ct_id, obj_id, field, text)` entries of the catalog."""
+        for i in range(self.count):
+            key, text_offset, text_len = self._get_entry(i)
+            ct_id, obj_id, field = key.decode('utf-8').split(_SEP)
+            yield (
+                int(ct_id), obj_id, field,
+                self._get_text(text_offset, text_len),
+            )
+
+    def get_texts(self, ct_id, obj_id):
+        """Return the texts of an object's fields."""
+        prefix = _get_key(ct_id, obj_id)
+
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self._get_entry(middle)[0] < prefix:
+                low = middle + 1
+            else:
+                high = middle
+
+        texts = {}
+        for i in range(low, self.count):
+            key, text_offset, text_len = self._get_entry(i)
+            if not key.startswith(prefix):
+                break
+            field = key[len(prefix):].decode('utf-8')
+            texts[field] = self._get_text(text_offset, text_len)
+        return texts
+
+
+def _get_catalog(lang):
+    """Return the compiled catalog of a language or `None`."""
+    directory = _get_catalogs_dir()
+    if directory is None:
+        return None
+
+    path = _get_catalog_path(directory, lang)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        _catalogs.pop(path, None)
+        return None
+
+    catalog = _catalogs.get(path)
+    if catalog is None or catalog.mtime != mtime:
+        catalog = _catalogs[path] = _Catalog(path)
+    return catalog
+
+
+def _get_catalog_texts(mapping, lang):
+    r"""
+    Return the texts of the catalogued translations of a `purview` in
+    a language and the mapping of the rest of it.
+    """
+    catalog = _get_catalog(lang)
+    if catalog is None:
+        return {}, mapping
+
+    texts = {}
+    rest = {}
+    for (ct_id, objs) in mapping.items():
+        if ct_id in catalog.ct_ids:
+            for obj_id in objs:
+                obj_texts = catalog.get_texts(ct_id, obj_id)
+                if obj_texts:
+                    texts[(ct_id, obj_id)] = obj_texts
+        else:
+            rest[ct_id] = objs
+    return texts, rest
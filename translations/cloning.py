@@ -0,0 +1,89 @@
+"""This module contains the cloning utilities for the Translations app."""
+
+from django.db import transaction, connections
+from django.contrib.contenttypes.models import ContentType
+
+import translations.models
+from translations.languages import _get_translation_languages
+from translations.storages import _get_storage, _get_storages_mappings
+from translations.context import Context
+from translations.revisions import _is_revision_log_enabled
+
+
+__docformat__ = 'restructuredtext'
+
+
+def _get_chunk_size(using):
+    r"""
+    Return the number of the objects whose translations get copied in one
+    statement, which keeps the parameters of the statement under the limit
+    of the database.
+    """
+    max_query_params = connections[using].features.max_query_params
+    if max_query_params is None:
+        return 2000
+    return max(max_query_params // 5, 1)
+
+
+def _clone_by_context(model, pks, using=None):
+    r"""
+    Copy the translations of some objects of a model in all the languages
+    to their clones using a `Context` over the clones, which logs their
+    revisions.
+    """
+    manager = model._base_manager.using(using)
+    ct_id = ContentType.objects.get_for_model(model).id
+    sources = Context(list(manager.filter(pk__in=list(pks))))
+    clones = Context(list(manager.filter(pk__in=list(pks.values()))))
+    clone_objs = clones.mapping.get(ct_id, {})
+
+    texts = {}
+    for lang in _get_translation_languages():
+        stored = {}
+        for (storage, mapping) in _get_storages_mappings(sources.mapping):
+            stored.update(storage.read_stored(mapping, lang))
+        lang_texts = {}
+        for (old_pk, pk) in pks.items():
+            clone = clone_objs.get(str(pk))
+            values = stored.get((ct_id, str(old_pk)))
+            if clone is not None and values:
+                lang_texts[clone] = values
+        if lang_texts:
+            texts[lang] = lang_texts
+    clones.create_many(texts)
+
+
+def clone_translations(pks, chunk_size=None, using=None):
+    r"""
+    Copy the translations of some `Translatable` objects in all
+    the languages to their clones, given as a dictionary of the models to
+    the dictionaries of the primary keys of the objects to those of
+    the clones, and return the number of the objects whose translations
+    got copied.
+
+    The translations get copied with set-based statements through
+    the storages of the models, which take a constant number of queries per
+    `chunk_size` objects of each model, in one transaction. If the revision
+    log is enabled, they get copied through a `Context` over the clones
+    instead, which logs their revisions.
+    """
+    using = using or 'default'
+    if chunk_size is None:
+        chunk_size = _get_chunk_size(using)
+
+    revisions = _is_revision_log_enabled()
+    count = 0
+    with transaction.atomic(using=using):
+        for (model, model_pks) in pks.items():
+            if not issubclass(model, translations.models.Translatable):
+                raise TypeError('`{}` is not Translatable!'.format(model))
+            storage = _get_storage(model)
+            items = list(model_pks.items())
+            for i in range(0, len(items), chunk_size):
+                chunk = dict(items[i:i + chunk_size])
+                if revisions:
+                    _clone_by_context(model, chunk, using)
+                else:
+                    storage.copy(model, chunk, using)
+            count += len(items)
+    return count
@@ -0,0 +1,43 @@
+"""This module contains the compressed texts for the Translations app."""
+
+import zlib
+import lzma
+
+
+__docformat__ = 'restructuredtext'
+
+
+_METHODS = {
+    'zlib': (b'z', zlib),
+    'lzma': (b'x', lzma),
+}
+
+
+def _get_compression_methods():
+    """Return the names of the supported compression methods."""
+    return list(_METHODS)
+
+
+def _get_compressed_text(text, threshold, method):
+    """
+    Return the compressed data of a text using a method, headed by the tag of
+    the method, if the text is at least `threshold` bytes long and
+    compressing it saves space, otherwise `None`.
+    """
+    raw = text.encode('utf-8')
+    if len(raw) < threshold:
+        return None
+    tag, module = _METHODS[method]
+    data = tag + module.compress(raw)
+    if len(data) >= len(raw):
+        return None
+    return data
+
+
+def _decompress_text(data):
+    """Return the text of some compressed data."""
+    data = bytes(data)
+    for (tag, module) in _METHODS.values():
+        if data[:1] == tag:
+            return module.decompress(data[1:]).decode('utf-8')
+    raise ValueError('The compressed text has an unknown method.')
@@ -1,17 +1,265 @@
 """This module contains the context managers for the Translations app."""
 
-from django.db import models
+import time
+import random
+import contextlib
+
+from django.db import transaction, IntegrityError, OperationalError
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
 
-import translations.models
 from translations.languages import _get_default_language, \
     _get_translate_language
 from translations.utils import _get_relations_hierarchy, _get_purview, \
-    _get_translations
+    _to_async
+from translations.storages import _get_storages_mappings
+from translations.materialized import _get_materialized_mapping, \
+    _read_materialized, _write_materialized
+from translations.revisions import _is_revision_log_enabled, \
+    _log_revisions, _log_deletions, _read_revisions
+from translations.cache import _forget_translations
 
 
 __docformat__ = 'restructuredtext'
 
 
+_CONFLICTS = ('error', 'ignore', 'update')
+
+
+# unique violation on PostgreSQL, duplicate entry on MySQL
+_RETRIED_UNIQUE_SQLSTATES = ('23505',)
+_RETRIED_UNIQUE_MYSQL_CODES = (1062,)
+
+# "UNIQUE constraint failed" on SQLite, the duplicate keys elsewhere
+_RETRIED_UNIQUE_MESSAGES = ('unique constraint', 'duplicate')
+
+# serialization failure, deadlock and lock not available on PostgreSQL
+_RETRIED_SQLSTATES = ('40001', '40P01', '55P03')
+
+# lock wait timeout and deadlock on MySQL
+_RETRIED_MYSQL_CODES = (1205, 1213)
+
+# the locked database or table on SQLite, the deadlocks elsewhere
+_RETRIED_MESSAGES = ('locked', 'deadlock')
+
+
+def _is_retried(error):
+    r"""
+    Return whether a failed write conflicts with a concurrent one, so
+    a retry may succeed: a unique constraint violation, a lock timeout,
+    a deadlock or a serialization failure. The other integrity errors,
+    like the `NOT NULL` or the foreign key violations, fail again.
+    """
+    cause = error.__cause__
+    sqlstate = getattr(cause, 'pgcode', None) or \
+        getattr(cause, 'sqlstate', None)
+    args = getattr(cause, 'args', ())
+    code = args[0] if args else None
+    message = str(error).lower()
+    if isinstance(error, IntegrityError):
+        return sqlstate in _RETRIED_UNIQUE_SQLSTATES or \
+            code in _RETRIED_UNIQUE_MYSQL_CODES or \
+            any(part in message for part in _RETRIED_UNIQUE_MESSAGES)
+    return sqlstate in _RETRIED_SQLSTATES or \
+        code in _RETRIED_MYSQL_CODES or \
+        any(part in message for part in _RETRIED_MESSAGES)
+
+
+def _get_write_retries():
+    """Return the number of the retries of the conflicting writes."""
+    return getattr(settings, 'TRANSLATIONS_WRITE_RETRIES', 3)
+
+
+def _get_batch_size():
+    r"""
+    Return the number of the changes, or the objects for the deletions,
+    which a write batch takes, or `None` for a single batch.
+
+    The default keeps the lookups of a batch, three parameters per change,
+    under the 999 parameters of the older SQLite versions.
+    """
+    return getattr(settings, 'TRANSLATIONS_BATCH_SIZE', 250)
+
+
+def _is_atomic():
+    """Return whether the writes run in a single transaction."""
+    return getattr(settings, 'TRANSLATIONS_ATOMIC', True)
+
+
+def _get_batches(mapping, changes=(), clear=False, batch_size=None):
+    r"""
+    Yield the batches of a write of a `purview`\ 's mapping and its changes,
+    each as a part of the mapping, the changes of it, the number of
+    the changes written with it and the number of all of them.
+
+    The deletions (if `clear` is set) get batched by the objects instead.
+    """
+    changes = list(changes)
+    if clear:
+        items = [
+            (ct_id, obj_id)
+            for (ct_id, objs) in mapping.items()
+            for obj_id in objs
+        ]
+    else:
+        items = [
+            (address['content_type_id'], address['object_id'])
+            for (address, text) in changes
+        ]
+    total = len(items)
+    if not batch_size or total <= batch_size:
+        yield (mapping, changes, total, total)
+        return
+    for i in range(0, total, batch_size):
+        part = {}
+        for (ct_id, obj_id) in items[i:i + batch_size]:
+            part.setdefault(ct_id, {})[obj_id] = mapping[ct_id][obj_id]
+        yield (
+            part,
+            changes[i:i + batch_size],
+            min(i + batch_size, total),
+            total,
+        )
+
+
+def _get_languages_batches(mapping, changes, batch_size=None):
+    r"""
+    Yield the batches of a write of a `purview`\ 's mapping and its changes
+    in some languages like `_get_batches`, with the changes of each batch as
+    a dictionary of the languages to the changes.
+    """
+    items = [
+        (lang, address, text)
+        for (lang, lang_changes) in changes.items()
+        for (address, text) in lang_changes
+    ]
+    total = len(items)
+    if not batch_size or total <= batch_size:
+        yield (mapping, changes, total, total)
+        return
+    for i in range(0, total, batch_size):
+        part = {}
+        part_changes = {}
+        for (lang, address, text) in items[i:i + batch_size]:
+            ct_id = address['content_type_id']
+            obj_id = address['object_id']
+            part.setdefault(ct_id, {})[obj_id] = mapping[ct_id][obj_id]
+            part_changes.setdefault(lang, []).append((address, text))
+        yield (part, part_changes, min(i + batch_size, total), total)
+
+
+def _run_batches(batches, write, atomic=True, progress=None):
+    r"""
+    Write the batches of a write with a function of the part of the mapping
+    and the changes of each batch.
+
+    The batches run in a single transaction if `atomic` is set and there
+    are several of them, and `progress` gets called with the number of
+    the changes written so far and the number of all of them after each
+    batch.
+    """
+    batches = list(batches)
+    if atomic and len(batches) > 1:
+        atomic = transaction.atomic()
+    else:
+        atomic = contextlib.ExitStack()
+    with atomic:
+        for (mapping, changes, done, total) in batches:
+            write(mapping, changes)
+            if progress is not None:
+                progress(done, total)
+
+
+def _lock_objects(mapping):
+    r"""
+    Lock the rows of the objects of a `purview`\ 's mapping for the rest of
+    the transaction, in the order of their primary keys.
+    """
+    for ct_id in sorted(mapping):
+        model = ContentType.objects.get_for_id(ct_id).model_class()
+        list(
+            model._base_manager.select_for_update().filter(
+                pk__in=[obj.pk for obj in mapping[ct_id].values()],
+            ).order_by('pk').values_list('pk', flat=True)
+        )
+
+
+def _write_translations(mapping, write, lang, changes=(), clear=False):
+    r"""
+    Write the translations of a `purview`\ 's mapping in a language using
+    a write method of their storages.
+
+    The write method gets called with each part of the mapping and
+    the changes of that part. The shadow columns of the materialized
+    language get the changes too, or get cleared if `clear` is set, and so
+    does the revision log if it is enabled.
+    """
+    changes = list(changes)
+    storages = _get_storages_mappings(mapping)
+    materialized = _get_materialized_mapping(mapping, lang)
+    revisions = _is_revision_log_enabled()
+    if len(storages) > 1 or materialized or revisions:
+        atomic = transaction.atomic()
+    else:
+        atomic = contextlib.ExitStack()
+    with atomic:
+        for (storage, part) in storages:
+            part_changes = [
+                (address, text) for (address, text) in changes
+                if address['content_type_id'] in part
+            ]
+            # a write without changes would only bump the versions
+            if part_changes or clear:
+                write(storage, part, part_changes)
+        if materialized:
+            _write_materialized(materialized, changes, lang, clear)
+        if revisions:
+            if clear:
+                _log_deletions(mapping, lang)
+            else:
+                _log_revisions(changes, lang)
+
+
+def _write_languages(mapping, write, changes):
+    r"""
+    Write the translations of a `purview`\ 's mapping in some languages
+    using a multi-language write method of their storages.
+
+    The write method gets called with each part of the mapping and
+    the changes of that part as a dictionary of the languages to
+    the changes. The shadow columns of the materialized languages get
+    the changes too, and so does the revision log if it is enabled.
+    """
+    storages = _get_storages_mappings(mapping)
+    materialized = {}
+    for lang in changes:
+        lang_materialized = _get_materialized_mapping(mapping, lang)
+        if lang_materialized:
+            materialized[lang] = lang_materialized
+    revisions = _is_revision_log_enabled()
+    if len(storages) > 1 or materialized or revisions:
+        atomic = transaction.atomic()
+    else:
+        atomic = contextlib.ExitStack()
+    with atomic:
+        for (storage, part) in storages:
+            part_changes = {}
+            for (lang, lang_changes) in changes.items():
+                lang_part_changes = [
+                    (address, text) for (address, text) in lang_changes
+                    if address['content_type_id'] in part
+                ]
+                if lang_part_changes:
+                    part_changes[lang] = lang_part_changes
+            if part_changes:
+                write(storage, part, part_changes)
+        for (lang, lang_materialized) in materialized.items():
+            _write_materialized(lang_materialized, changes[lang], lang)
+        if revisions:
+            for (lang, lang_changes) in changes.items():
+                _log_revisions(lang_changes, lang)
+
+
 class Context:
     """A context manager which provides custom translation functionalities."""
 
@@ -42,62 +290,386 @@ class Context:
                             'field': field,
                         }, text)
 
-    def create(self, lang=None):
+    def _write(self, write, lang, changes=(), clear=False,
+               batch_size=None, atomic=None, progress=None):
+        r"""
+        Write the translations of the `Context`\ 's `purview` in a language
+        using a write method of their storages.
+
+        The write gets split into batches of `batch_size` changes (or
+        objects if `clear` is set) which run in a single transaction if
+        `atomic` is set, and `progress` gets called with the number of
+        the changes written so far and the number of all of them after each
+        batch. A single batch is as atomic as its storages make it.
+        """
+        if batch_size is None:
+            batch_size = _get_batch_size()
+        if atomic is None:
+            atomic = _is_atomic()
+        _run_batches(
+            _get_batches(self.mapping, changes, clear, batch_size),
+            lambda mapping, part:
+                _write_translations(mapping, write, lang, part, clear),
+            atomic,
+            progress,
+        )
+
+    def _write_many(self, write, changes,
+                    batch_size=None, atomic=None, progress=None):
+        r"""
+        Write the translations of the `Context`\ 's `purview` in some
+        languages using a multi-language write method of their storages.
+
+        The changes are a dictionary of the languages to the changes, which
+        get split into batches like in `_write`.
+        """
+        if batch_size is None:
+            batch_size = _get_batch_size()
+        if atomic is None:
+            atomic = _is_atomic()
+        _run_batches(
+            _get_languages_batches(self.mapping, changes, batch_size),
+            lambda mapping, part: _write_languages(mapping, write, part),
+            atomic,
+            progress,
+        )
+
+    def _write_safely(self, run, langs, lock=False, atomic=None):
+        r"""
+        Run a write of the translations of the `Context`\ 's `purview` in
+        some languages, retrying the write in a savepoint if it conflicts
+        with a concurrent one. The other errors are raised right away.
+
+        The write takes its changes again for each try. The rows of
+        the objects get locked first if `lock` is set, and for the retries
+        anyway. If `atomic` is not set the write runs once and outside of
+        a transaction, since a retry needs the savepoint to roll back to.
+        """
+        if atomic is None:
+            atomic = _is_atomic()
+        if not atomic and not lock:
+            run()
+            return
+        retries = _get_write_retries()
+        for attempt in range(retries + 1):
+            try:
+                with transaction.atomic():
+                    # the retries lock the objects, so they take turns
+                    # rather than conflicting with each other again
+                    if lock or attempt:
+                        _lock_objects(self.mapping)
+                    run()
+                return
+            except (IntegrityError, OperationalError) as error:
+                if attempt == retries or not _is_retried(error):
+                    raise
+            # the versions were bumped in the rolled back savepoint
+            _forget_translations(self.mapping.keys(), langs)
+            time.sleep(random.uniform(0, 0.01 * 2 ** attempt))
+
+    def _get_new_fields(self, lang, changes=None):
+        r"""
+        Return the info about the changed fields in the `Context`\ 's
+        `purview`, or some changes of it, which have no translations in
+        a language.
+
+        The translations are checked in the database, since a stale cache
+        or catalog would let an existing one be inserted again.
+        """
+        if changes is None:
+            changes = self._get_changed_fields()
+        texts = {}
+        for (storage, mapping) in _get_storages_mappings(self.mapping):
+            texts.update(storage.read_stored(mapping, lang))
+        return [
+            (address, text) for (address, text) in changes
+            if address['field'] not in texts.get(
+                (address['content_type_id'], address['object_id']), {}
+            )
+        ]
+
+    def _get_texts_changes(self, texts):
+        r"""
+        Return the changes of the `Context`\ 's `purview` in some languages
+        as a dictionary of the languages to the changes.
+
+        The texts are a dictionary of the languages to the dictionaries of
+        the objects to the dictionaries of their fields to the texts, or to
+        the functions which return those of an object. Like the changed
+        fields, the empty texts and the texts which are the same as
+        the source texts are skipped.
+        """
+        changes = {}
+        for (lang, lang_texts) in texts.items():
+            lang = _get_translate_language(lang)
+            if lang == _get_default_language():
+                continue
+            for (ct_id, objs) in self.mapping.items():
+                for (obj_id, obj) in objs.items():
+                    if callable(lang_texts):
+                        fields = lang_texts(obj)
+                    else:
+                        fields = lang_texts.get(obj)
+                    names = type(obj)._get_translatable_fields_names()
+                    for (field, text) in (fields or {}).items():
+                        if field not in names:
+                            raise ValueError(
+                                '`{}` is not a translatable field of '
+                                '`{}`.'.format(field, type(obj).__name__)
+                            )
+                        default = obj._default_translatable_fields.get(field)
+                        if text and text != default:
+                            changes.setdefault(lang, []).append(({
+                                'content_type_id': ct_id,
+                                'object_id': obj_id,
+                                'field': field,
+                            }, text))
+        return changes
+
+    def create(self, lang=None, conflicts='error', lock=False,
+               batch_size=None, atomic=None, progress=None):
         r"""
         Create the translations of the `Context`\ 's `purview` in a language.
+
+        `conflicts` is what to do with the translations which exist:
+        `error` raises an `IntegrityError`, `ignore` leaves them as they are
+        and `update` overwrites them. `batch_size`, `atomic` and `progress`
+        control the batches of the write.
         """
+        if conflicts not in _CONFLICTS:
+            raise ValueError(
+                '`{}` is not a conflict mode.'.format(conflicts)
+            )
         lang = _get_translate_language(lang)
-        if lang != _get_default_language():
-            _translations = [
-                translations.models.Translation(
-                    language=lang, text=text, **address
-                ) for address, text in self._get_changed_fields()
-            ]
-            translations.models.Translation.objects.bulk_create(_translations)
+        if lang == _get_default_language():
+            return
+        options = {'batch_size': batch_size, 'progress': progress}
+        if conflicts == 'update':
+            self.update(lang, lock=lock, atomic=atomic, **options)
+        elif conflicts == 'ignore':
+            self._write_safely(
+                lambda: self._write(
+                    lambda storage, mapping, changes:
+                        storage.create(mapping, changes, lang),
+                    lang,
+                    self._get_new_fields(lang),
+                    atomic=False,
+                    **options
+                ),
+                [lang],
+                lock,
+                atomic,
+            )
+        else:
+            with transaction.atomic() if lock else contextlib.ExitStack():
+                if lock:
+                    _lock_objects(self.mapping)
+                self._write(
+                    lambda storage, mapping, changes:
+                        storage.create(mapping, changes, lang),
+                    lang,
+                    self._get_changed_fields(),
+                    atomic=atomic,
+                    **options
+                )
+
+    def create_many(self, texts, conflicts='error', lock=False,
+                    batch_size=None, atomic=None, progress=None):
+        r"""
+        Create the translations of the `Context`\ 's `purview` in some
+        languages from their texts, in one pass over the purview.
+
+        The texts are a dictionary of the languages to the dictionaries of
+        the objects to the dictionaries of their fields to the texts, or to
+        the functions which return those of an object. `conflicts`, `lock`,
+        `batch_size`, `atomic` and `progress` work like in `create`.
+        """
+        if conflicts not in _CONFLICTS:
+            raise ValueError(
+                '`{}` is not a conflict mode.'.format(conflicts)
+            )
+        changes = self._get_texts_changes(texts)
+        options = {'batch_size': batch_size, 'progress': progress}
+        if conflicts == 'update':
+            self._update_many(changes, lock=lock, atomic=atomic, **options)
+        elif conflicts == 'ignore':
+            def _get_new_changes():
+                return {
+                    lang: self._get_new_fields(lang, lang_changes)
+                    for (lang, lang_changes) in changes.items()
+                }
+
+            self._write_safely(
+                lambda: self._write_many(
+                    lambda storage, mapping, changes:
+                        storage.create_many(mapping, changes),
+                    _get_new_changes(),
+                    atomic=False,
+                    **options
+                ),
+                list(changes),
+                lock,
+                atomic,
+            )
+        else:
+            with transaction.atomic() if lock else contextlib.ExitStack():
+                if lock:
+                    _lock_objects(self.mapping)
+                self._write_many(
+                    lambda storage, mapping, changes:
+                        storage.create_many(mapping, changes),
+                    changes,
+                    atomic=atomic,
+                    **options
+                )
 
-    def read(self, lang=None):
+    async def acreate(self, lang=None, conflicts='error', lock=False,
+                      batch_size=None, atomic=None, progress=None):
         r"""
-        Read the translations of the `Context`\ 's `purview` in a language.
+        Create the translations of the `Context`\ 's `purview` in a language
+        asynchronously, in the thread of the sync code.
+        """
+        await _to_async(self.create)(
+            _get_translate_language(lang), conflicts, lock,
+            batch_size, atomic, progress,
+        )
+
+    def read(self, lang=None, as_of=None):
+        r"""
+        Read the translations of the `Context`\ 's `purview` in a language,
+        or as they were at a time in the revision log if `as_of` is set.
         """
         lang = _get_translate_language(lang)
         if lang != _get_default_language():
-            _translations = _get_translations(self.query, lang)
-            for translation in _translations:
-                ct_id = translation.content_type.id
-                obj_id = translation.object_id
-                field = translation.field
-                text = translation.text
+            if as_of is not None:
+                texts = _read_revisions(self.mapping, lang, as_of)
+            else:
+                materialized = _get_materialized_mapping(self.mapping, lang)
+                texts = _read_materialized(materialized, lang)
+                rest = {
+                    ct_id: objs for (ct_id, objs) in self.mapping.items()
+                    if ct_id not in materialized
+                }
+                for (storage, mapping) in _get_storages_mappings(rest):
+                    texts.update(storage.read(mapping, lang))
+            for ((ct_id, obj_id), fields) in texts.items():
                 obj = self.mapping[ct_id][obj_id]
-                if field in type(obj)._get_translatable_fields_names():
-                    setattr(obj, field, text)
+                for (field, text) in fields.items():
+                    if field in type(obj)._get_translatable_fields_names():
+                        setattr(obj, field, text)
         else:
             self.reset()
 
-    def update(self, lang=None):
+    async def aread(self, lang=None, as_of=None):
+        r"""
+        Read the translations of the `Context`\ 's `purview` in a language
+        asynchronously, in a thread of its own so that the reads of
+        independent contexts can run concurrently.
+        """
+        await _to_async(self.read, concurrent=True)(
+            _get_translate_language(lang), as_of,
+        )
+
+    def update(self, lang=None, lock=False,
+               batch_size=None, atomic=None, progress=None):
         r"""
         Update the translations of the `Context`\ 's `purview` in a language.
+
+        The update gets retried in a savepoint if it conflicts with
+        a concurrent one. The rows of the objects get locked first if `lock`
+        is set. `batch_size`, `atomic` and `progress` control the batches of
+        the write.
         """
         lang = _get_translate_language(lang)
         if lang != _get_default_language():
-            query = models.Q()
-            _translations = []
-            for address, text in self._get_changed_fields():
-                query |= models.Q(**address)
-                _translations.append(
-                    translations.models.Translation(
-                        language=lang, text=text, **address
-                    )
-                )
-            _get_translations(query, lang).delete()
-            translations.models.Translation.objects.bulk_create(_translations)
+            self._write_safely(
+                lambda: self._write(
+                    lambda storage, mapping, changes:
+                        storage.update(mapping, changes, lang),
+                    lang,
+                    self._get_changed_fields(),
+                    batch_size=batch_size,
+                    atomic=False,
+                    progress=progress,
+                ),
+                [lang],
+                lock,
+                atomic,
+            )
+
+    def _update_many(self, changes, lock=False,
+                     batch_size=None, atomic=None, progress=None):
+        r"""
+        Update the translations of some changes of the `Context`\ 's
+        `purview` in some languages.
+        """
+        self._write_safely(
+            lambda: self._write_many(
+                lambda storage, mapping, changes:
+                    storage.update_many(mapping, changes),
+                changes,
+                batch_size=batch_size,
+                atomic=False,
+                progress=progress,
+            ),
+            list(changes),
+            lock,
+            atomic,
+        )
 
-    def delete(self, lang=None):
+    def update_many(self, texts, lock=False,
+                    batch_size=None, atomic=None, progress=None):
+        r"""
+        Update the translations of the `Context`\ 's `purview` in some
+        languages from their texts, in one pass over the purview.
+
+        The texts are like in `create_many`, and `lock`, `batch_size`,
+        `atomic` and `progress` work like in `update`.
+        """
+        self._update_many(
+            self._get_texts_changes(texts),
+            lock, batch_size, atomic, progress,
+        )
+
+    async def aupdate(self, lang=None, lock=False,
+                      batch_size=None, atomic=None, progress=None):
+        r"""
+        Update the translations of the `Context`\ 's `purview` in a language
+        asynchronously, in the thread of the sync code.
+        """
+        await _to_async(self.update)(
+            _get_translate_language(lang), lock,
+            batch_size, atomic, progress,
+        )
+
+    def delete(self, lang=None, batch_size=None, atomic=None, progress=None):
         r"""
         Delete the translations of the `Context`\ 's `purview` in a language.
+
+        `batch_size`, `atomic` and `progress` control the batches of
+        the write, which are counted in objects.
         """
         lang = _get_translate_language(lang)
         if lang != _get_default_language():
-            _get_translations(self.query, lang).delete()
+            self._write(
+                lambda storage, mapping, changes:
+                    storage.delete(mapping, lang),
+                lang,
+                clear=True,
+                batch_size=batch_size,
+                atomic=atomic,
+                progress=progress,
+            )
+
+    async def adelete(self, lang=None, batch_size=None, atomic=None,
+                      progress=None):
+        r"""
+        Delete the translations of the `Context`\ 's `purview` in a language
+        asynchronously, in the thread of the sync code.
+        """
+        await _to_async(self.delete)(
+            _get_translate_language(lang), batch_size, atomic, progress,
+        )
 
     def reset(self):
         r"""
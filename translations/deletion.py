@@ -0,0 +1,151 @@
+"""This module contains the deletion collector for the Translations app."""
+
+from django.db.models import signals
+from django.db.models.deletion import Collector, CASCADE, DO_NOTHING, \
+    get_candidate_relations_to_delete
+from django.contrib.contenttypes.models import ContentType
+
+import translations.models
+from translations.utils import _get_object_ids_query
+
+
+__docformat__ = 'restructuredtext'
+
+
+def _is_translatable(model):
+    """Return whether a model is `Translatable`."""
+    return model is not None and \
+        issubclass(model, translations.models.Translatable)
+
+
+def _has_signal_listeners(model):
+    """Return whether anything listens to the deletion signals of a model."""
+    return signals.pre_delete.has_listeners(model) or \
+        signals.post_delete.has_listeners(model)
+
+
+class _Collector(Collector):
+    r"""
+    A collector which deletes the generic translations of the `Translatable`
+    objects in set-based statements per content type.
+
+    The translations of a queryset get deleted by a `DELETE` filtering on
+    the object ids in a subquery, and those of the fetched objects by
+    a `DELETE` per chunk of their object ids, so no translation gets
+    fetched. A queryset which nothing but its translations refers to does
+    not get fetched either. The translations keep the default behavior if
+    anything listens to their deletion signals.
+
+    If `signals` is not set, the objects are not fetched for the deletion
+    signals receivers. The objects which get fetched anyway, to cascade
+    their deletion, still send the signals.
+    """
+
+    def __init__(self, using, signals=True, chunk_size=2000):
+        """Initialize a `_Collector` with a database alias."""
+        super(_Collector, self).__init__(using)
+        self.signals = signals
+        self.chunk_size = chunk_size
+
+    def _has_signal_listeners(self, model):
+        return self.signals and _has_signal_listeners(model)
+
+    def _handles_translations(self, model):
+        """Return whether the collector deletes the translations of a model."""
+        return _is_translatable(model) and \
+            not _has_signal_listeners(translations.models.Translation)
+
+    def _get_translations(self, model, object_ids):
+        r"""
+        Return the `Translation`\ s queryset of a model's object ids, which
+        is a subquery or a list.
+        """
+        return translations.models.Translation.objects.filter(**{
+            'content_type': ContentType.objects.get_for_model(model),
+            '{}__in'.format(model._get_object_id_field_name()): object_ids,
+        })
+
+    def can_fast_delete(self, objs, from_field=None):
+        r"""
+        Return whether some objects can be deleted without being fetched,
+        not counting the translations of the `Translatable` querysets.
+        """
+        model = getattr(objs, 'model', None)
+        if hasattr(objs, '_meta') or not hasattr(objs, '_raw_delete') or \
+                not self._handles_translations(model):
+            return super(_Collector, self).can_fast_delete(objs, from_field)
+
+        if from_field and from_field.remote_field.on_delete is not CASCADE:
+            return False
+        if self._has_signal_listeners(model):
+            return False
+        opts = model._meta
+        relation = opts.get_field('translations')
+        return (
+            all(
+                link == from_field
+                for link in opts.concrete_model._meta.parents.values()
+            ) and
+            all(
+                related.field.remote_field.on_delete is DO_NOTHING
+                for related in get_candidate_relations_to_delete(opts)
+            ) and
+            not any(
+                hasattr(field, 'bulk_related_objects')
+                for field in opts.private_fields
+                if field is not relation
+            )
+        )
+
+    def add(self, objs, source=None, nullable=False, reverse_dependency=False):
+        r"""
+        Add some objects to the collection, along with the deletion of
+        the translations of the `Translatable` ones in chunks.
+        """
+        new_objs = super(_Collector, self).add(
+            objs, source, nullable, reverse_dependency,
+        )
+        if new_objs and self._handles_translations(type(new_objs[0])):
+            model = type(new_objs[0])
+            object_ids = [str(obj.pk) for obj in new_objs]
+            if model._get_object_id_field_name() == 'object_int_id':
+                object_ids = [obj.pk for obj in new_objs]
+            for i in range(0, len(object_ids), self.chunk_size):
+                self.fast_deletes.append(
+                    self._get_translations(
+                        model, object_ids[i:i + self.chunk_size],
+                    )
+                )
+        return new_objs
+
+    def collect(self, objs, source=None, nullable=False, **kwargs):
+        r"""
+        Add some objects to the collection with the objects which their
+        deletion cascades to.
+        """
+        model = getattr(objs, 'model', None)
+        if model is translations.models.Translation and \
+                self._handles_translations(source):
+            # `add` deleted them already
+            return
+        if self._handles_translations(model) and \
+                self.can_fast_delete(objs):
+            self.fast_deletes.append(
+                self._get_translations(
+                    model, _get_object_ids_query(model, objs),
+                )
+            )
+            self.fast_deletes.append(objs)
+            return
+        super(_Collector, self).collect(objs, source, nullable, **kwargs)
+
+    def delete(self):
+        r"""
+        Delete the collected objects and return the number of the deleted
+        objects with the numbers per model, leaving out the models of which
+        nothing got deleted like Django 3.1 does.
+        """
+        deleted, rows_count = super(_Collector, self).delete()
+        return deleted, {
+            label: count for (label, count) in rows_count.items() if count
+        }
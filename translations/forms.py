@@ -21,6 +21,12 @@ def generate_translation_form(translatable):
         field = forms.ChoiceField(choices=fields)
         language = forms.ChoiceField(choices=languages)
 
+        def __init__(self, *args, **kwargs):
+            super(TranslationForm, self).__init__(*args, **kwargs)
+            if self.instance.shared_text_id is not None or \
+                    self.instance.compressed_text is not None:
+                self.initial['text'] = self.instance.get_text()
+
         class Meta:
             model = Translation
             fields = (
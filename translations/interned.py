@@ -0,0 +1,57 @@
+"""This module contains the interned texts for the Translations app."""
+
+import hashlib
+
+import translations.models
+
+
+__docformat__ = 'restructuredtext'
+
+
+def _get_text_hash(text):
+    """Return the hash of a text which keys its shared text."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _intern_texts(texts):
+    r"""
+    Return the ids of the shared texts of some texts as a dictionary of
+    the texts to the ids, creating the missing `TranslationText`\ s.
+
+    The shared texts are looked up in one query and the missing ones are
+    created in another one. The created ones are looked up again, since
+    a concurrent writer may have created some of them first.
+    """
+    model = translations.models.TranslationText
+    hashes = {_get_text_hash(text): text for text in set(texts)}
+    if not hashes:
+        return {}
+
+    ids = dict(
+        model.objects.filter(
+            hash__in=hashes.keys(),
+        ).values_list('hash', 'id')
+    )
+    missing = [
+        model(hash=key, text=text)
+        for (key, text) in hashes.items() if key not in ids
+    ]
+    if missing:
+        model.objects.bulk_create(missing, ignore_conflicts=True)
+        ids.update(
+            model.objects.filter(
+                hash__in=[text.hash for text in missing],
+            ).values_list('hash', 'id')
+        )
+    return {text: ids[key] for (key, text) in hashes.items()}
+
+
+def _get_shared_texts(ids):
+    """Return the shared texts of some ids as a dictionary of the ids."""
+    if not ids:
+        return {}
+    return dict(
+        translations.models.TranslationText.objects.filter(
+            id__in=set(ids),
+        ).values_list('id', 'text')
+    )
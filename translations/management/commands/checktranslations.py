@@ -0,0 +1,131 @@
+"""
+This module contains the checktranslations command for the Translations app.
+"""
+
+from django.core.management.base import (
+    BaseCommand, CommandError,
+)
+from django.db.models import Count
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+
+from translations.models import Translation, Translatable
+from translations.languages import _get_supported_language
+
+
+__docformat__ = 'restructuredtext'
+
+
+class Command(BaseCommand):
+    """
+    The command which finds the stale translations of some models, whose
+    source texts changed since they were written.
+    """
+
+    help = (
+        'Find the stale translations of some models, whose source texts '
+        'changed since they were written.'
+    )
+
+    def add_arguments(self, parser):
+        """
+        Add the arguments that the `Command` accepts on an `ArgumentParser`.
+        """
+        parser.add_argument(
+            'args',
+            metavar='app_label.ModelName',
+            nargs='*',
+            help=(
+                'Specify the model(s) to check the translations of. '
+                'Defaults to all the translatable models.'
+            ),
+        )
+        parser.add_argument(
+            '--language',
+            action='append',
+            dest='languages',
+            help=(
+                'Specify the language(s) to check. '
+                'Defaults to all the languages.'
+            ),
+        )
+
+    def get_content_types(self, *model_labels):
+        r"""Return the `ContentType`\ s of some models to check."""
+        if model_labels:
+            models = []
+            for model_label in model_labels:
+                try:
+                    model = apps.get_model(model_label)
+                except (LookupError, ValueError):
+                    raise CommandError(
+                        "Model '{}' is not found.".format(model_label)
+                    )
+                if not issubclass(model, Translatable):
+                    raise CommandError(
+                        "Model '{}' is not Translatable.".format(model_label)
+                    )
+                models.append(model)
+        else:
+            models = [
+                model for model in apps.get_models()
+                if issubclass(model, Translatable)
+            ]
+        return list(ContentType.objects.get_for_models(*models).values())
+
+    def get_stale_translations(self, content_types, languages=None):
+        r"""
+        Return the stale translations of some `ContentType`\ s in some
+        languages.
+        """
+        translations = Translation.objects.filter(
+            content_type__in=content_types,
+        )
+        if languages:
+            try:
+                languages = [
+                    _get_supported_language(lang) for lang in languages
+                ]
+            except ValueError as e:
+                raise CommandError(str(e))
+            translations = translations.filter(language__in=languages)
+        return translations.stale()
+
+    def handle(self, *model_labels, **options):
+        """Run the `Command` with the configured arguments."""
+        content_types = self.get_content_types(*model_labels)
+        stale = self.get_stale_translations(
+            content_types,
+            options['languages'],
+        )
+
+        counts = stale.order_by(
+            'content_type_id', 'language',
+        ).values_list(
+            'content_type_id', 'language',
+        ).annotate(
+            count=Count('id'),
+        )
+        for (ct_id, lang, count) in counts:
+            model = ContentType.objects.get_for_id(ct_id).model_class()
+            if options['verbosity'] >= 1:
+                self.stdout.write(
+                    'Found {} stale translations of `{}` in `{}`.'.format(
+                        count, model._meta.label, lang,
+                    )
+                )
+            if options['verbosity'] >= 2:
+                entries = stale.filter(
+                    content_type_id=ct_id,
+                    language=lang,
+                ).order_by('object_id', 'field').values_list(
+                    'object_id', 'field',
+                )
+                for (obj_id, field) in entries:
+                    self.stdout.write('  {}: {}'.format(obj_id, field))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                'Check successful.'
+            )
+        )
@@ -0,0 +1,131 @@
+"""
+This module contains the clonetranslations command for the Translations
+app.
+"""
+
+from django.core.management.base import (
+    BaseCommand, CommandError,
+)
+from django.db import transaction
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+
+from translations.models import Translation, Translatable
+from translations.languages import _get_supported_language
+
+
+__docformat__ = 'restructuredtext'
+
+
+class Command(BaseCommand):
+    """
+    The command which copies the translations of some models in a language
+    to another language.
+    """
+
+    help = (
+        'Copy the translations of some models in a language to another '
+        'language.'
+    )
+
+    def add_arguments(self, parser):
+        """
+        Add the arguments that the `Command` accepts on an `ArgumentParser`.
+        """
+        parser.add_argument(
+            'source',
+            help='Specify the language to copy the translations from.',
+        )
+        parser.add_argument(
+            'target',
+            help='Specify the language to copy the translations to.',
+        )
+        parser.add_argument(
+            'args',
+            metavar='app_label.ModelName',
+            nargs='*',
+            help=(
+                'Specify the model(s) to copy the translations of. '
+                'Defaults to all the models.'
+            ),
+        )
+        parser.add_argument(
+            '--skip-conflicts',
+            action='store_true',
+            dest='skip_conflicts',
+            help=(
+                'Leave the translations which exist in the target language '
+                'as they are instead of failing.'
+            ),
+        )
+
+    def get_languages(self, source, target):
+        """Return the supported codes of the languages to copy between."""
+        try:
+            return (
+                _get_supported_language(source),
+                _get_supported_language(target),
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+    def get_models(self, *model_labels):
+        """Return the models whose translations are copied."""
+        models = []
+        for model_label in model_labels:
+            try:
+                model = apps.get_model(model_label)
+            except (LookupError, ValueError):
+                raise CommandError(
+                    "Model '{}' is not found.".format(model_label)
+                )
+            if not issubclass(model, Translatable):
+                raise CommandError(
+                    "Model '{}' is not Translatable.".format(model_label)
+                )
+            models.append(model)
+        return models
+
+    def handle(self, *model_labels, **options):
+        """Run the `Command` with the configured arguments."""
+        source, target = self.get_languages(
+            options['source'],
+            options['target'],
+        )
+        models = self.get_models(*model_labels)
+
+        if models:
+            querysets = [
+                (
+                    model._meta.label,
+                    Translation.objects.filter(
+                        content_type=ContentType.objects.get_for_model(model),
+                    ),
+                ) for model in models
+            ]
+        else:
+            querysets = [(None, Translation.objects.all())]
+
+        with transaction.atomic():
+            for (label, queryset) in querysets:
+                try:
+                    count = queryset.clone_language(
+                        source, target,
+                        skip_conflicts=options['skip_conflicts'],
+                    )
+                except ValueError as e:
+                    raise CommandError(str(e))
+                if options['verbosity'] >= 1:
+                    self.stdout.write(
+                        'Cloned {} translations{} from `{}` to `{}`.'.format(
+                            count,
+                            ' of `{}`'.format(label) if label else '',
+                            source, target,
+                        )
+                    )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                'Cloning successful.'
+            )
+        )
@@ -0,0 +1,150 @@
+"""
+This module contains the compiletranslations command for the Translations app.
+"""
+
+import os
+
+from django.core.management.base import (
+    BaseCommand, CommandError,
+)
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+
+from translations.models import Translation, Translatable
+from translations.languages import _get_translation_languages, \
+    _get_supported_language
+from translations.catalogs import _get_catalogs_dir, _get_catalog_path, \
+    _write_catalog
+
+
+__docformat__ = 'restructuredtext'
+
+
+class Command(BaseCommand):
+    """
+    The command which compiles the translations of some models into
+    read-only catalogs.
+    """
+
+    help = 'Compile the translations of some models into read-only catalogs.'
+
+    def add_arguments(self, parser):
+        """
+        Add the arguments that the `Command` accepts on an `ArgumentParser`.
+        """
+        parser.add_argument(
+            'args',
+            metavar='app_label.ModelName',
+            nargs='+',
+            help='Specify the model(s) to compile the translations of.',
+        )
+        parser.add_argument(
+            '--language',
+            action='append',
+            dest='languages',
+            help=(
+                'Specify the language(s) to compile the translations in. '
+                'Defaults to all the translation languages.'
+            ),
+        )
+        parser.add_argument(
+            '--output',
+            dest='output',
+            help=(
+                'Specify the directory to write the catalogs to. '
+                'Defaults to the TRANSLATIONS_CATALOGS setting.'
+            ),
+        )
+        parser.add_argument(
+            '--replace',
+            action='store_true',
+            dest='replace',
+            help=(
+                'Replace the catalogs with the given model(s) only instead '
+                'of keeping the other models already compiled in them.'
+            ),
+        )
+
+    def get_content_types(self, *model_labels):
+        r"""Return the `ContentType`\ s of some models."""
+        models = []
+        for model_label in model_labels:
+            try:
+                model = apps.get_model(model_label)
+            except (LookupError, ValueError):
+                raise CommandError(
+                    "Model '{}' is not found.".format(model_label)
+                )
+            if not issubclass(model, Translatable):
+                raise CommandError(
+                    "Model '{}' is not Translatable.".format(model_label)
+                )
+            models.append(model)
+        return list(ContentType.objects.get_for_models(*models).values())
+
+    def get_entries(self, content_types, lang):
+        r"""
+        Yield the translations of some `ContentType`\ s in a language as
+        catalog entries.
+        """
+        for content_type in content_types:
+            model = content_type.model_class()
+            entries = Translation.objects.filter(
+                content_type=content_type,
+                language=lang,
+                field__in=model._get_translatable_fields_names(),
+            ).select_related('shared_text').only(
+                'object_id', 'field', 'text', 'compressed_text',
+                'shared_text__text',
+            )
+            for translation in entries.iterator():
+                yield (
+                    content_type.id,
+                    translation.object_id,
+                    translation.field,
+                    translation.get_text(),
+                )
+
+    def handle(self, *model_labels, **options):
+        """Run the `Command` with the configured arguments."""
+        output = options['output'] or _get_catalogs_dir()
+        if not output:
+            raise CommandError(
+                'Specify the output directory with --output or the '
+                'TRANSLATIONS_CATALOGS setting.'
+            )
+        os.makedirs(output, exist_ok=True)
+
+        if options['languages']:
+            try:
+                langs = [
+                    _get_supported_language(lang)
+                    for lang in options['languages']
+                ]
+            except ValueError as e:
+                raise CommandError(str(e))
+        else:
+            langs = _get_translation_languages()
+
+        content_types = self.get_content_types(*model_labels)
+
+        for lang in langs:
+            entries = list(self.get_entries(content_types, lang))
+            _write_catalog(
+                _get_catalog_path(output, lang),
+                [content_type.id for content_type in content_types],
+                entries,
+                merge=not options['replace'],
+            )
+            if options['verbosity'] >= 1:
+                self.stdout.write(
+                    'Compiled {} translations in `{}`.'.format(
+                        len(entries), lang,
+                    )
+                )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                'Compilation successful.'
+            )
+        )
@@ -0,0 +1,242 @@
+"""
+This module contains the compresstranslations command for the Translations
+app.
+"""
+
+import time
+
+from django.core.management.base import (
+    BaseCommand, CommandError,
+)
+from django.db import transaction
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+
+from translations.models import Translation, Translatable
+from translations.storages import TableStorage, CompressedTableStorage, \
+    _get_storage
+from translations.compressed import _get_compression_methods, \
+    _get_compressed_text, _decompress_text
+from translations.cache import _invalidate_translations
+
+
+__docformat__ = 'restructuredtext'
+
+
+class Command(BaseCommand):
+    """
+    The command which compresses the existing long translations of some
+    models or benchmarks compressing them.
+    """
+
+    help = (
+        'Compress the existing long translations of some models or benchmark '
+        'compressing them.'
+    )
+
+    def add_arguments(self, parser):
+        """
+        Add the arguments that the `Command` accepts on an `ArgumentParser`.
+        """
+        parser.add_argument(
+            'args',
+            metavar='app_label.ModelName',
+            nargs='+',
+            help='Specify the model(s) to compress the translations of.',
+        )
+        parser.add_argument(
+            '--benchmark',
+            action='store_true',
+            dest='benchmark',
+            help=(
+                'Report the storage size and the read cost of each '
+                'compression method instead of compressing.'
+            ),
+        )
+        parser.add_argument(
+            '--threshold',
+            type=int,
+            dest='threshold',
+            help=(
+                'Specify the size of the texts to compress in bytes. '
+                'Defaults to the threshold of the storage of each model.'
+            ),
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            dest='chunk_size',
+            default=2000,
+            help='Specify the number of translations to compress at once.',
+        )
+
+    def get_models(self, *model_labels, benchmark=False):
+        r"""
+        Return the models whose translations are compressed, or only kept
+        in the `Translation` table if benchmarking.
+        """
+        models = []
+        for model_label in model_labels:
+            try:
+                model = apps.get_model(model_label)
+            except (LookupError, ValueError):
+                raise CommandError(
+                    "Model '{}' is not found.".format(model_label)
+                )
+            if not issubclass(model, Translatable):
+                raise CommandError(
+                    "Model '{}' is not Translatable.".format(model_label)
+                )
+            storage = _get_storage(model)
+            if benchmark:
+                if not isinstance(storage, TableStorage):
+                    raise CommandError(
+                        "Model '{}' has no translations in the translation "
+                        "table.".format(model_label)
+                    )
+            elif not isinstance(storage, CompressedTableStorage):
+                raise CommandError(
+                    "Model '{}' has no compressed translations.".format(
+                        model_label
+                    )
+                )
+            models.append(model)
+        return models
+
+    def get_threshold(self, model, threshold=None):
+        """Return the size of the texts of a model to compress in bytes."""
+        if threshold is not None:
+            return threshold
+        return getattr(
+            _get_storage(model), 'threshold',
+            CompressedTableStorage().threshold,
+        )
+
+    def get_texts(self, model):
+        """Yield the texts of the translations of a model."""
+        translations = Translation.objects.filter(
+            content_type=ContentType.objects.get_for_model(model),
+        ).select_related('shared_text')
+        for translation in translations.iterator():
+            yield translation.get_text()
+
+    def compress(self, model, threshold, chunk_size):
+        r"""
+        Compress the uncompressed long translations of a model and return
+        the number of the compressed translations.
+        """
+        storage = _get_storage(model)
+        content_type = ContentType.objects.get_for_model(model)
+
+        count = 0
+        last_id = 0
+        while True:
+            chunk = list(
+                Translation.objects.filter(
+                    content_type=content_type,
+                    shared_text__isnull=True,
+                    compressed_text__isnull=True,
+                    id__gt=last_id,
+                ).order_by('id')[:chunk_size]
+            )
+            if not chunk:
+                break
+            last_id = chunk[-1].id
+
+            compressed = []
+            for translation in chunk:
+                data = _get_compressed_text(
+                    translation.text, threshold, storage.method,
+                )
+                if data is not None:
+                    translation.text = ''
+                    translation.compressed_text = data
+                    compressed.append(translation)
+            Translation.objects.bulk_update(
+                compressed, ['text', 'compressed_text'],
+            )
+            count += len(compressed)
+
+        _invalidate_translations([content_type.id])
+        return count
+
+    def benchmark(self, model, threshold):
+        r"""
+        Return the number of the compressed translations, the raw and
+        the stored sizes of the translations and the time to read
+        the compressed ones per compression method.
+        """
+        texts = list(self.get_texts(model))
+        results = []
+        for method in _get_compression_methods():
+            raw_size = 0
+            stored_size = 0
+            compressed = []
+            for text in texts:
+                size = len(text.encode('utf-8'))
+                data = _get_compressed_text(text, threshold, method)
+                raw_size += size
+                if data is None:
+                    stored_size += size
+                else:
+                    stored_size += len(data)
+                    compressed.append(data)
+
+            start = time.perf_counter()
+            for data in compressed:
+                _decompress_text(data)
+            elapsed = time.perf_counter() - start
+
+            results.append(
+                (method, len(compressed), raw_size, stored_size, elapsed)
+            )
+        return results
+
+    def handle(self, *model_labels, **options):
+        """Run the `Command` with the configured arguments."""
+        models = self.get_models(
+            *model_labels,
+            benchmark=options['benchmark'],
+        )
+
+        if options['benchmark']:
+            for model in models:
+                threshold = self.get_threshold(model, options['threshold'])
+                for (method, count, raw_size, stored_size, elapsed) in \
+                        self.benchmark(model, threshold):
+                    self.stdout.write(
+                        '`{}` with {}: {} translations compressed, '
+                        '{} bytes stored of {} ({:.1%}), '
+                        '{:.1f} µs per compressed read.'.format(
+                            model._meta.label, method, count,
+                            stored_size, raw_size,
+                            stored_size / raw_size if raw_size else 1,
+                            elapsed / count * 1e6 if count else 0,
+                        )
+                    )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    'Benchmark successful.'
+                )
+            )
+            return
+
+        with transaction.atomic():
+            for model in models:
+                count = self.compress(
+                    model,
+                    self.get_threshold(model, options['threshold']),
+                    options['chunk_size'],
+                )
+                if options['verbosity'] >= 1:
+                    self.stdout.write(
+                        'Compressed {} translations of `{}`.'.format(
+                            count, model._meta.label,
+                        )
+                    )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                'Compression successful.'
+            )
+        )
@@ -0,0 +1,155 @@
+"""
+This module contains the materializetranslations command for the Translations
+app.
+"""
+
+from django.core.management.base import (
+    BaseCommand, CommandError,
+)
+from django.db import transaction
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+
+from translations.models import Translatable
+from translations.languages import _get_supported_language
+from translations.storages import _get_storage
+from translations.materialized import _get_shadow_name
+
+
+__docformat__ = 'restructuredtext'
+
+
+class Command(BaseCommand):
+    """
+    The command which fills the shadow columns of the materialized languages
+    of some models from their translations.
+    """
+
+    help = (
+        'Fill the shadow columns of the materialized languages of some models '
+        'from their translations.'
+    )
+
+    def add_arguments(self, parser):
+        """
+        Add the arguments that the `Command` accepts on an `ArgumentParser`.
+        """
+        parser.add_argument(
+            'args',
+            metavar='app_label.ModelName',
+            nargs='+',
+            help='Specify the model(s) to fill the shadow columns of.',
+        )
+        parser.add_argument(
+            '--language',
+            action='append',
+            dest='languages',
+            help=(
+                'Specify the materialized language(s) to fill. '
+                'Defaults to all the materialized languages of each model.'
+            ),
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            dest='chunk_size',
+            default=2000,
+            help='Specify the number of objects to fill at once.',
+        )
+
+    def get_config(self, *model_labels, languages=None):
+        """Return the models and the materialized languages to fill."""
+        try:
+            if languages:
+                languages = [
+                    _get_supported_language(lang) for lang in languages
+                ]
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        config = []
+        for model_label in model_labels:
+            try:
+                model = apps.get_model(model_label)
+            except (LookupError, ValueError):
+                raise CommandError(
+                    "Model '{}' is not found.".format(model_label)
+                )
+            if not issubclass(model, Translatable):
+                raise CommandError(
+                    "Model '{}' is not Translatable.".format(model_label)
+                )
+            langs = model._get_materialized_languages()
+            if languages:
+                for lang in languages:
+                    if lang not in langs:
+                        raise CommandError(
+                            "Model '{}' does not materialize `{}`.".format(
+                                model_label, lang,
+                            )
+                        )
+                langs = languages
+            config.append((model, langs))
+        return config
+
+    def materialize(self, model, lang, chunk_size):
+        r"""
+        Fill the shadow columns of a model in a materialized language from
+        the stored translations, bypassing the caches, with a bulk update per
+        chunk, and return the number of the filled translations.
+        """
+        ct_id = ContentType.objects.get_for_model(model).id
+        storage = _get_storage(model)
+        fields = model._get_translatable_fields_names()
+
+        count = 0
+        objs = model._base_manager.order_by('pk')
+        last_pk = None
+        while True:
+            chunk = objs if last_pk is None else objs.filter(pk__gt=last_pk)
+            chunk = list(chunk[:chunk_size])
+            if not chunk:
+                break
+            last_pk = chunk[-1].pk
+
+            mapping = {ct_id: {str(obj.pk): obj for obj in chunk}}
+            texts = storage.read_stored(mapping, lang)
+            for obj in chunk:
+                obj_texts = texts.get((ct_id, str(obj.pk)), {})
+                for field in fields:
+                    setattr(
+                        obj,
+                        _get_shadow_name(field, lang),
+                        obj_texts.get(field),
+                    )
+                count += len(obj_texts)
+            model._base_manager.bulk_update(
+                chunk, [_get_shadow_name(field, lang) for field in fields],
+            )
+        return count
+
+    def handle(self, *model_labels, **options):
+        """Run the `Command` with the configured arguments."""
+        config = self.get_config(
+            *model_labels,
+            languages=options['languages'],
+        )
+
+        with transaction.atomic():
+            for (model, langs) in config:
+                for lang in langs:
+                    count = self.materialize(
+                        model, lang, options['chunk_size'],
+                    )
+                    if options['verbosity'] >= 1:
+                        self.stdout.write(
+                            'Filled {} translations of `{}` in `{}`.'.format(
+                                count, model._meta.label, lang,
+                            )
+                        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                'Materialization successful.'
+            )
+        )
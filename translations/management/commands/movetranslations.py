@@ -0,0 +1,151 @@
+"""
+This module contains the movetranslations command for the Translations app.
+"""
+
+from django.core.management.base import (
+    BaseCommand, CommandError,
+)
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+
+from translations.models import Translation, Translatable
+from translations.storages import ModelTableStorage, _get_storage
+from translations.cache import _invalidate_translations
+
+
+__docformat__ = 'restructuredtext'
+
+
+class Command(BaseCommand):
+    """
+    The command which moves the translations of some models from
+    the `Translation` table to their dedicated tables.
+    """
+
+    help = (
+        'Move the translations of some models from the translation table to '
+        'their dedicated tables.'
+    )
+
+    def add_arguments(self, parser):
+        """
+        Add the arguments that the `Command` accepts on an `ArgumentParser`.
+        """
+        parser.add_argument(
+            'args',
+            metavar='app_label.ModelName',
+            nargs='+',
+            help='Specify the model(s) to move the translations of.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            dest='chunk_size',
+            default=2000,
+            help='Specify the number of translations to move at once.',
+        )
+
+    def get_models(self, *model_labels):
+        """Return the models with dedicated translation tables."""
+        models = []
+        for model_label in model_labels:
+            try:
+                model = apps.get_model(model_label)
+            except (LookupError, ValueError):
+                raise CommandError(
+                    "Model '{}' is not found.".format(model_label)
+                )
+            if not issubclass(model, Translatable):
+                raise CommandError(
+                    "Model '{}' is not Translatable.".format(model_label)
+                )
+            if not isinstance(_get_storage(model), ModelTableStorage):
+                raise CommandError(
+                    "Model '{}' has no dedicated translation table.".format(
+                        model_label
+                    )
+                )
+            models.append(model)
+        return models
+
+    def move_translations(self, model, chunk_size):
+        r"""
+        Move the translations of a model to its dedicated table and return
+        the number of the moved and the orphaned translations.
+        """
+        translation_model = _get_storage(model).get_translation_model(model)
+        content_type = ContentType.objects.get_for_model(model)
+        pk_field = model._meta.pk
+
+        moved = 0
+        orphaned = 0
+        while True:
+            chunk = list(
+                Translation.objects.filter(
+                    content_type=content_type,
+                ).select_related('shared_text').order_by('id')[:chunk_size]
+            )
+            if not chunk:
+                break
+
+            pks = {}
+            for translation in chunk:
+                try:
+                    pks[translation.object_id] = pk_field.to_python(
+                        translation.object_id
+                    )
+                except ValidationError:
+                    pks[translation.object_id] = None
+            existing = set(
+                model._base_manager.filter(
+                    pk__in=set(pks.values()),
+                ).values_list('pk', flat=True)
+            )
+            rows = [
+                translation_model(
+                    source_id=pks[translation.object_id],
+                    field=translation.field,
+                    language=translation.language,
+                    text=translation.get_text(),
+                ) for translation in chunk
+                if pks[translation.object_id] in existing
+            ]
+            translation_model.objects.bulk_create(rows)
+            Translation.objects.filter(
+                id__in=[translation.id for translation in chunk],
+            ).delete()
+
+            moved += len(rows)
+            orphaned += len(chunk) - len(rows)
+
+        _invalidate_translations([content_type.id])
+        return moved, orphaned
+
+    def handle(self, *model_labels, **options):
+        """Run the `Command` with the configured arguments."""
+        models = self.get_models(*model_labels)
+
+        with transaction.atomic():
+            for model in models:
+                moved, orphaned = self.move_translations(
+                    model, options['chunk_size'],
+                )
+                if options['verbosity'] >= 1:
+                    self.stdout.write(
+                        'Moved {} translations of `{}`.'.format(
+                            moved, model._meta.label,
+                        )
+                    )
+                    if orphaned:
+                        self.stdout.write(
+                            'Dropped {} translations of missing `{}` '
+                            'objects.'.format(orphaned, model._meta.label)
+                        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                'Move successful.'
+            )
+        )
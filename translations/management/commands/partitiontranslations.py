@@ -0,0 +1,161 @@
+"""
+This module contains the partitiontranslations command for the Translations
+app.
+"""
+
+import re
+
+from django.core.management.base import (
+    BaseCommand, CommandError,
+)
+from django.db import connections, transaction, DEFAULT_DB_ALIAS
+
+from translations.models import Translation
+from translations.languages import _get_translation_languages, \
+    _get_supported_language
+from translations.partitions import _get_partitioning_sql, \
+    _get_repartitioning_sql
+
+
+__docformat__ = 'restructuredtext'
+
+
+_PARTITION_BOUND = re.compile(r"FOR VALUES IN \('(.*)'\)")
+
+
+class Command(BaseCommand):
+    """
+    The command which partitions the translations table by language on
+    PostgreSQL.
+    """
+
+    help = 'Partition the translations table by language on PostgreSQL.'
+
+    def add_arguments(self, parser):
+        """
+        Add the arguments that the `Command` accepts on an `ArgumentParser`.
+        """
+        parser.add_argument(
+            '--language',
+            action='append',
+            dest='languages',
+            help=(
+                'Specify the language(s) to give their own partitions. '
+                'Defaults to all the translation languages.'
+            ),
+        )
+        parser.add_argument(
+            '--database',
+            default=DEFAULT_DB_ALIAS,
+            help='Specify the database to partition the translations on.',
+        )
+        parser.add_argument(
+            '--sql',
+            action='store_true',
+            dest='sql',
+            help='Print the statements instead of running them.',
+        )
+
+    def get_languages(self, languages=None):
+        """Return the languages to give their own partitions."""
+        if not languages:
+            return _get_translation_languages()
+        try:
+            return [_get_supported_language(lang) for lang in languages]
+        except ValueError as e:
+            raise CommandError(str(e))
+
+    def fetch(self, cursor, sql, params):
+        """Return the rows of a query."""
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
+    def get_statements(self, connection, langs):
+        """Return the statements which partition the translations table."""
+        table = Translation._meta.db_table
+        with connection.cursor() as cursor:
+            partitioned = self.fetch(
+                cursor,
+                'SELECT 1 FROM pg_partitioned_table '
+                'WHERE partrelid = %s::regclass',
+                [table],
+            )
+            if partitioned:
+                bounds = self.fetch(
+                    cursor,
+                    'SELECT pg_get_expr(c.relpartbound, c.oid) '
+                    'FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid '
+                    'WHERE i.inhparent = %s::regclass',
+                    [table],
+                )
+                existing = set()
+                for (bound,) in bounds:
+                    match = _PARTITION_BOUND.match(bound)
+                    if match:
+                        existing.add(match.group(1))
+                return _get_repartitioning_sql(
+                    table,
+                    [lang for lang in langs if lang not in existing],
+                )
+
+            constraints = self.fetch(
+                cursor,
+                'SELECT conname, pg_get_constraintdef(oid) '
+                'FROM pg_constraint WHERE conrelid = %s::regclass '
+                'ORDER BY contype DESC, conname',
+                [table],
+            )
+            indexes = self.fetch(
+                cursor,
+                'SELECT i.relname, pg_get_indexdef(i.oid) '
+                'FROM pg_index x JOIN pg_class i ON i.oid = x.indexrelid '
+                'WHERE x.indrelid = %s::regclass AND NOT EXISTS ('
+                'SELECT 1 FROM pg_constraint c '
+                'WHERE c.conindid = x.indexrelid) '
+                'ORDER BY i.relname',
+                [table],
+            )
+            ((sequence,),) = self.fetch(
+                cursor,
+                "SELECT pg_get_serial_sequence(%s, 'id')",
+                [table],
+            )
+        return _get_partitioning_sql(
+            table, langs, constraints, indexes, sequence,
+        )
+
+    def handle(self, *args, **options):
+        """Run the `Command` with the configured arguments."""
+        connection = connections[options['database']]
+        if connection.vendor != 'postgresql':
+            raise CommandError(
+                'Partitioning the translations is only supported on '
+                'PostgreSQL.'
+            )
+        if connection.pg_version < 110000:
+            raise CommandError(
+                'Partitioning the translations requires PostgreSQL 11 or '
+                'newer.'
+            )
+
+        langs = self.get_languages(options['languages'])
+
+        with transaction.atomic(using=connection.alias):
+            statements = self.get_statements(connection, langs)
+            if options['sql']:
+                for statement in statements:
+                    self.stdout.write('{};'.format(statement))
+                return
+            with connection.cursor() as cursor:
+                for statement in statements:
+                    cursor.execute(statement)
+
+        if options['verbosity'] >= 1:
+            self.stdout.write(
+                'Ran {} statements.'.format(len(statements))
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                'Partitioning successful.'
+            )
+        )
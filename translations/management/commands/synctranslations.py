@@ -12,6 +12,7 @@ from django.db.models import Q
 from django.contrib.contenttypes.models import ContentType
 
 from translations.models import Translation, Translatable
+from translations.cache import _invalidate_translations
 
 
 __docformat__ = 'restructuredtext'
@@ -210,6 +211,9 @@ class Command(BaseCommand):
 
             if run_synchronization:
                 obsolete_translations.delete()
+                _invalidate_translations(
+                    [content_type.id for content_type in content_types]
+                )
             else:
                 self.stdout.write(
                     'Synchronization cancelled.'
@@ -0,0 +1,110 @@
+"""
+This module contains the warmtranslations command for the Translations app.
+"""
+
+from django.core.management.base import (
+    BaseCommand, CommandError,
+)
+from django.apps import apps
+
+from translations.models import Translatable
+from translations.languages import _get_translation_languages, \
+    _get_supported_language
+from translations.cache import _get_warmup_config, _warm_translations
+
+
+__docformat__ = 'restructuredtext'
+
+
+class Command(BaseCommand):
+    """
+    The command which loads the translations of some models into
+    the configured caches.
+    """
+
+    help = 'Load the translations of some models into the configured caches.'
+
+    def add_arguments(self, parser):
+        """
+        Add the arguments that the `Command` accepts on an `ArgumentParser`.
+        """
+        parser.add_argument(
+            'args',
+            metavar='app_label.ModelName',
+            nargs='*',
+            help=(
+                'Specify the model(s) to warm up the translations of. '
+                'Defaults to the TRANSLATIONS_WARMUP setting.'
+            ),
+        )
+        parser.add_argument(
+            '--language',
+            action='append',
+            dest='languages',
+            help=(
+                'Specify the language(s) to warm up the translations in. '
+                'Defaults to all the translation languages.'
+            ),
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            dest='chunk_size',
+            help='Specify the number of objects to load at once.',
+        )
+
+    def get_config(self, *model_labels, languages=None):
+        """Return the models and the languages to warm up."""
+        try:
+            if languages:
+                langs = [_get_supported_language(lang) for lang in languages]
+            else:
+                langs = _get_translation_languages()
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        if not model_labels:
+            try:
+                config = _get_warmup_config()
+            except (LookupError, ValueError) as e:
+                raise CommandError(str(e))
+            if languages:
+                config = [(model, langs) for (model, default_langs) in config]
+            return config
+
+        config = []
+        for model_label in model_labels:
+            try:
+                model = apps.get_model(model_label)
+            except (LookupError, ValueError):
+                raise CommandError(
+                    "Model '{}' is not found.".format(model_label)
+                )
+            if not issubclass(model, Translatable):
+                raise CommandError(
+                    "Model '{}' is not Translatable.".format(model_label)
+                )
+            config.append((model, langs))
+        return config
+
+    def handle(self, *model_labels, **options):
+        """Run the `Command` with the configured arguments."""
+        config = self.get_config(
+            *model_labels,
+            languages=options['languages'],
+        )
+
+        for (model, langs) in config:
+            count = _warm_translations(model, langs, options['chunk_size'])
+            if options['verbosity'] >= 1:
+                self.stdout.write(
+                    'Loaded {} translations of `{}`.'.format(
+                        count, model._meta.label,
+                    )
+                )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                'Warm-up successful.'
+            )
+        )
@@ -0,0 +1,127 @@
+"""This module contains the materialized languages for the Translations app."""
+
+from django.db import models
+from django.db.models.constants import LOOKUP_SEP
+from django.contrib.contenttypes.models import ContentType
+
+import translations.models
+from translations.storages import TableStorage, _get_storage
+
+
+__docformat__ = 'restructuredtext'
+
+
+def _get_shadow_name(field, lang):
+    """Return the name of the shadow column of a field in a language."""
+    return '{}_{}'.format(field, lang.replace('-', '_'))
+
+
+def _get_materialized_mapping(mapping, lang):
+    r"""
+    Return the part of a `purview`\ 's mapping whose models materialize
+    a language.
+    """
+    materialized = {}
+    for (ct_id, objs) in mapping.items():
+        model = ContentType.objects.get_for_id(ct_id).model_class()
+        if lang in model._get_materialized_languages():
+            materialized[ct_id] = objs
+    return materialized
+
+
+def _read_materialized(mapping, lang):
+    """
+    Return the texts of the translations of a mapping in a materialized
+    language from the shadow columns of the objects.
+    """
+    texts = {}
+    for (ct_id, objs) in mapping.items():
+        for (obj_id, obj) in objs.items():
+            fields = {}
+            for field in type(obj)._get_translatable_fields_names():
+                text = getattr(obj, _get_shadow_name(field, lang))
+                if text is not None:
+                    fields[field] = text
+            if fields:
+                texts[(ct_id, obj_id)] = fields
+    return texts
+
+
+def _write_materialized(mapping, changes, lang, clear=False):
+    """
+    Write the translations of some changes of a mapping in a materialized
+    language to the shadow columns of the objects and their rows.
+
+    If `clear` is set the shadow columns of all the objects get cleared.
+    The objects which change the same shadow columns are written with
+    a bulk update.
+    """
+    texts = {}
+    for (address, text) in changes:
+        texts.setdefault(
+            (address['content_type_id'], address['object_id']), {}
+        )[address['field']] = text
+
+    for (ct_id, objs) in mapping.items():
+        groups = {}
+        for (obj_id, obj) in objs.items():
+            if clear:
+                values = {
+                    _get_shadow_name(field, lang): None
+                    for field in type(obj)._get_translatable_fields_names()
+                }
+            else:
+                values = {
+                    _get_shadow_name(field, lang): text
+                    for (field, text) in texts.get((ct_id, obj_id), {}).items()
+                }
+            if values:
+                for (name, value) in values.items():
+                    setattr(obj, name, value)
+                groups.setdefault(tuple(sorted(values)), []).append(obj)
+
+        model = ContentType.objects.get_for_id(ct_id).model_class()
+        for (names, group) in groups.items():
+            model._base_manager.bulk_update(group, list(names))
+
+
+def _set_materialized_text(ct_id, obj_id, field, lang, text):
+    r"""
+    Set the shadow column of a `Translation`\ 's address in a language if
+    the language is materialized.
+    """
+    model = ContentType.objects.get_for_id(ct_id).model_class()
+    if model is None or \
+            not issubclass(model, translations.models.Translatable) or \
+            not isinstance(_get_storage(model), TableStorage) or \
+            lang not in model._get_materialized_languages() or \
+            field not in model._get_translatable_fields_names():
+        return
+    model._base_manager.filter(pk=obj_id).update(
+        **{_get_shadow_name(field, lang): text}
+    )
+
+
+def _get_materialized_query(model, relation, field, supplement, value, lang):
+    r"""
+    Return the query which filters a relation of a model on the shadow
+    columns of a field in the materialized language(s) of the related
+    model and the rest of the language(s).
+    """
+    materialized = model._get_materialized_languages()
+    langs = lang if isinstance(lang, (list, tuple)) else [lang]
+
+    query = models.Q()
+    rest = []
+    for x in langs:
+        if x in materialized:
+            lookup = relation + [_get_shadow_name(field, x)]
+            if supplement:
+                lookup.append(supplement)
+            query |= models.Q(**{LOOKUP_SEP.join(lookup): value})
+        else:
+            rest.append(x)
+
+    if len(rest) == len(langs):
+        rest = lang
+    return query, rest
@@ -0,0 +1,29 @@
+# Generated by Django 3.1.14 on 2026-10-19 09:19
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('translations', '0002_auto_20180920_1245'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranslationVersion',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language', models.CharField(help_text='the language of the translations', max_length=32, verbose_name='language')),
+                ('version', models.PositiveIntegerField(default=0, help_text='the number of times the translations were changed', verbose_name='version')),
+                ('content_type', models.ForeignKey(help_text='the content type of the translations', on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype', verbose_name='content type')),
+            ],
+            options={
+                'verbose_name': 'translation version',
+                'verbose_name_plural': 'translation versions',
+                'unique_together': {('content_type', 'language')},
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 3.1.14 on 2026-10-19 09:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('translations', '0003_translationversion'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='translation',
+            index=models.Index(fields=['content_type', 'language', 'object_id'], name='translation_ct_lang_obj_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='translation',
+            index=models.Index(fields=['content_type', 'field', 'language'], name='translation_ct_field_lang_idx'),
+        ),
+    ]
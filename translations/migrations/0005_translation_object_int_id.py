@@ -0,0 +1,35 @@
+# Generated by Django 3.1.14 on 2026-10-19 09:30
+
+from django.db import migrations, models
+from django.db.models.functions import Cast
+
+
+def fill_object_int_ids(apps, schema_editor):
+    Translation = apps.get_model('translations', 'Translation')
+    Translation.objects.using(
+        schema_editor.connection.alias,
+    ).filter(
+        object_id__regex=r'^-?(0|[1-9][0-9]{0,17})$',
+    ).update(
+        object_int_id=Cast('object_id', models.BigIntegerField()),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('translations', '0004_translation_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='translation',
+            name='object_int_id',
+            field=models.BigIntegerField(blank=True, editable=False, help_text='the integer id of the object to translate', null=True, verbose_name='object integer id'),
+        ),
+        migrations.RunPython(fill_object_int_ids, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='translation',
+            index=models.Index(fields=['content_type', 'language', 'object_int_id'], name='translation_ct_lang_int_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 3.1.14 on 2026-10-19 09:47
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('translations', '0005_translation_object_int_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranslationText',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hash', models.CharField(help_text='the SHA-256 hash of the text', max_length=64, unique=True, verbose_name='hash')),
+                ('text', models.TextField(help_text='the shared text', verbose_name='text')),
+            ],
+            options={
+                'verbose_name': 'translation text',
+                'verbose_name_plural': 'translation texts',
+            },
+        ),
+        migrations.AddField(
+            model_name='translation',
+            name='shared_text',
+            field=models.ForeignKey(blank=True, editable=False, help_text='the shared text of the translation if it is interned', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='translations', to='translations.translationtext', verbose_name='shared text'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.1.14 on 2026-10-19 09:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('translations', '0006_translationtext'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='translation',
+            name='compressed_text',
+            field=models.BinaryField(blank=True, help_text='the compressed text of the translation if it is long', null=True, verbose_name='compressed text'),
+        ),
+    ]
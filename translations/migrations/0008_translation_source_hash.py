@@ -0,0 +1,18 @@
+# Generated by Django 3.1.14 on 2026-10-19 09:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('translations', '0007_translation_compressed_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='translation',
+            name='source_hash',
+            field=models.CharField(blank=True, editable=False, help_text='the hash of the source text the translation was made of', max_length=32, null=True, verbose_name='source hash'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 3.1.14 on 2026-10-19 09:58
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('translations', '0008_translation_source_hash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranslationRevision',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.CharField(help_text='the id of the translated object', max_length=128, verbose_name='object id')),
+                ('field', models.CharField(help_text='the translated field of the object', max_length=64, verbose_name='field')),
+                ('language', models.CharField(help_text='the language of the translation', max_length=32, verbose_name='language')),
+                ('sequence', models.PositiveIntegerField(help_text='the number of the revision of the translation', verbose_name='sequence')),
+                ('text', models.TextField(blank=True, help_text='the full text of the revision if it is a keyframe', verbose_name='text')),
+                ('delta', models.TextField(blank=True, help_text='the delta of the text from its keyframe', null=True, verbose_name='delta')),
+                ('deleted', models.BooleanField(default=False, help_text='whether the translation was deleted', verbose_name='deleted')),
+                ('created', models.DateTimeField(default=django.utils.timezone.now, help_text='the time of the revision', verbose_name='created')),
+                ('content_type', models.ForeignKey(help_text='the content type of the translated object', on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype', verbose_name='content type')),
+            ],
+            options={
+                'verbose_name': 'translation revision',
+                'verbose_name_plural': 'translation revisions',
+                'unique_together': {('content_type', 'object_id', 'language', 'field', 'sequence')},
+            },
+        ),
+    ]
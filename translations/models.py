@@ -1,18 +1,54 @@
 """This module contains the models for the Translations app."""
 
 from django.db import models
+from django.db.models.signals import class_prepared
 from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.contenttypes.fields import GenericForeignKey, \
     GenericRelation
 from django.utils.translation import ugettext_lazy as _
+from django.utils.text import format_lazy
+from django.utils import timezone
 
-from translations.querysets import TranslatableQuerySet
+from translations.querysets import TranslatableQuerySet, \
+    TranslationQuerySet
+from translations.utils import _get_object_int_id
+from translations.languages import _get_supported_language
+from translations.storages import _get_storage
+from translations.materialized import _get_shadow_name, \
+    _set_materialized_text
+from translations.compressed import _decompress_text
+from translations.cache import _invalidate_translations
+from translations.sources import _get_current_source_hash
 
 
 __docformat__ = 'restructuredtext'
 
 
+class TranslationText(models.Model):
+    """The model which represents the shared texts of the translations."""
+
+    hash = models.CharField(
+        verbose_name=_('hash'),
+        help_text=_('the SHA-256 hash of the text'),
+        max_length=64,
+        unique=True,
+    )
+    text = models.TextField(
+        verbose_name=_('text'),
+        help_text=_('the shared text'),
+    )
+
+    def __str__(self):
+        """Return the representation of the shared text."""
+        return self.text
+
+    class Meta:
+        verbose_name = _('translation text')
+        verbose_name_plural = _('translation texts')
+
+
 class Translation(models.Model):
     """The model which represents the translations."""
 
@@ -27,10 +63,21 @@ class Translation(models.Model):
         help_text=_('the id of the object to translate'),
         max_length=128,
     )
+    object_int_id = models.BigIntegerField(
+        verbose_name=_('object integer id'),
+        help_text=_('the integer id of the object to translate'),
+        blank=True,
+        null=True,
+        editable=False,
+    )
     content_object = GenericForeignKey(
         ct_field='content_type',
         fk_field='object_id',
     )
+    content_int_object = GenericForeignKey(
+        ct_field='content_type',
+        fk_field='object_int_id',
+    )
     field = models.CharField(
         verbose_name=_('field'),
         help_text=_('the field of the object to translate'),
@@ -46,20 +93,240 @@ class Translation(models.Model):
         verbose_name=_('text'),
         help_text=_('the text of the translation'),
     )
+    shared_text = models.ForeignKey(
+        verbose_name=_('shared text'),
+        help_text=_('the shared text of the translation if it is interned'),
+        to=TranslationText,
+        on_delete=models.PROTECT,
+        related_name='translations',
+        blank=True,
+        null=True,
+        editable=False,
+    )
+    compressed_text = models.BinaryField(
+        verbose_name=_('compressed text'),
+        help_text=_('the compressed text of the translation if it is long'),
+        blank=True,
+        null=True,
+        editable=False,
+    )
+    source_hash = models.CharField(
+        verbose_name=_('source hash'),
+        help_text=_('the hash of the source text the translation was made of'),
+        max_length=32,
+        blank=True,
+        null=True,
+        editable=False,
+    )
+
+    objects = TranslationQuerySet.as_manager()
 
     def __str__(self):
         """Return the representation of the translation."""
         return '{source}: {translation}'.format(
             source=getattr(self.content_object, self.field),
-            translation=self.text,
+            translation=self.get_text(),
+        )
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Return a translation loaded from the database."""
+        instance = super(Translation, cls).from_db(db, field_names, values)
+        instance._loaded_object_ids = (
+            instance.__dict__.get('object_id'),
+            instance.__dict__.get('object_int_id'),
+        )
+        instance._loaded_text = instance.__dict__.get('text')
+        return instance
+
+    def _fill_object_ids(self):
+        """Fill the object ids of the translation from the changed one."""
+        loaded_id, loaded_int_id = getattr(
+            self, '_loaded_object_ids', ('', None)
+        )
+        object_id = '' if self.object_id is None else str(self.object_id)
+        if self.object_int_id is not None and \
+                self.object_int_id != loaded_int_id and \
+                object_id == (loaded_id or ''):
+            self.object_id = str(self.object_int_id)
+        else:
+            self.object_int_id = _get_object_int_id(self.object_id)
+        self._loaded_object_ids = (self.object_id, self.object_int_id)
+
+    def _fill_source_hash(self, using=None):
+        r"""
+        Refresh the hash of the source text of the translation from
+        the object's current source field if its text was changed since it
+        was loaded.
+        """
+        if not self._state.adding and 'text' in self.__dict__ and \
+                self.text != getattr(self, '_loaded_text', self.text):
+            self.source_hash = _get_current_source_hash(
+                self.content_type_id, self.object_id, self.field, using,
+            )
+        self._loaded_text = self.__dict__.get('text')
+
+    def get_text(self):
+        """Return the text of the translation, shared, compressed or not."""
+        if self.shared_text_id is not None:
+            return self.shared_text.text
+        if self.compressed_text is not None:
+            return _decompress_text(self.compressed_text)
+        return self.text
+
+    def save(self, *args, **kwargs):
+        """Save the translation and invalidate the cached translations."""
+        self._fill_object_ids()
+        self._fill_source_hash(kwargs.get('using'))
+        if self.text:
+            # the text was changed in place, it is not interned or
+            # compressed anymore
+            self.shared_text = None
+            self.compressed_text = None
+        super(Translation, self).save(*args, **kwargs)
+        _set_materialized_text(
+            self.content_type_id, self.object_id, self.field, self.language,
+            self.get_text(),
         )
+        _invalidate_translations([self.content_type_id], self.language)
+
+    def delete(self, *args, **kwargs):
+        """Delete the translation and invalidate the cached translations."""
+        result = super(Translation, self).delete(*args, **kwargs)
+        _set_materialized_text(
+            self.content_type_id, self.object_id, self.field, self.language,
+            None,
+        )
+        _invalidate_translations([self.content_type_id], self.language)
+        return result
 
     class Meta:
         unique_together = ('content_type', 'object_id', 'field', 'language',)
+        indexes = [
+            # reads: the objects of a content type in a language
+            models.Index(
+                fields=['content_type', 'language', 'object_id'],
+                name='translation_ct_lang_obj_idx',
+            ),
+            # reads: the integer-keyed objects of a content type in
+            # a language
+            models.Index(
+                fields=['content_type', 'language', 'object_int_id'],
+                name='translation_ct_lang_int_idx',
+            ),
+            # filters: a field of a content type in a language
+            models.Index(
+                fields=['content_type', 'field', 'language'],
+                name='translation_ct_field_lang_idx',
+            ),
+        ]
         verbose_name = _('translation')
         verbose_name_plural = _('translations')
 
 
+class TranslationVersion(models.Model):
+    """The model which represents the versions of the translations."""
+
+    content_type = models.ForeignKey(
+        verbose_name=_('content type'),
+        help_text=_('the content type of the translations'),
+        to=ContentType,
+        on_delete=models.CASCADE,
+    )
+    language = models.CharField(
+        verbose_name=_('language'),
+        help_text=_('the language of the translations'),
+        max_length=32,
+    )
+    version = models.PositiveIntegerField(
+        verbose_name=_('version'),
+        help_text=_('the number of times the translations were changed'),
+        default=0,
+    )
+
+    def __str__(self):
+        """Return the representation of the translation version."""
+        return '{content_type} ({language}): {version}'.format(
+            content_type=self.content_type,
+            language=self.language,
+            version=self.version,
+        )
+
+    class Meta:
+        unique_together = ('content_type', 'language',)
+        verbose_name = _('translation version')
+        verbose_name_plural = _('translation versions')
+
+
+class TranslationRevision(models.Model):
+    """The model which represents the revisions of the translations."""
+
+    content_type = models.ForeignKey(
+        verbose_name=_('content type'),
+        help_text=_('the content type of the translated object'),
+        to=ContentType,
+        on_delete=models.CASCADE,
+    )
+    object_id = models.CharField(
+        verbose_name=_('object id'),
+        help_text=_('the id of the translated object'),
+        max_length=128,
+    )
+    field = models.CharField(
+        verbose_name=_('field'),
+        help_text=_('the translated field of the object'),
+        max_length=64,
+    )
+    language = models.CharField(
+        verbose_name=_('language'),
+        help_text=_('the language of the translation'),
+        max_length=32,
+    )
+    sequence = models.PositiveIntegerField(
+        verbose_name=_('sequence'),
+        help_text=_('the number of the revision of the translation'),
+    )
+    text = models.TextField(
+        verbose_name=_('text'),
+        help_text=_('the full text of the revision if it is a keyframe'),
+        blank=True,
+    )
+    delta = models.TextField(
+        verbose_name=_('delta'),
+        help_text=_('the delta of the text from its keyframe'),
+        blank=True,
+        null=True,
+    )
+    deleted = models.BooleanField(
+        verbose_name=_('deleted'),
+        help_text=_('whether the translation was deleted'),
+        default=False,
+    )
+    created = models.DateTimeField(
+        verbose_name=_('created'),
+        help_text=_('the time of the revision'),
+        default=timezone.now,
+    )
+
+    def __str__(self):
+        """Return the representation of the translation revision."""
+        return '{content_type} {object_id} {field} ({language}): ' \
+            '{sequence}'.format(
+                content_type=self.content_type,
+                object_id=self.object_id,
+                field=self.field,
+                language=self.language,
+                sequence=self.sequence,
+            )
+
+    class Meta:
+        unique_together = (
+            'content_type', 'object_id', 'language', 'field', 'sequence',
+        )
+        verbose_name = _('translation revision')
+        verbose_name_plural = _('translation revisions')
+
+
 class Translatable(models.Model):
     """An abstract model which provides custom translation functionalities."""
     objects = TranslatableQuerySet.as_manager()
@@ -80,6 +347,8 @@ class Translatable(models.Model):
         """
 
         fields = None
+        storage = None
+        materialized_languages = None
 
     @classmethod
     def get_translatable_fields(cls):
@@ -127,3 +396,94 @@ class Translatable(models.Model):
             choices.append(choice)
 
         return choices
+
+    @classmethod
+    def _get_materialized_languages(cls):
+        """Return the languages which the model materializes."""
+        if not hasattr(cls, '_cached_materialized_languages'):
+            cls._cached_materialized_languages = [
+                _get_supported_language(lang) for lang in getattr(
+                    cls.TranslatableMeta, 'materialized_languages', None
+                ) or []
+            ]
+        return cls._cached_materialized_languages
+
+    @classmethod
+    def _get_object_id_field_name(cls):
+        r"""
+        Return the name of the `Translation` field which refers to the model
+        instances.
+        """
+        return cls._meta.get_field('translations').object_id_field_name
+
+
+def _is_integer_keyed(model):
+    """Return whether a model has an integer primary key."""
+    return isinstance(
+        model._meta.pk,
+        (models.AutoField, models.IntegerField,)
+    )
+
+
+def _route_integer_object_ids(sender, **kwargs):
+    r"""
+    Route the translations relation of an integer-keyed `Translatable` model
+    to the integer object ids.
+    """
+    if issubclass(sender, Translatable) and _is_integer_keyed(sender) and \
+            getattr(settings, 'TRANSLATIONS_INTEGER_OBJECT_IDS', False):
+        relation = sender._meta.get_field('translations')
+        relation.object_id_field_name = 'object_int_id'
+
+
+class_prepared.connect(_route_integer_object_ids)
+
+
+def _prepare_translation_storage(sender, **kwargs):
+    r"""Prepare the translation storage of a `Translatable` model."""
+    if issubclass(sender, Translatable):
+        _get_storage(sender).prepare(sender)
+
+
+class_prepared.connect(_prepare_translation_storage)
+
+
+def _add_shadow_fields(sender, **kwargs):
+    r"""
+    Add the shadow columns of the materialized languages to a `Translatable`
+    model.
+    """
+    if not issubclass(sender, Translatable) or sender._meta.proxy:
+        return
+
+    langs = sender._get_materialized_languages()
+    if not langs:
+        return
+    if getattr(sender.TranslatableMeta, 'fields', None) is None:
+        raise ImproperlyConfigured(
+            '`{}` must list its translatable fields to materialize '
+            'languages.'.format(sender._meta.label)
+        )
+
+    for lang in langs:
+        for name in sender.TranslatableMeta.fields:
+            field = sender._meta.get_field(name)
+            _, path, args, kwargs = field.deconstruct()
+            for key in ('verbose_name', 'help_text', 'default', 'unique',
+                        'primary_key', 'db_column', 'db_index', 'blank',
+                        'null', 'editable'):
+                kwargs.pop(key, None)
+            shadow = type(field)(
+                *args,
+                verbose_name=format_lazy(
+                    '{} ({})', field.verbose_name, lang,
+                ),
+                blank=True,
+                null=True,
+                editable=False,
+                **kwargs
+            )
+            sender.add_to_class(_get_shadow_name(name, lang), shadow)
+
+
+class_prepared.connect(_add_shadow_fields)
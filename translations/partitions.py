@@ -0,0 +1,126 @@
+"""This module contains the language partitions for the Translations app."""
+
+import re
+
+
+__docformat__ = 'restructuredtext'
+
+
+_INDEX_TABLE = re.compile(r' ON (ONLY )?\S+ USING ')
+
+
+def _quote_name(name):
+    """Return a quoted PostgreSQL identifier."""
+    return '"{}"'.format(name.replace('"', '""'))
+
+
+def _quote_value(value):
+    """Return a quoted PostgreSQL string literal."""
+    return "'{}'".format(value.replace("'", "''"))
+
+
+def _get_partition_name(table, lang):
+    """Return the name of the partition of a table for a language."""
+    return '{}_{}'.format(table, lang.replace('-', '_').lower())
+
+
+def _get_default_partition_name(table):
+    """Return the name of the default partition of a table."""
+    return '{}_default'.format(table)
+
+
+def _get_partitioning_sql(table, langs, constraints, indexes, sequence=None):
+    r"""
+    Return the statements which turn a table into a table partitioned by
+    language with a partition for each of some languages and a default
+    partition for the rest.
+
+    The constraints and the indexes are the `(name, definition)` pairs of
+    the table, as returned by `pg_get_constraintdef` and `pg_get_indexdef`.
+    They get recreated on the partitioned table under the same names, so
+    the later migrations still find them. The primary key gets extended
+    with the language, since PostgreSQL requires the unique constraints of
+    a partitioned table to include its partition key.
+    """
+    old_table = '{}_unpartitioned'.format(table)
+    statements = [
+        'ALTER TABLE {} RENAME TO {}'.format(
+            _quote_name(table), _quote_name(old_table),
+        ),
+        'CREATE TABLE {} (LIKE {} INCLUDING DEFAULTS) '
+        'PARTITION BY LIST ("language")'.format(
+            _quote_name(table), _quote_name(old_table),
+        ),
+    ]
+    for lang in langs:
+        statements.append(
+            'CREATE TABLE {} PARTITION OF {} FOR VALUES IN ({})'.format(
+                _quote_name(_get_partition_name(table, lang)),
+                _quote_name(table),
+                _quote_value(lang),
+            )
+        )
+    statements += [
+        'CREATE TABLE {} PARTITION OF {} DEFAULT'.format(
+            _quote_name(_get_default_partition_name(table)),
+            _quote_name(table),
+        ),
+        'INSERT INTO {} SELECT * FROM {}'.format(
+            _quote_name(table), _quote_name(old_table),
+        ),
+    ]
+    if sequence:
+        statements.append(
+            'ALTER SEQUENCE {} OWNED BY {}."id"'.format(
+                sequence, _quote_name(table),
+            )
+        )
+    statements.append('DROP TABLE {}'.format(_quote_name(old_table)))
+
+    for (name, definition) in constraints:
+        if definition.startswith('PRIMARY KEY') and \
+                'language' not in definition:
+            definition = '{}, "language")'.format(definition[:-1])
+        statements.append(
+            'ALTER TABLE {} ADD CONSTRAINT {} {}'.format(
+                _quote_name(table), _quote_name(name), definition,
+            )
+        )
+    for (name, definition) in indexes:
+        statements.append(
+            _INDEX_TABLE.sub(
+                ' ON {} USING '.format(_quote_name(table)), definition,
+            )
+        )
+    return statements
+
+
+def _get_repartitioning_sql(table, langs):
+    r"""
+    Return the statements which add the partitions of some languages to
+    a table partitioned by language and move their rows out of the default
+    partition.
+    """
+    default = _get_default_partition_name(table)
+    statements = []
+    for lang in langs:
+        statements += [
+            'ALTER TABLE {} DETACH PARTITION {}'.format(
+                _quote_name(table), _quote_name(default),
+            ),
+            'CREATE TABLE {} PARTITION OF {} FOR VALUES IN ({})'.format(
+                _quote_name(_get_partition_name(table, lang)),
+                _quote_name(table),
+                _quote_value(lang),
+            ),
+            'INSERT INTO {} SELECT * FROM {} WHERE "language" = {}'.format(
+                _quote_name(table), _quote_name(default), _quote_value(lang),
+            ),
+            'DELETE FROM {} WHERE "language" = {}'.format(
+                _quote_name(default), _quote_value(lang),
+            ),
+            'ALTER TABLE {} ATTACH PARTITION {} DEFAULT'.format(
+                _quote_name(table), _quote_name(default),
+            ),
+        ]
+    return statements
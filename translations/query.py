@@ -3,10 +3,11 @@
 import copy
 
 from django.db.models import Q
-from django.db.models.constants import LOOKUP_SEP
 
 from translations.languages import _get_default_language, _get_probe_language
-from translations.utils import _get_dissected_lookup
+from translations.utils import _get_dissected_lookup, _get_relation_model
+from translations.storages import _get_storage
+from translations.materialized import _get_materialized_query
 
 
 __docformat__ = 'restructuredtext'
@@ -52,22 +53,28 @@ def _fetch_translations_query_getter(model, lang):
                         q |= Q(**{child[0]: child[1]})
 
                     if query_languages:
-                        relation = LOOKUP_SEP.join(
-                            dissected['relation'] + ['translations'])
-                        field_supp = (LOOKUP_SEP + dissected['supplement']) \
-                            if dissected['supplement'] else ''
-                        lang_supp = (LOOKUP_SEP + 'in') \
-                            if isinstance(query_languages, (list, tuple)) \
-                            else ''
-
-                        q |= Q(**{
-                            '{}__field'.format(relation):
+                        relation_model = _get_relation_model(
+                            model, dissected['relation']
+                        )
+                        materialized_q, query_languages = \
+                            _get_materialized_query(
+                                relation_model,
+                                dissected['relation'],
                                 dissected['field'],
-                            '{}__text{}'.format(relation, field_supp):
+                                dissected['supplement'],
                                 child[1],
-                            '{}__language{}'.format(relation, lang_supp):
-                                query_languages
-                        })
+                                query_languages,
+                            )
+                        q |= materialized_q
+
+                    if query_languages:
+                        q |= _get_storage(relation_model).get_query(
+                            dissected['relation'],
+                            dissected['field'],
+                            dissected['supplement'],
+                            child[1],
+                            query_languages,
+                        )
                 else:
                     q = Q(**{child[0]: child[1]})
             elif isinstance(child, TQ):
@@ -1,16 +1,36 @@
 """This module contains the querysets for the Translations app."""
 
-from django.db.models import query
+from django.db import connections, transaction, models, NotSupportedError
+from django.db.models import query, Q
+from django.db.models.functions import Cast, Coalesce, NullIf
+from django.contrib.contenttypes.models import ContentType
+
+import translations.models
 
 from translations.languages import _get_default_language, \
-    _get_translate_language, _get_probe_language
+    _get_supported_language, _get_translate_language, _get_probe_language
 from translations.query import _fetch_translations_query_getter
 from translations.context import Context
+from translations.sources import _get_stale_query
+from translations.storages import _get_storage, _get_storages_mappings
+from translations.materialized import _get_shadow_name
+from translations.revisions import _is_revision_log_enabled
+from translations.deletion import _Collector
+from translations.utils import _to_async, _insert_rows
+from translations.cache import _invalidate_translations
 
 
 __docformat__ = 'restructuredtext'
 
 
+def _is_sliced(query):
+    r"""
+    Return whether a slice has been taken of a query, like `is_sliced` of
+    Django 3.1.
+    """
+    return bool(query.low_mark) or query.high_mark is not None
+
+
 class TranslatableQuerySet(query.QuerySet):
     """A queryset which provides custom translation functionalities."""
 
@@ -74,6 +94,225 @@ class TranslatableQuerySet(query.QuerySet):
         clone._trans_prob = _get_probe_language(lang)
         return clone
 
+    def __aiter__(self):
+        r"""
+        Iterate the `TranslatableQuerySet` asynchronously, fetching it and
+        its translations in a thread of its own.
+        """
+        async def _iterate():
+            await _to_async(self._fetch_all, concurrent=True)()
+            for obj in self._result_cache:
+                yield obj
+
+        return _iterate()
+
+    async def aget(self, *args, **kwargs):
+        r"""
+        Return the object which matches some lookup parameters, translated,
+        asynchronously in a thread of its own.
+        """
+        return await _to_async(self.get, concurrent=True)(*args, **kwargs)
+
+    async def afirst(self):
+        r"""
+        Return the first object of the `TranslatableQuerySet`, translated,
+        asynchronously in a thread of its own.
+        """
+        return await _to_async(self.first, concurrent=True)()
+
+    def update(self, **kwargs):
+        r"""
+        Update the `TranslatableQuerySet`, setting the translatable fields
+        in the translation language with set-based statements.
+        """
+        lang = self._trans_lang
+        fields = self.model._get_translatable_fields_names()
+        texts = {
+            field: kwargs.pop(field) for field in list(kwargs)
+            if field in fields
+        }
+        if lang == _get_default_language() or not texts:
+            kwargs.update(texts)
+            return super(TranslatableQuerySet, self).update(**kwargs)
+
+        if _is_sliced(self.query):
+            raise TypeError(
+                'Cannot update a query once a slice has been taken.'
+            )
+
+        objs = self.model._base_manager.using(self.db).filter(
+            pk__in=self.values('pk'),
+        )
+        storage = _get_storage(self.model)
+        with transaction.atomic(using=self.db):
+            count = objs.count()
+            if kwargs:
+                super(TranslatableQuerySet, self).update(**kwargs)
+            for (field, text) in texts.items():
+                if not text:
+                    continue
+                # like `Context`, leave the objects whose source texts are
+                # the same as the text untranslated
+                changed = objs.exclude(**{field: text})
+                if storage.supports_update_all and \
+                        not _is_revision_log_enabled():
+                    storage.update_all(changed, field, text, lang)
+                    if lang in self.model._get_materialized_languages():
+                        changed.update(**{_get_shadow_name(field, lang): text})
+                else:
+                    self._update_by_context(changed, field, text, lang)
+        return count
+
+    def bulk_create(self, objs, batch_size=None, ignore_conflicts=False,
+                    texts=None):
+        r"""
+        Create some objects, along with their translations in some languages
+        if `texts` is set.
+
+        `texts` is a list of the dictionaries of the languages to
+        the dictionaries of the fields to the texts, one for each object.
+        The objects and then the translations get inserted in batches of
+        `batch_size` in one transaction.
+        """
+        if texts is None:
+            return super(TranslatableQuerySet, self).bulk_create(
+                objs, batch_size=batch_size, ignore_conflicts=ignore_conflicts,
+            )
+
+        objs = list(objs)
+        texts = list(texts)
+        if len(texts) != len(objs):
+            raise ValueError(
+                'The texts must be as many as the objects.'
+            )
+        if ignore_conflicts:
+            raise ValueError(
+                'Cannot create the translations of the objects while '
+                'ignoring the conflicts.'
+            )
+        fields = self.model._get_translatable_fields_names()
+        langs = []
+        for obj_texts in texts:
+            for (lang, values) in obj_texts.items():
+                if lang not in langs:
+                    _get_translate_language(lang)
+                    langs.append(lang)
+                for field in values:
+                    if field not in fields:
+                        raise ValueError(
+                            '`{}` is not a translatable field of `{}`.'.format(
+                                field, self.model.__name__,
+                            )
+                        )
+
+        with transaction.atomic(using=self.db, savepoint=False):
+            features = connections[self.db].features
+            # renamed from `can_return_ids_from_bulk_insert` in Django 3.0
+            if getattr(
+                features,
+                'can_return_rows_from_bulk_insert',
+                getattr(features, 'can_return_ids_from_bulk_insert', False),
+            ):
+                super(TranslatableQuerySet, self).bulk_create(
+                    objs, batch_size=batch_size,
+                )
+            else:
+                # only the objects with the translations need their primary
+                # keys back
+                pending = {
+                    id(obj): obj for (obj, obj_texts) in zip(objs, texts)
+                    if obj.pk is None and any(obj_texts.values())
+                }
+                super(TranslatableQuerySet, self).bulk_create(
+                    [obj for obj in objs if id(obj) not in pending],
+                    batch_size=batch_size,
+                )
+                self._insert_one_by_one(list(pending.values()))
+
+            # the translated objects have their primary keys now, so they
+            # can key the texts
+            translated = []
+            langs_texts = {lang: {} for lang in langs}
+            for (obj, obj_texts) in zip(objs, texts):
+                if any(obj_texts.values()):
+                    translated.append(obj)
+                    for (lang, values) in obj_texts.items():
+                        langs_texts[lang][obj] = values
+            if translated:
+                Context(translated).create_many(
+                    langs_texts, batch_size=batch_size,
+                )
+        return objs
+
+    def _insert_one_by_one(self, objs):
+        r"""
+        Insert some objects one by one, getting their primary keys back.
+
+        It is used on the databases which cannot return the primary keys of
+        a bulk insert, since the translations need them.
+        """
+        cls = self.model._meta.concrete_model
+        for obj in objs:
+            # the insert of `save()` without the signals, which gets
+            # the primary key back whatever the version of Django
+            obj._save_table(cls=cls, force_insert=True, using=self.db)
+            obj._state.adding = False
+            obj._state.db = self.db
+
+    def _update_by_context(self, objs, field, text, lang, chunk_size=2000):
+        r"""
+        Update the translations of a field of some objects in a language
+        to a text using a `Context` over chunks of them.
+        """
+        objs = objs.order_by('pk')
+        last_pk = None
+        while True:
+            chunk = objs if last_pk is None else objs.filter(pk__gt=last_pk)
+            chunk = list(chunk[:chunk_size])
+            if not chunk:
+                break
+            last_pk = chunk[-1].pk
+            with Context(chunk) as context:
+                for obj in chunk:
+                    setattr(obj, field, text)
+                context.update(lang)
+
+    def delete(self, signals=True):
+        r"""
+        Delete the objects of the `TranslatableQuerySet` along with their
+        translations, in set-based statements per content type.
+
+        If `signals` is not set, the objects are not fetched only to send
+        the deletion signals.
+        """
+        if self.query.combinator:
+            raise NotSupportedError(
+                'Calling QuerySet.delete() after {}() is not '
+                'supported.'.format(self.query.combinator)
+            )
+        if _is_sliced(self.query):
+            raise TypeError("Cannot use 'limit' or 'offset' with delete.")
+        if self._fields is not None:
+            raise TypeError(
+                'Cannot call delete() after .values() or .values_list()'
+            )
+
+        del_query = self._chain()
+        del_query._for_write = True
+        del_query.query.select_for_update = False
+        del_query.query.select_related = False
+        del_query.query.clear_ordering(force_empty=True)
+
+        collector = _Collector(using=del_query.db, signals=signals)
+        collector.collect(del_query)
+        deleted, rows_count = collector.delete()
+
+        self._result_cache = None
+        return deleted, rows_count
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
     def filter(self, *args, **kwargs):
         """Filter the `TranslatableQuerySet`."""
         if not (args or kwargs):
@@ -95,3 +334,188 @@ class TranslatableQuerySet(query.QuerySet):
             self._trans_prob
         )(*args, **kwargs)
         return super(TranslatableQuerySet, self).exclude(query)
+
+
+class TranslationQuerySet(query.QuerySet):
+    """A queryset which keeps the object ids of the translations in sync."""
+
+    def bulk_create(self, objs, *args, **kwargs):
+        """Create some translations filling their integer object ids."""
+        objs = list(objs)
+        for obj in objs:
+            obj._fill_object_ids()
+        return super(TranslationQuerySet, self).bulk_create(
+            objs, *args, **kwargs
+        )
+
+    def stale(self):
+        r"""
+        Return the translations whose source texts changed since they were
+        written.
+        """
+        ct_ids = self.order_by().values_list(
+            'content_type_id', flat=True,
+        ).distinct()
+        query = Q()
+        for ct_id in ct_ids:
+            query |= Q(id__in=_get_stale_query(ct_id))
+        if not query:
+            return self.none()
+        return self.filter(query)
+
+    def clone_language(self, src, dst, skip_conflicts=False):
+        r"""
+        Copy the translations in a language to another language with
+        set-based statements and return the number of the copied ones.
+
+        The translations get copied by an `INSERT ... SELECT` per content
+        type. If `skip_conflicts` is set the translations which exist in
+        the other language are left as they are, otherwise they raise
+        an `IntegrityError`. If the revision log is enabled, those of
+        the `Translatable` models get copied through a `Context` instead,
+        which logs their revisions.
+        """
+        src = _get_supported_language(src)
+        dst = _get_supported_language(dst)
+        for lang in (src, dst):
+            if lang == _get_default_language():
+                raise ValueError(
+                    '`{}` is the default language, which has no '
+                    'translations.'.format(lang)
+                )
+        if src == dst:
+            raise ValueError('Cannot clone `{}` to itself.'.format(src))
+        if _is_sliced(self.query):
+            raise TypeError(
+                'Cannot clone a query once a slice has been taken.'
+            )
+
+        cloned = self.filter(language=src).order_by()
+        if skip_conflicts:
+            # annotated, since Django 2.2 cannot filter on an `Exists`
+            cloned = cloned.annotate(
+                _conflicting=models.Exists(
+                    self.model.objects.filter(
+                        content_type_id=models.OuterRef('content_type_id'),
+                        object_id=models.OuterRef('object_id'),
+                        field=models.OuterRef('field'),
+                        language=dst,
+                    )
+                ),
+            ).filter(_conflicting=False)
+        ct_ids = sorted(
+            cloned.order_by().values_list(
+                'content_type_id', flat=True,
+            ).distinct()
+        )
+
+        fields = [
+            field for field in self.model._meta.concrete_fields
+            if not field.primary_key
+        ]
+        values = {
+            '_{}'.format(field.attname): models.Value(
+                dst, output_field=field,
+            ) if field.name == 'language' else models.F(field.attname)
+            for field in fields
+        }
+
+        revisions = _is_revision_log_enabled()
+        count = 0
+        with transaction.atomic(using=self.db):
+            for ct_id in ct_ids:
+                model = ContentType.objects.get_for_id(ct_id).model_class()
+                translatable = model is not None and \
+                    issubclass(model, translations.models.Translatable)
+                if translatable and revisions:
+                    count += self._clone_by_context(
+                        model, ct_id, cloned.filter(content_type_id=ct_id),
+                        src, dst,
+                    )
+                    continue
+                rows = cloned.filter(
+                    content_type_id=ct_id,
+                ).annotate(**values).values_list(*values)
+                count += _insert_rows(
+                    self.model,
+                    [field.attname for field in fields],
+                    rows,
+                    self.db,
+                )
+                if translatable and \
+                        dst in model._get_materialized_languages():
+                    self._fill_materialized(model, ct_id, dst)
+                _invalidate_translations([ct_id], dst)
+        return count
+
+    def _clone_by_context(self, model, ct_id, cloned, src, dst):
+        r"""
+        Copy the translations of a model in a language to another language
+        using a `Context` over their objects, which logs their revisions,
+        and return the number of the copied ones.
+
+        Like `Context`, the translations which are the same as the source
+        texts are skipped.
+        """
+        fields = {}
+        for (obj_id, field) in cloned.values_list('object_id', 'field'):
+            fields.setdefault(obj_id, set()).add(field)
+        objs = list(
+            model._base_manager.using(self.db).filter(pk__in=list(fields))
+        )
+        if not objs:
+            return 0
+
+        context = Context(objs)
+        texts = {}
+        for (storage, mapping) in _get_storages_mappings(context.mapping):
+            texts.update(storage.read_stored(mapping, src))
+        lang_texts = {}
+        for (obj_id, obj) in context.mapping[ct_id].items():
+            values = {
+                field: text
+                for (field, text) in texts.get((ct_id, obj_id), {}).items()
+                if field in fields[obj_id] and text and
+                text != obj._default_translatable_fields.get(field)
+            }
+            if values:
+                lang_texts[obj] = values
+        context.create_many({dst: lang_texts})
+        return sum(len(values) for values in lang_texts.values())
+
+    def _fill_materialized(self, model, ct_id, lang):
+        r"""
+        Fill the shadow columns of the objects of a model which have
+        translations in a materialized language from them, with an `UPDATE`.
+
+        The compressed translations are left to
+        the `materializetranslations` command.
+        """
+        object_id_field = model._get_object_id_field_name()
+        object_id = models.OuterRef('pk')
+        if object_id_field != 'object_int_id':
+            object_id = Cast(object_id, models.CharField(max_length=128))
+        rows = self.model.objects.filter(**{
+            'content_type_id': ct_id,
+            'language': lang,
+            'compressed_text__isnull': True,
+            object_id_field: object_id,
+        })
+
+        values = {}
+        for field in model._get_translatable_fields_names():
+            name = _get_shadow_name(field, lang)
+            values[name] = Coalesce(
+                models.Subquery(
+                    rows.filter(field=field).annotate(
+                        _text=Coalesce(
+                            NullIf('text', models.Value('')),
+                            'shared_text__text',
+                        ),
+                    ).values('_text')[:1]
+                ),
+                name,
+            )
+        model._base_manager.using(self.db).annotate(
+            _translated=models.Exists(rows),
+        ).filter(_translated=True).update(**values)
@@ -0,0 +1,221 @@
+"""This module contains the revision log for the Translations app."""
+
+import json
+import difflib
+
+from django.db import models
+from django.conf import settings
+from django.utils import timezone
+
+import translations.models
+
+
+__docformat__ = 'restructuredtext'
+
+
+_KEYFRAME_INTERVAL = 8
+
+
+def _is_revision_log_enabled():
+    """Return whether the revision log of the translations is enabled."""
+    return getattr(settings, 'TRANSLATIONS_REVISIONS', False)
+
+
+def _is_keyframe(sequence):
+    """Return whether the revision of a sequence number keeps a full text."""
+    return sequence % _KEYFRAME_INTERVAL == 0
+
+
+def _get_keyframe(sequence):
+    """Return the sequence number of the keyframe of a revision."""
+    return sequence - sequence % _KEYFRAME_INTERVAL
+
+
+def _get_delta(base, text):
+    r"""
+    Return the delta which turns a base text into a text as a JSON list of
+    the `[start, end]` slices of the base to copy and the strings to insert.
+    """
+    ops = []
+    matcher = difflib.SequenceMatcher(None, base, text, autojunk=False)
+    for (tag, i1, i2, j1, j2) in matcher.get_opcodes():
+        if tag == 'equal':
+            ops.append([i1, i2])
+        elif j1 < j2:
+            ops.append(text[j1:j2])
+    return json.dumps(ops, ensure_ascii=False, separators=(',', ':'))
+
+
+def _apply_delta(base, delta):
+    """Return the text which a delta turns a base text into."""
+    return ''.join(
+        op if isinstance(op, str) else base[op[0]:op[1]]
+        for op in json.loads(delta)
+    )
+
+
+def _get_addresses_query(addresses):
+    """
+    Return the query of the objects of some `(ct_id, obj_id, field)`
+    addresses.
+    """
+    objs = {}
+    for (ct_id, obj_id, field) in addresses:
+        objs.setdefault(ct_id, set()).add(obj_id)
+    query = models.Q()
+    for (ct_id, obj_ids) in objs.items():
+        query |= models.Q(content_type_id=ct_id, object_id__in=obj_ids)
+    return query
+
+
+def _get_head_revisions(addresses, lang, when=None):
+    r"""
+    Return the last revisions of some addresses in a language, optionally
+    as of a time, along with the keyframes they are based on.
+
+    The result is a dictionary of the addresses to the last revisions,
+    their keyframes and their texts. It takes two queries however long
+    the history is: one for the last sequence numbers and one for
+    the revisions and their keyframes.
+    """
+    if not addresses:
+        return {}
+    revisions = translations.models.TranslationRevision.objects.filter(
+        _get_addresses_query(addresses),
+        language=lang,
+    )
+    if when is not None:
+        revisions = revisions.filter(created__lte=when)
+
+    heads = revisions.order_by().values_list(
+        'content_type_id', 'object_id', 'field',
+    ).annotate(
+        last=models.Max('sequence'),
+    )
+    query = models.Q()
+    sequences = {}
+    addresses = set(addresses)
+    for (ct_id, obj_id, field, last) in heads:
+        if (ct_id, obj_id, field) not in addresses:
+            continue
+        sequences[(ct_id, obj_id, field)] = last
+        query |= models.Q(
+            content_type_id=ct_id,
+            object_id=obj_id,
+            field=field,
+            sequence__in={last, _get_keyframe(last)},
+        )
+    if not sequences:
+        return {}
+
+    rows = {}
+    for revision in translations.models.TranslationRevision.objects.filter(
+                query,
+                language=lang,
+            ):
+        rows[(
+            revision.content_type_id, revision.object_id, revision.field,
+            revision.sequence,
+        )] = revision
+
+    result = {}
+    for (address, last) in sequences.items():
+        head = rows[address + (last,)]
+        keyframe = rows[address + (_get_keyframe(last),)]
+        if head.deleted:
+            text = None
+        elif head.delta is None:
+            text = head.text
+        else:
+            text = _apply_delta(keyframe.text, head.delta)
+        result[address] = (head, keyframe, text)
+    return result
+
+
+def _get_revision(address, lang, sequence, text, keyframe, created):
+    r"""
+    Return the `TranslationRevision` of an address in a language with
+    the new text of it, or `None` for a deletion.
+    """
+    (ct_id, obj_id, field) = address
+    if _is_keyframe(sequence):
+        values = {'text': text or '', 'delta': None}
+    else:
+        values = {'text': '', 'delta': _get_delta(keyframe.text, text or '')}
+    return translations.models.TranslationRevision(
+        content_type_id=ct_id,
+        object_id=obj_id,
+        field=field,
+        language=lang,
+        sequence=sequence,
+        deleted=text is None,
+        created=created,
+        **values
+    )
+
+
+def _log_revisions(changes, lang):
+    """Log the revisions of some changes in a language."""
+    texts = {
+        (address['content_type_id'], address['object_id'], address['field']):
+            text
+        for (address, text) in changes
+    }
+    _write_revisions(texts, lang)
+
+
+def _log_deletions(mapping, lang):
+    r"""
+    Log the deletions of the translations of a `purview`\ 's mapping in
+    a language.
+    """
+    addresses = [
+        (ct_id, obj_id, field)
+        for (ct_id, objs) in mapping.items()
+        for (obj_id, obj) in objs.items()
+        for field in type(obj)._get_translatable_fields_names()
+    ]
+    _write_revisions({address: None for address in addresses}, lang)
+
+
+def _write_revisions(texts, lang):
+    r"""
+    Write the revisions of some addresses to their new texts in a language,
+    or to `None` for the deletions, in one bulk insert.
+
+    The deletions of the addresses which have no translation are skipped.
+    """
+    heads = _get_head_revisions(list(texts), lang)
+    created = timezone.now()
+    revisions = []
+    for (address, text) in texts.items():
+        head, keyframe, last_text = heads.get(address, (None, None, None))
+        if text is None and last_text is None:
+            continue
+        sequence = 0 if head is None else head.sequence + 1
+        revisions.append(
+            _get_revision(
+                address, lang, sequence, text, keyframe, created,
+            )
+        )
+    translations.models.TranslationRevision.objects.bulk_create(revisions)
+
+
+def _read_revisions(mapping, lang, when):
+    r"""
+    Return the texts of the translations of a `purview`\ 's mapping in
+    a language as of a time from the revision log.
+    """
+    addresses = [
+        (ct_id, obj_id, field)
+        for (ct_id, objs) in mapping.items()
+        for (obj_id, obj) in objs.items()
+        for field in type(obj)._get_translatable_fields_names()
+    ]
+    texts = {}
+    for ((ct_id, obj_id, field), (_, _, text)) in _get_head_revisions(
+                addresses, lang, when,
+            ).items():
+        if text is not None:
+            texts.setdefault((ct_id, obj_id), {})[field] = text
+    return texts
@@ -0,0 +1,123 @@
+"""This module contains the source texts for the Translations app."""
+
+import hashlib
+
+from django.db import models
+try:
+    from django.db.models.functions import MD5
+except ImportError:  # Django < 3.0
+    MD5 = None
+from django.contrib.contenttypes.models import ContentType
+
+import translations.models
+from translations.utils import _get_object_pk
+
+
+__docformat__ = 'restructuredtext'
+
+
+def _get_source_hash(text):
+    r"""
+    Return the hash of the source text of a translation, the same as
+    the database computes with `MD5`, or `None` if there is no text.
+    """
+    if text is None:
+        return None
+    return hashlib.md5(str(text).encode('utf-8')).hexdigest()
+
+
+def _get_current_source_hash(ct_id, object_id, field, using=None):
+    r"""
+    Return the hash of the current source text of a field of an object of
+    a `ContentType`, or `None` if the object or the field is not found.
+    """
+    if ct_id is None or object_id is None:
+        return None
+    model = ContentType.objects.get_for_id(ct_id).model_class()
+    if model is None or \
+            not issubclass(model, translations.models.Translatable) or \
+            field not in model._get_translatable_fields_names():
+        return None
+
+    texts = model._base_manager.using(using).filter(
+        pk=object_id,
+    ).values_list(field, flat=True)[:1]
+    for text in texts:
+        return _get_source_hash(text)
+    return None
+
+
+def _get_stale_query(ct_id):
+    r"""
+    Return the query of the ids of the stale `Translation`\ s of
+    a `ContentType`, whose source texts changed since they were written.
+
+    The hashes of the current source texts are computed by the database,
+    so each content type is checked in one set-based subquery. Where
+    the database function is not available, they are computed in Python
+    and the query is a list of the ids.
+    """
+    model = ContentType.objects.get_for_id(ct_id).model_class()
+    if model is None or \
+            not issubclass(model, translations.models.Translatable):
+        return translations.models.Translation.objects.none().values('id')
+
+    object_id_field = model._get_object_id_field_name()
+    fields = model._get_translatable_fields_names()
+    if MD5 is None:
+        return _get_stale_ids(model, ct_id, object_id_field, fields)
+
+    source_hash = models.Case(
+        *[
+            models.When(
+                field=field,
+                then=models.Subquery(
+                    model._base_manager.filter(
+                        pk=_get_object_pk(
+                            model, models.OuterRef(object_id_field),
+                        ),
+                    ).annotate(
+                        _source_hash=MD5(field),
+                    ).values('_source_hash')[:1]
+                ),
+            ) for field in fields
+        ],
+        output_field=models.CharField(),
+    )
+    return translations.models.Translation.objects.filter(
+        content_type_id=ct_id,
+        field__in=fields,
+        source_hash__isnull=False,
+    ).annotate(
+        _source_hash=source_hash,
+    ).exclude(
+        source_hash=models.F('_source_hash'),
+    ).values('id')
+
+
+def _get_stale_ids(model, ct_id, object_id_field, fields):
+    r"""
+    Return the ids of the stale `Translation`\ s of a model, comparing
+    the hashes of the current source texts computed in Python.
+    """
+    rows = list(
+        translations.models.Translation.objects.filter(
+            content_type_id=ct_id,
+            field__in=fields,
+            source_hash__isnull=False,
+        ).values_list('id', object_id_field, 'field', 'source_hash')
+    )
+    if not rows:
+        return []
+
+    sources = {
+        str(obj['pk']): obj
+        for obj in model._base_manager.filter(
+            pk__in={row[1] for row in rows},
+        ).values('pk', *fields)
+    }
+    return [
+        id for (id, object_id, field, source_hash) in rows
+        if str(object_id) in sources and
+        _get_source_hash(sources[str(object_id)][field]) != source_hash
+    ]
@@ -0,0 +1,923 @@
+"""This module contains the translation storages for the Translations app."""
+
+import sys
+
+from django.db import models, transaction, IntegrityError
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.functions import Cast
+from django.core.exceptions import ImproperlyConfigured
+from django.contrib.contenttypes.models import ContentType
+
+import translations.models
+from translations.utils import _get_translations, _get_object_ids_query, \
+    _get_object_ids_lookup, _get_object_int_id, _get_object_pk, _insert_rows
+from translations.cache import _get_texts, _get_queried_texts, \
+    _get_mapping_query, _invalidate_translations
+from translations.interned import _intern_texts
+from translations.compressed import _get_compression_methods, \
+    _get_compressed_text
+from translations.sources import _get_source_hash, MD5
+
+
+__docformat__ = 'restructuredtext'
+
+
+def _get_rows_query(relation, field, supplement, value, lang, text='text'):
+    """
+    Return the query which filters a relation of a model on its translation
+    rows of a field in some language(s).
+
+    `text` is the lookup of the texts on the rows.
+    """
+    relation = LOOKUP_SEP.join(relation)
+    field_supp = (LOOKUP_SEP + supplement) if supplement else ''
+    lang_supp = (LOOKUP_SEP + 'in') \
+        if isinstance(lang, (list, tuple)) else ''
+
+    return models.Q(**{
+        '{}__field'.format(relation): field,
+        '{}__{}{}'.format(relation, text, field_supp): value,
+        '{}__language{}'.format(relation, lang_supp): lang,
+    })
+
+
+class TranslationStorage:
+    r"""
+    The base class of the storages which keep the translations of
+    the `Translatable` models.
+
+    The storages work on the mappings of the `purview`\ s. A mapping is
+    a dictionary of the `ContentType` ids to the dictionaries of the object
+    ids to the objects. The changes are the `(address, text)` pairs of
+    the changed fields, where an address is a dictionary of
+    the `content_type_id`, the `object_id` and the `field`.
+
+    `supports_update_all` tells whether the storage implements
+    `update_all`.
+    """
+
+    supports_update_all = False
+
+    def prepare(self, model):
+        r"""
+        Prepare the storage for a `Translatable` model once it is created.
+        """
+        pass
+
+    def read(self, mapping, lang):
+        r"""
+        Return the texts of the translations of a mapping in a language as
+        a dictionary of the `(ct_id, obj_id)` pairs to the dictionaries of
+        the fields to the texts.
+        """
+        raise NotImplementedError
+
+    def read_stored(self, mapping, lang):
+        r"""
+        Return the texts of the translations of a mapping in a language as
+        they are stored in the database, bypassing the caches.
+
+        The storages which read through the caches or from the objects
+        override it.
+        """
+        return self.read(mapping, lang)
+
+    def create(self, mapping, changes, lang):
+        """
+        Create the translations of some changes of a mapping in a language.
+        """
+        raise NotImplementedError
+
+    def update(self, mapping, changes, lang):
+        """
+        Update the translations of some changes of a mapping in a language.
+        """
+        raise NotImplementedError
+
+    def create_many(self, mapping, changes):
+        r"""
+        Create the translations of the changes of a mapping in some
+        languages, given as a dictionary of the languages to the changes.
+
+        The storages which can write several languages at once override it,
+        otherwise the languages get created one by one.
+        """
+        for (lang, lang_changes) in changes.items():
+            self.create(mapping, lang_changes, lang)
+
+    def update_many(self, mapping, changes):
+        r"""
+        Update the translations of the changes of a mapping in some
+        languages, given as a dictionary of the languages to the changes.
+
+        The storages which can write several languages at once override it,
+        otherwise the languages get updated one by one.
+        """
+        for (lang, lang_changes) in changes.items():
+            self.update(mapping, lang_changes, lang)
+
+    def delete(self, mapping, lang):
+        """Delete the translations of a mapping in a language."""
+        raise NotImplementedError
+
+    def get_query(self, relation, field, supplement, value, lang):
+        """
+        Return the query which filters a relation of a model on the
+        translations of a field in some language(s).
+        """
+        raise NotImplementedError
+
+    def update_all(self, queryset, field, text, lang):
+        """
+        Set the translations of a field of the objects of a queryset in
+        a language to a text with set-based statements, without loading
+        the objects.
+        """
+        raise NotImplementedError
+
+    def copy(self, model, pks, using=None):
+        r"""
+        Copy the translations of some objects of a model in all
+        the languages to some other objects of it, given as a dictionary of
+        the primary keys of the objects to those of the others, with
+        set-based statements.
+        """
+        raise NotImplementedError
+
+
+class TableStorage(TranslationStorage):
+    r"""
+    The storage which keeps the translations as the rows of
+    the `Translation` table.
+    """
+
+    @property
+    def supports_update_all(self):
+        r"""
+        Return whether `update_all` is supported, which needs the `MD5`
+        database function of Django 3.0 to hash the source texts.
+        """
+        return MD5 is not None
+
+    def read(self, mapping, lang):
+        """Return the texts of the translations of a mapping in a language."""
+        return _get_texts(mapping, _get_mapping_query(mapping), lang)
+
+    def read_stored(self, mapping, lang):
+        r"""
+        Return the texts of the translations of a mapping in a language from
+        the table, bypassing the caches and the catalogs.
+        """
+        if not any(mapping.values()):
+            return {}
+        return _get_queried_texts(_get_mapping_query(mapping), lang)
+
+    def _get_texts_fields(self, texts):
+        r"""Return the text fields of the `Translation`\ s of some texts."""
+        return [{'text': text} for text in texts]
+
+    def _get_rows(self, mapping, changes, lang):
+        r"""
+        Return the `Translation`\ s of some changes of a mapping in
+        a language, with the hashes of their source texts.
+        """
+        return self._get_languages_rows(mapping, {lang: changes})
+
+    def _get_languages_rows(self, mapping, changes):
+        r"""
+        Return the `Translation`\ s of the changes of a mapping in some
+        languages, with the hashes of their source texts.
+        """
+        items = [
+            (lang, address, text)
+            for (lang, lang_changes) in changes.items()
+            for (address, text) in lang_changes
+        ]
+        texts_fields = self._get_texts_fields([text for (_, _, text) in items])
+        _translations = []
+        for ((lang, address, _), text_fields) in zip(items, texts_fields):
+            obj = mapping[address['content_type_id']][address['object_id']]
+            _translations.append(
+                translations.models.Translation(
+                    language=lang,
+                    source_hash=_get_source_hash(
+                        obj._default_translatable_fields.get(address['field'])
+                    ),
+                    **address,
+                    **text_fields
+                )
+            )
+        return _translations
+
+    def create(self, mapping, changes, lang):
+        """
+        Create the translations of some changes of a mapping in a language.
+        """
+        _translations = self._get_rows(mapping, changes, lang)
+        translations.models.Translation.objects.bulk_create(_translations)
+        _invalidate_translations(mapping.keys(), lang)
+
+    def update(self, mapping, changes, lang):
+        """
+        Update the translations of some changes of a mapping in a language.
+        """
+        query = models.Q()
+        for address, text in changes:
+            query |= models.Q(**address)
+        _translations = self._get_rows(mapping, changes, lang)
+        _get_translations(query, lang).delete()
+        translations.models.Translation.objects.bulk_create(_translations)
+        _invalidate_translations(mapping.keys(), lang)
+
+    def create_many(self, mapping, changes):
+        """
+        Create the translations of the changes of a mapping in some
+        languages in one bulk insert.
+        """
+        _translations = self._get_languages_rows(mapping, changes)
+        translations.models.Translation.objects.bulk_create(_translations)
+        _invalidate_translations(mapping.keys(), list(changes))
+
+    def update_many(self, mapping, changes):
+        """
+        Update the translations of the changes of a mapping in some
+        languages in one delete and one bulk insert.
+
+        The delete binds the language once per language rather than once per
+        change, which keeps a batch of `TRANSLATIONS_BATCH_SIZE` changes at
+        three parameters each.
+        """
+        query = models.Q()
+        for (lang, lang_changes) in changes.items():
+            lang_query = models.Q()
+            for address, text in lang_changes:
+                lang_query |= models.Q(**address)
+            if lang_query:
+                query |= models.Q(language=lang) & lang_query
+        _translations = self._get_languages_rows(mapping, changes)
+        if query:
+            translations.models.Translation.objects.filter(query).delete()
+        translations.models.Translation.objects.bulk_create(_translations)
+        _invalidate_translations(mapping.keys(), list(changes))
+
+    def delete(self, mapping, lang):
+        """Delete the translations of a mapping in a language."""
+        _get_translations(_get_mapping_query(mapping), lang).delete()
+        _invalidate_translations(mapping.keys(), lang)
+
+    def get_query(self, relation, field, supplement, value, lang):
+        """
+        Return the query which filters a relation of a model on the
+        translations of a field in some language(s).
+        """
+        return _get_rows_query(
+            relation + ['translations'], field, supplement, value, lang,
+        )
+
+    def update_all(self, queryset, field, text, lang):
+        r"""
+        Set the translations of a field of the objects of a queryset in
+        a language to a text with set-based statements, without loading
+        the objects.
+
+        The existing translations get updated by an `UPDATE` and the missing
+        ones get created by an `INSERT ... SELECT` over the primary keys of
+        the queryset, which together make an upsert.
+        """
+        model = queryset.model
+        translation_model = translations.models.Translation
+        ct_id = ContentType.objects.get_for_model(model).id
+        object_id_field = model._get_object_id_field_name()
+        object_ids = _get_object_ids_query(model, queryset)
+        text_fields = self._get_texts_fields([text])[0]
+
+        translation_model.objects.filter(**{
+            'content_type_id': ct_id,
+            'field': field,
+            'language': lang,
+            '{}__in'.format(object_id_field): object_ids,
+        }).update(
+            source_hash=MD5(models.Subquery(
+                model._base_manager.filter(
+                    pk=_get_object_pk(
+                        model, models.OuterRef(object_id_field),
+                    ),
+                ).values(field)[:1]
+            )),
+            **text_fields
+        )
+
+        values = {
+            'content_type_id': models.Value(
+                ct_id, output_field=models.IntegerField(),
+            ),
+            'object_id': Cast('pk', models.CharField(max_length=128)),
+            # filled for the integer-keyed models even if they are not
+            # routed to it, like the translations saved one by one
+            'object_int_id': Cast('pk', models.BigIntegerField())
+            if translations.models._is_integer_keyed(model)
+            else models.Value(None, output_field=models.BigIntegerField()),
+            'field': models.Value(field, output_field=models.CharField()),
+            'language': models.Value(lang, output_field=models.CharField()),
+            'source_hash': MD5(field),
+        }
+        for (name, value) in text_fields.items():
+            values[name] = models.Value(
+                value,
+                output_field=translation_model._meta.get_field(name),
+            )
+        rows = model._base_manager.filter(
+            pk__in=queryset.values('pk'),
+        ).exclude(
+            pk__in=translation_model.objects.filter(
+                content_type_id=ct_id,
+                field=field,
+                language=lang,
+            ).annotate(
+                _object_pk=_get_object_pk(model, models.F(object_id_field)),
+            ).values('_object_pk'),
+        ).annotate(**{
+            '_{}'.format(name): value for (name, value) in values.items()
+        }).order_by().values_list(
+            *['_{}'.format(name) for name in values]
+        )
+
+        _insert_rows(translation_model, list(values), rows, queryset.db)
+        _invalidate_translations([ct_id], lang)
+
+    def copy(self, model, pks, using=None):
+        r"""
+        Copy the translations of some objects of a model in all
+        the languages to some other objects of it with an `INSERT ...
+        SELECT` which maps their object ids in a `CASE`.
+        """
+        translation_model = translations.models.Translation
+        ct_id = ContentType.objects.get_for_model(model).id
+        lookup = _get_object_ids_lookup(model, [str(pk) for pk in pks])
+        object_id_field = model._get_object_id_field_name()
+        (object_ids,) = lookup.values()
+        new_pks = list(pks.values())
+
+        def _get_case(field, get_value):
+            # the databases type a `CASE` of nothing but nulls as a text
+            return Cast(
+                models.Case(
+                    *[
+                        models.When(
+                            **{object_id_field: object_id},
+                            then=models.Value(get_value(new_pk)),
+                        ) for (object_id, new_pk) in zip(object_ids, new_pks)
+                    ],
+                    output_field=field,
+                ),
+                field,
+            )
+
+        fields = [
+            field for field in translation_model._meta.concrete_fields
+            if not field.primary_key
+        ]
+        values = {}
+        for field in fields:
+            if field.attname == 'object_id':
+                value = _get_case(field, str)
+            elif field.attname == 'object_int_id':
+                value = _get_case(field, _get_object_int_id)
+            else:
+                value = models.F(field.attname)
+            values['_{}'.format(field.attname)] = value
+
+        rows = translation_model.objects.using(using).filter(
+            content_type_id=ct_id, **lookup
+        ).order_by().annotate(**values).values_list(*values)
+        _insert_rows(
+            translation_model,
+            [field.attname for field in fields],
+            rows,
+            using or 'default',
+        )
+        _invalidate_translations([ct_id])
+
+
+class InternedTableStorage(TableStorage):
+    r"""
+    The storage which keeps the translations as the rows of
+    the `Translation` table pointing to the deduplicated
+    `TranslationText`\ s, so a text repeated across the objects, the fields
+    and the languages is stored once.
+    """
+
+    def _get_texts_fields(self, texts):
+        r"""
+        Return the text fields of the interned `Translation`\ s of some
+        texts.
+        """
+        ids = _intern_texts(texts)
+        return [{'text': '', 'shared_text_id': ids[text]} for text in texts]
+
+    def get_query(self, relation, field, supplement, value, lang):
+        """
+        Return the query which filters a relation of a model on the
+        translations of a field in some language(s).
+        """
+        relation = relation + ['translations']
+        return _get_rows_query(
+            relation, field, supplement, value, lang,
+            text='shared_text__text',
+        ) | (
+            _get_rows_query(relation, field, supplement, value, lang) &
+            models.Q(**{
+                LOOKUP_SEP.join(relation + ['shared_text', 'isnull']): True,
+            })
+        )
+
+
+class CompressedTableStorage(TableStorage):
+    r"""
+    The storage which keeps the translations as the rows of
+    the `Translation` table with the texts of at least `threshold` bytes
+    compressed using `zlib` or `lzma`.
+
+    The compressed translations are left out of the filters, since their
+    texts cannot be matched in the database.
+    """
+
+    def __init__(self, threshold=1024, method='zlib'):
+        r"""
+        Initialize a `CompressedTableStorage` with the size of the texts to
+        compress in bytes and the compression method.
+        """
+        if method not in _get_compression_methods():
+            raise ImproperlyConfigured(
+                '`{}` is not a supported compression method.'.format(method)
+            )
+        self.threshold = threshold
+        self.method = method
+
+    def _get_texts_fields(self, texts):
+        r"""
+        Return the text fields of the compressed `Translation`\ s of some
+        texts.
+        """
+        texts_fields = []
+        for text in texts:
+            data = _get_compressed_text(text, self.threshold, self.method)
+            texts_fields.append({
+                'text': text if data is None else '',
+                'compressed_text': data,
+            })
+        return texts_fields
+
+    def get_query(self, relation, field, supplement, value, lang):
+        """
+        Return the query which filters a relation of a model on the
+        translations of a field in some language(s).
+        """
+        relation = relation + ['translations']
+        return _get_rows_query(
+            relation, field, supplement, value, lang,
+        ) & models.Q(**{
+            LOOKUP_SEP.join(relation + ['compressed_text', 'isnull']): True,
+        })
+
+
+class JSONStorage(TranslationStorage):
+    r"""
+    The storage which keeps the translations of the model instances in
+    a `JSONField` of theirs as `{lang: {field: text}}`.
+
+    The translations are read from the objects themselves, so reading them
+    needs no query.
+    """
+
+    def __init__(self, field):
+        """Initialize a `JSONStorage` with the name of a `JSONField`."""
+        self.field = field
+
+    def read(self, mapping, lang):
+        """Return the texts of the translations of a mapping in a language."""
+        texts = {}
+        for (ct_id, objs) in mapping.items():
+            for (obj_id, obj) in objs.items():
+                fields = (getattr(obj, self.field) or {}).get(lang)
+                if fields:
+                    texts[(ct_id, obj_id)] = dict(fields)
+        return texts
+
+    def read_stored(self, mapping, lang):
+        r"""
+        Return the texts of the translations of a mapping in a language from
+        the rows of the objects, rather than the objects.
+        """
+        texts = {}
+        for (ct_id, objs) in mapping.items():
+            model = ContentType.objects.get_for_id(ct_id).model_class()
+            stored = model._base_manager.filter(
+                pk__in=[obj.pk for obj in objs.values()],
+            ).values_list('pk', self.field)
+            for (pk, value) in stored:
+                fields = (value or {}).get(lang)
+                if fields:
+                    texts[(ct_id, str(pk))] = dict(fields)
+        return texts
+
+    def _write(self, mapping, lang, get_fields):
+        r"""
+        Write the translations of a mapping in a language to the objects and
+        their rows.
+
+        `get_fields` returns the new texts of an object's fields in
+        the language given its address and its stored texts, or `None` to
+        leave the object as it is.
+
+        The rows are locked from the read to the write, so the concurrent
+        writes of the other languages of an object are not lost.
+        """
+        with transaction.atomic():
+            writes = []
+            for (ct_id, objs) in mapping.items():
+                model = ContentType.objects.get_for_id(ct_id).model_class()
+                stored = dict(
+                    model._base_manager.select_for_update().filter(
+                        pk__in=[obj.pk for obj in objs.values()],
+                    ).order_by('pk').values_list('pk', self.field)
+                )
+
+                for (obj_id, obj) in objs.items():
+                    value = dict(stored.get(obj.pk) or {})
+                    fields = get_fields(
+                        ct_id, obj_id, dict(value.get(lang, {})),
+                    )
+                    if fields is None:
+                        continue
+                    if fields:
+                        value[lang] = fields
+                    else:
+                        value.pop(lang, None)
+                    writes.append((model, obj, value))
+
+            changed = {}
+            for (model, obj, value) in writes:
+                setattr(obj, self.field, value)
+                changed.setdefault(model, []).append(obj)
+            for (model, objs) in changed.items():
+                model._base_manager.bulk_update(objs, [self.field])
+
+    def _get_changed_texts(self, changes):
+        """Return the texts of some changes by their objects' addresses."""
+        texts = {}
+        for (address, text) in changes:
+            texts.setdefault(
+                (address['content_type_id'], address['object_id']), {}
+            )[address['field']] = text
+        return texts
+
+    def create(self, mapping, changes, lang):
+        """
+        Create the translations of some changes of a mapping in a language.
+        """
+        texts = self._get_changed_texts(changes)
+
+        def _get_fields(ct_id, obj_id, fields):
+            obj_texts = texts.get((ct_id, obj_id))
+            if not obj_texts:
+                return None
+            for field in obj_texts:
+                if field in fields:
+                    raise IntegrityError(
+                        'The `{}` translation of `{}` in `{}` already '
+                        'exists.'.format(field, mapping[ct_id][obj_id], lang)
+                    )
+            fields.update(obj_texts)
+            return fields
+
+        self._write(mapping, lang, _get_fields)
+
+    def update(self, mapping, changes, lang):
+        """
+        Update the translations of some changes of a mapping in a language.
+        """
+        texts = self._get_changed_texts(changes)
+
+        def _get_fields(ct_id, obj_id, fields):
+            obj_texts = texts.get((ct_id, obj_id))
+            if not obj_texts:
+                return None
+            fields.update(obj_texts)
+            return fields
+
+        self._write(mapping, lang, _get_fields)
+
+    def delete(self, mapping, lang):
+        """Delete the translations of a mapping in a language."""
+        def _get_fields(ct_id, obj_id, fields):
+            return {} if fields else None
+
+        self._write(mapping, lang, _get_fields)
+
+    def copy(self, model, pks, using=None):
+        r"""
+        Copy the translations of some objects of a model in all
+        the languages to some other objects of it with a query for
+        the translations and a bulk update.
+        """
+        manager = model._base_manager.using(using)
+        with transaction.atomic(using=manager.db):
+            values = dict(
+                manager.filter(pk__in=list(pks)).values_list('pk', self.field)
+            )
+            objs = list(
+                manager.select_for_update().filter(
+                    pk__in=list(pks.values()),
+                ).order_by('pk')
+            )
+            sources = {new_pk: old_pk for (old_pk, new_pk) in pks.items()}
+            for obj in objs:
+                setattr(obj, self.field, values.get(sources[obj.pk]) or {})
+            manager.bulk_update(objs, [self.field])
+
+    def get_query(self, relation, field, supplement, value, lang):
+        """
+        Return the query which filters a relation of a model on the
+        translations of a field in some language(s).
+        """
+        relation = LOOKUP_SEP.join(relation + [self.field])
+        field_supp = (LOOKUP_SEP + supplement) if supplement else ''
+        langs = lang if isinstance(lang, (list, tuple)) else [lang]
+
+        query = models.Q()
+        for lang in langs:
+            query |= models.Q(**{
+                '{}__{}__{}{}'.format(relation, lang, field, field_supp):
+                    value,
+            })
+        return query
+
+
+class ModelTableStorage(TranslationStorage):
+    r"""
+    The storage which keeps the translations of a model in a dedicated
+    table with a real foreign key to the model's table.
+
+    The model of the table is created along with the model as
+    `<ModelName>Translation` in the same app, so it gets its migrations
+    like any other model of the app.
+    """
+
+    supports_update_all = True
+
+    def __init__(self, related_name='translation_texts', indexes=None):
+        r"""
+        Initialize a `ModelTableStorage` with the related name of the table
+        on the model and some extra `Index`\ es of it.
+        """
+        self.related_name = related_name
+        self.indexes = indexes
+        self.models = {}
+
+    def prepare(self, model):
+        r"""
+        Create the model of the dedicated translation table of
+        a `Translatable` model.
+        """
+        if model._meta.proxy or model in self.models:
+            return
+
+        name = '{}Translation'.format(model.__name__)
+        meta = type('Meta', (), {
+            'app_label': model._meta.app_label,
+            'db_table': '{}_translation'.format(model._meta.db_table),
+            'unique_together': ('source', 'field', 'language',),
+            'indexes': [
+                # filters: a field in a language
+                models.Index(fields=['field', 'language']),
+            ] + list(self.indexes or []),
+        })
+        translation_model = type(name, (models.Model,), {
+            '__module__': model.__module__,
+            'source': models.ForeignKey(
+                to=model,
+                on_delete=models.CASCADE,
+                related_name=self.related_name,
+            ),
+            'field': models.CharField(max_length=64),
+            'language': models.CharField(max_length=32),
+            'text': models.TextField(),
+            'Meta': meta,
+        })
+        setattr(sys.modules[model.__module__], name, translation_model)
+        self.models[model] = translation_model
+
+    def get_translation_model(self, model):
+        """Return the model of the dedicated translation table of a model."""
+        return self.models[model._meta.concrete_model]
+
+    def _get_models_pks(self, mapping):
+        r"""
+        Yield the `ContentType` ids, the models of the dedicated tables and
+        the primary keys of the objects of a mapping.
+        """
+        for (ct_id, objs) in mapping.items():
+            if objs:
+                model = ContentType.objects.get_for_id(ct_id).model_class()
+                yield (
+                    ct_id,
+                    self.get_translation_model(model),
+                    [obj.pk for obj in objs.values()],
+                )
+
+    def _get_rows(self, mapping, changes, lang):
+        """Return the translation rows of some changes of a mapping."""
+        rows = []
+        for (address, text) in changes:
+            model = ContentType.objects.get_for_id(
+                address['content_type_id']
+            ).model_class()
+            obj = mapping[address['content_type_id']][address['object_id']]
+            rows.append(
+                self.get_translation_model(model)(
+                    source_id=obj.pk,
+                    field=address['field'],
+                    language=lang,
+                    text=text,
+                )
+            )
+        return rows
+
+    def _bulk_create(self, rows):
+        """Create some translation rows by their dedicated tables."""
+        tables = {}
+        for row in rows:
+            tables.setdefault(type(row), []).append(row)
+        for (translation_model, table_rows) in tables.items():
+            translation_model.objects.bulk_create(table_rows)
+
+    def read(self, mapping, lang):
+        """Return the texts of the translations of a mapping in a language."""
+        texts = {}
+        for (ct_id, translation_model, pks) in self._get_models_pks(mapping):
+            rows = translation_model.objects.filter(
+                source__in=pks,
+                language=lang,
+            ).values_list('source_id', 'field', 'text')
+            for (source_id, field, text) in rows:
+                texts.setdefault((ct_id, str(source_id)), {})[field] = text
+        return texts
+
+    def create(self, mapping, changes, lang):
+        """
+        Create the translations of some changes of a mapping in a language.
+        """
+        self._bulk_create(self._get_rows(mapping, changes, lang))
+
+    def update(self, mapping, changes, lang):
+        """
+        Update the translations of some changes of a mapping in a language.
+        """
+        rows = self._get_rows(mapping, changes, lang)
+        queries = {}
+        for row in rows:
+            queries[type(row)] = queries.get(type(row), models.Q()) | \
+                models.Q(source_id=row.source_id, field=row.field)
+        for (translation_model, query) in queries.items():
+            translation_model.objects.filter(query, language=lang).delete()
+        self._bulk_create(rows)
+
+    def create_many(self, mapping, changes):
+        """
+        Create the translations of the changes of a mapping in some
+        languages in one bulk insert per dedicated table.
+        """
+        rows = []
+        for (lang, lang_changes) in changes.items():
+            rows.extend(self._get_rows(mapping, lang_changes, lang))
+        self._bulk_create(rows)
+
+    def update_many(self, mapping, changes):
+        """
+        Update the translations of the changes of a mapping in some
+        languages in one delete and one bulk insert per dedicated table.
+        """
+        rows = []
+        for (lang, lang_changes) in changes.items():
+            rows.extend(self._get_rows(mapping, lang_changes, lang))
+        queries = {}
+        for row in rows:
+            queries[type(row)] = queries.get(type(row), models.Q()) | \
+                models.Q(
+                    source_id=row.source_id,
+                    field=row.field,
+                    language=row.language,
+                )
+        for (translation_model, query) in queries.items():
+            translation_model.objects.filter(query).delete()
+        self._bulk_create(rows)
+
+    def copy(self, model, pks, using=None):
+        r"""
+        Copy the translations of some objects of a model in all
+        the languages to some other objects of it with an `INSERT ...
+        SELECT` which maps their sources in a `CASE`.
+        """
+        translation_model = self.get_translation_model(model)
+        fields = [
+            field for field in translation_model._meta.concrete_fields
+            if not field.primary_key
+        ]
+        values = {}
+        for field in fields:
+            if field.name == 'source':
+                value = models.Case(
+                    *[
+                        models.When(source_id=old_pk, then=models.Value(pk))
+                        for (old_pk, pk) in pks.items()
+                    ],
+                    output_field=model._meta.pk,
+                )
+            else:
+                value = models.F(field.attname)
+            values['_{}'.format(field.attname)] = value
+
+        rows = translation_model.objects.using(using).filter(
+            source_id__in=list(pks),
+        ).order_by().annotate(**values).values_list(*values)
+        _insert_rows(
+            translation_model,
+            [field.attname for field in fields],
+            rows,
+            using or 'default',
+        )
+
+    def update_all(self, queryset, field, text, lang):
+        r"""
+        Set the translations of a field of the objects of a queryset in
+        a language to a text with an `UPDATE` of the existing rows and
+        an `INSERT ... SELECT` of the missing ones.
+        """
+        model = queryset.model
+        translation_model = self.get_translation_model(model)
+        pks = queryset.values('pk')
+
+        translation_model.objects.using(queryset.db).filter(
+            source__in=pks,
+            field=field,
+            language=lang,
+        ).update(text=text)
+
+        values = {
+            'source': models.F('pk'),
+            'field': models.Value(field, output_field=models.CharField()),
+            'language': models.Value(lang, output_field=models.CharField()),
+            'text': models.Value(text, output_field=models.TextField()),
+        }
+        rows = model._base_manager.using(queryset.db).filter(
+            pk__in=pks,
+        ).exclude(
+            pk__in=translation_model.objects.filter(
+                field=field,
+                language=lang,
+            ).values('source_id'),
+        ).annotate(**{
+            '_{}'.format(name): value for (name, value) in values.items()
+        }).order_by().values_list(
+            *['_{}'.format(name) for name in values]
+        )
+        _insert_rows(translation_model, list(values), rows, queryset.db)
+
+    def delete(self, mapping, lang):
+        """Delete the translations of a mapping in a language."""
+        for (ct_id, translation_model, pks) in self._get_models_pks(mapping):
+            translation_model.objects.filter(
+                source__in=pks,
+                language=lang,
+            ).delete()
+
+    def get_query(self, relation, field, supplement, value, lang):
+        """
+        Return the query which filters a relation of a model on the
+        translations of a field in some language(s).
+        """
+        return _get_rows_query(
+            relation + [self.related_name], field, supplement, value, lang,
+        )
+
+
+_table_storage = TableStorage()
+
+
+def _get_storage(model):
+    """Return the translation storage of a `Translatable` model."""
+    return getattr(model.TranslatableMeta, 'storage', None) or _table_storage
+
+
+def _get_storages_mappings(mapping):
+    r"""
+    Return the translation storages of a `purview`\ 's mapping with
+    the parts of the mapping they store.
+    """
+    storages = {}
+    for (ct_id, objs) in mapping.items():
+        model = ContentType.objects.get_for_id(ct_id).model_class()
+        storage = _get_storage(model)
+        storages.setdefault(id(storage), (storage, {}))[1][ct_id] = objs
+    return list(storages.values())
@@ -1,18 +1,31 @@
 """This module contains the utilities for the Translations app."""
 
-from django.db import models
+import re
+import functools
+
+from django.db import models, connections, transaction, \
+    close_old_connections
 from django.db.models.query import prefetch_related_objects
 from django.db.models.constants import LOOKUP_SEP
+from django.db.models.functions import Cast
 from django.core.exceptions import FieldError
 from django.contrib.contenttypes.models import ContentType
 from django.utils.functional import SimpleLazyObject
 
 import translations.models
 
+try:
+    from asgiref.sync import sync_to_async
+except ImportError:  # Django < 3.0
+    sync_to_async = None
+
 
 __docformat__ = 'restructuredtext'
 
 
+_OBJECT_INT_ID = re.compile(r'-?(0|[1-9][0-9]{0,17})')
+
+
 def _get_reverse_relation(model, relation):
     """Return the reverse of a model's relation."""
     parts = relation.split(LOOKUP_SEP)
@@ -37,6 +50,13 @@ def _get_reverse_relation(model, relation):
         return reverse_relation
 
 
+def _get_relation_model(model, relation_parts):
+    """Return the model at the end of a model's relation parts."""
+    for part in relation_parts:
+        model = model._meta.get_field(part).related_model
+    return model
+
+
 def _get_dissected_lookup(model, lookup):
     """Return the dissected info of a lookup."""
     dissected = {
@@ -139,6 +159,89 @@ def _get_entity_details(entity):
     return (iterable, model)
 
 
+def _get_object_int_id(object_id):
+    """Return the integer form of an object id or `None` if it has none."""
+    if object_id is not None:
+        object_id = str(object_id)
+        if _OBJECT_INT_ID.fullmatch(object_id):
+            return int(object_id)
+    return None
+
+
+def _get_object_ids_lookup(model, object_ids):
+    r"""
+    Return the `Translation` lookup of some object ids of a `Translatable`
+    model.
+    """
+    field_name = model._get_object_id_field_name()
+    if field_name == 'object_int_id':
+        object_ids = [int(object_id) for object_id in object_ids]
+    return {'{}__in'.format(field_name): list(object_ids)}
+
+
+def _get_object_ids_query(model, queryset):
+    r"""
+    Return the subquery of the object ids of the objects of a queryset of
+    a `Translatable` model, in the form of the `Translation` field which
+    refers to them.
+    """
+    if model._get_object_id_field_name() == 'object_int_id':
+        return queryset.values('pk')
+    return queryset.annotate(
+        _object_id=Cast('pk', models.CharField(max_length=128)),
+    ).values('_object_id')
+
+
+def _get_object_pk(model, expression):
+    r"""
+    Return an expression of the object ids of some `Translation`\ s of
+    a `Translatable` model in the type of its primary key, to compare them
+    with it.
+    """
+    if model._get_object_id_field_name() == 'object_id' and \
+            translations.models._is_integer_keyed(model):
+        # the strictly typed databases do not compare the texts with
+        # the integers
+        return Cast(expression, models.BigIntegerField())
+    return expression
+
+
+def _insert_rows(model, names, rows, using):
+    r"""
+    Insert the rows of a `values_list` queryset into the table of a model
+    as the values of some of its fields with an `INSERT ... SELECT`, and
+    return the number of the inserted rows.
+    """
+    connection = connections[using]
+    quote_name = connection.ops.quote_name
+    sql, params = rows.query.get_compiler(using).as_sql()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'INSERT INTO {} ({}) {}'.format(
+                quote_name(model._meta.db_table),
+                ', '.join(
+                    quote_name(model._meta.get_field(name).column)
+                    for name in names
+                ),
+                sql,
+            ),
+            params,
+        )
+        return cursor.rowcount
+
+
+def _get_commit_hooks(using=None):
+    r"""
+    Return the functions which run when the current transaction of
+    a database commits.
+    """
+    connection = transaction.get_connection(using)
+    # `run_on_commit` is private, its entries are `(savepoint_ids, func)`
+    # tuples up to Django 4.1 and get a third `robust` item in Django 4.2,
+    # the function stays the second item of them
+    return [entry[1] for entry in connection.run_on_commit]
+
+
 def _get_purview(entity, hierarchy):
     """Return the purview of an entity and a relations hierarchy of it."""
     mapping = {}
@@ -156,6 +259,7 @@ def _get_purview(entity, hierarchy):
             instances = mapping.setdefault(content_type_id, {})
             if not issubclass(model, translations.models.Translatable):
                 raise TypeError('`{}` is not Translatable!'.format(model))
+            object_id_field_name = model._get_object_id_field_name()
 
         def _fill_obj(obj):
             if included:
@@ -167,10 +271,13 @@ def _get_purview(entity, hierarchy):
                 object_id = str(obj.pk)
                 instances[object_id] = obj
                 nonlocal query
-                query |= models.Q(
-                    content_type__id=content_type_id,
-                    object_id=object_id,
-                )
+                query |= models.Q(**{
+                    'content_type__id': content_type_id,
+                    object_id_field_name: (
+                        obj.pk if object_id_field_name == 'object_int_id'
+                        else object_id
+                    ),
+                })
 
             if hierarchy:
                 for (relation, detail) in hierarchy.items():
@@ -213,3 +320,29 @@ def _get_translations(query, lang):
         return queryset
     else:
         return translations.models.Translation.objects.none()
+
+
+def _to_async(func, concurrent=False):
+    r"""
+    Return a coroutine function which runs a sync function in the thread of
+    the sync code, or in a thread of its own if `concurrent` is set.
+
+    The concurrent calls use the database connection of their threads, which
+    gets closed around them if it is stale, so they can run along each other
+    with `asyncio.gather` but do not see the uncommitted writes of the sync
+    code.
+    """
+    if sync_to_async is None:
+        raise RuntimeError('The async API of Translations needs asgiref.')
+    if not concurrent:
+        return sync_to_async(func, thread_sensitive=True)
+
+    @functools.wraps(func)
+    def _run(*args, **kwargs):
+        close_old_connections()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            close_old_connections()
+
+    return sync_to_async(_run, thread_sensitive=False)